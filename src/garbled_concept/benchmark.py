@@ -2,68 +2,194 @@
 """
 Benchmark: Binary vs Arithmetic Circuit Simulation
 
-Compares actual computation time for circuits of varying complexity.
+Compares actual computation time for circuits of varying complexity. Every benchmark is
+warmed up and repeated, reported with its min / median / p95 / stddev, and can be saved as
+JSON and compared against a saved baseline:
+
+  benchmark --benchmarks binary arithmetic --sizes 100 1000 --json current.json
+  benchmark --compare baseline.json --threshold 0.1
+  benchmark --sweep --sizes 100 1000 10000 --csv scaling.csv
 """
 
 ### Standard packages ###
+from argparse import ArgumentParser
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import AbstractContextManager, nullcontext
+from csv import DictWriter
+from functools import partial
+from json import dumps, loads
+from pathlib import Path
+from platform import python_version
 from secrets import randbelow
+from tempfile import TemporaryDirectory
 from time import perf_counter
-
+from tracemalloc import get_traced_memory, reset_peak, start, stop
 
 ### Local modules ###
+from garbled_concept.binary_arithmetic import default_modulus, mod_mul_circuit
+from garbled_concept.bristol import BristolEvaluator, BristolGarbler, read_bristol, wire_last_use
+from garbled_concept.codec import decode_compact_wires, encode_wires
 from garbled_concept.ec_mac import generate_h_point
+from garbled_concept.garbled_circuit import count_binary_gates_for_multiplication
+from garbled_concept.instrumentation import instrument, report
 from garbled_concept.models import (
+  MAC,
   ArgoWire,
-  BinaryWire,
+  BenchmarkComparison,
   BenchmarkResult,
   BinaryGarbledGate,
+  BinaryGarbler,
+  GarblingScheme,
   GateType,
-  MAC,
+  LabelStore,
+  ScalingResult,
 )
+from garbled_concept.models.binary_label import xor_bytes
+from garbled_concept.parallel import ParallelGarbler
 from garbled_concept.parameters import Secp256k1
+from garbled_concept.table_file import GarbledTableReader, GarbledTableWriter
 
 
-def benchmark_binary_circuit(n_gates: int = 100) -> BenchmarkResult:
-  """Benchmark binary garbled circuit operations"""
+def benchmark_binary_circuit(
+  n_gates: int = 100,
+  pool: ParallelGarbler | None = None,
+  scheme: GarblingScheme = GarblingScheme.CLASSIC,
+) -> BenchmarkResult:
+  """
+  Benchmark binary garbled circuit operations on a chain of AND gates; classic garbling is
+  sharded across the processes of `pool` when one is given
+  """
+  if pool is not None and scheme != GarblingScheme.CLASSIC:
+    raise ValueError("Parallel garbling supports the classic scheme only")
 
-  # Create gates
-  gates = []
-  wires = [BinaryWire.create() for _ in range(n_gates + 2)]
+  # Labels for the whole chain live in contiguous stores, not in per-wire objects
+  garbler = BinaryGarbler(scheme=scheme)
+  zeros, ones = garbler.label_stores(n_gates + 2)
+  delta = garbler.delta.label if garbler.delta is not None else None
+  if scheme == GarblingScheme.CLASSIC:
+    wires = [zeros.wire(i, ones=ones) for i in range(n_gates + 2)]
+    specs = [(GateType.AND, wires[i], wires[i + 1], wires[i + 2]) for i in range(n_gates)]
 
   start = perf_counter()
 
-  for i in range(n_gates):
-    gate = BinaryGarbledGate(
-      gate_type=GateType.AND,
-      in_a=wires[i],
-      in_b=wires[i + 1],
-      out=wires[i + 2] if i + 2 < len(wires) else BinaryWire.create(),
-    )
-    gates.append(gate)
+  if pool is not None:
+    gates = pool.garble_gates(specs)
+  elif scheme == GarblingScheme.CLASSIC:
+    gates = garbler.gates(specs)
+  else:
+    # Free-XOR gates derive their output wires, so the chain is garbled in order
+    gates = []
+    for i in range(n_gates):
+      gate = garbler.gate(GateType.AND, zeros.wire(i, delta), zeros.wire(i + 1, delta))
+      zeros[i + 2] = gate.out.label_0.label
+      gates.append(gate)
+  tables = [(gate.index, gate.garbled_table) for gate in gates]
 
   garble_time = perf_counter() - start
 
-  # Evaluate
+  # Evaluate on raw active labels, as an evaluator holding only the tables would
   start = perf_counter()
 
-  current_label = wires[0].get_label(1)
-  for i, gate in enumerate(gates):
-    next_label = wires[i + 1].get_label(1)
-    current_label = gate.evaluate(current_label, next_label)
+  labels = LabelStore(n_gates + 2)
+  for i in range(2):
+    labels[i] = ones[i] if delta is None else xor_bytes(zeros[i], delta)
+  for i, (index, table) in enumerate(tables):
+    labels[i + 2] = BinaryGarbledGate.evaluate_table(
+      GateType.AND, scheme, index, table, labels[i], labels[i + 1]
+    )
 
   eval_time = perf_counter() - start
   total_time = (garble_time + eval_time) * 1000
 
+  name = "Binary Garbled Gates"
+  if scheme != GarblingScheme.CLASSIC:
+    name += f" ({scheme.value.lower().replace('_', '-')})"
   return BenchmarkResult(
-    name="Binary Garbled Gates",
+    name=name,
     operations=n_gates,
     total_time_ms=total_time,
     per_op_ms=total_time / n_gates,
   )
 
 
-def benchmark_arithmetic_circuit(n_ops: int = 100) -> BenchmarkResult:
-  """Benchmark Argo-style arithmetic operations"""
+def benchmark_bristol_circuit(
+  path: str | Path, scheme: GarblingScheme = GarblingScheme.HALF_GATES
+) -> BenchmarkResult:
+  """
+  Benchmark garbling a Bristol Fashion circuit file streamed from disk into a table file,
+  then evaluating it from the memory-mapped tables
+  """
+  header, gates = read_bristol(path)
+  last_use = wire_last_use(header, read_bristol(path)[1])
+
+  with TemporaryDirectory() as directory:
+    table_path = Path(directory) / "tables.gct"
+
+    # Garble straight to disk
+    start = perf_counter()
+    garbler = BristolGarbler(header, scheme, last_use)
+    with GarbledTableWriter(table_path, scheme) as writer:
+      writer.write_all(garbler.garble(gates))
+    garble_time = perf_counter() - start
+
+    # Evaluate by replaying the memory-mapped tables
+    start = perf_counter()
+    evaluator = BristolEvaluator(header, scheme, last_use)
+    inputs = garbler.encode([randbelow(2) for _ in header.input_wires])
+    with GarbledTableReader(table_path) as reader:
+      evaluator.evaluate(read_bristol(path)[1], reader.tables(), inputs)
+    eval_time = perf_counter() - start
+  total_time = (garble_time + eval_time) * 1000
+
+  return BenchmarkResult(
+    name=f"Bristol {Path(path).stem} ({scheme.value.lower().replace('_', '-')})",
+    operations=header.n_gates,
+    total_time_ms=total_time,
+    per_op_ms=total_time / header.n_gates,
+  )
+
+
+def benchmark_binary_field_mul(
+  bits: int = 256, karatsuba: bool = True, scheme: GarblingScheme = GarblingScheme.HALF_GATES
+) -> BenchmarkResult:
+  """
+  Benchmark garbling and evaluating one generated binary circuit for a modular
+  multiplication of `bits`-bit field elements; operations are the gates of the circuit
+  """
+  modulus = default_modulus(bits)
+  header, gates = mod_mul_circuit(bits, modulus, karatsuba).to_bristol()
+  last_use = wire_last_use(header, gates)
+  a, b = randbelow(modulus), randbelow(modulus)
+
+  start = perf_counter()
+  garbler = BristolGarbler(header, scheme, last_use)
+  tables = list(garbler.garble(gates))
+  garble_time = perf_counter() - start
+
+  start = perf_counter()
+  inputs = garbler.encode([a >> i & 1 for i in range(bits)] + [b >> i & 1 for i in range(bits)])
+  labels = BristolEvaluator(header, scheme, last_use).evaluate(gates, tables, inputs)
+  eval_time = perf_counter() - start
+  total_time = (garble_time + eval_time) * 1000
+
+  if sum(bit << i for i, bit in enumerate(garbler.decode(labels))) != a * b % modulus:
+    raise ArithmeticError("Garbled field multiplication returned a wrong product")
+  return BenchmarkResult(
+    name=f"Binary {bits}-bit Field Mul ({scheme.value.lower().replace('_', '-')})",
+    operations=header.n_gates,
+    total_time_ms=total_time,
+    per_op_ms=total_time / header.n_gates,
+  )
+
+
+def benchmark_arithmetic_circuit(
+  n_ops: int = 100, pool: ParallelGarbler | None = None
+) -> BenchmarkResult:
+  """
+  Benchmark Argo-style arithmetic operations; garbling is sharded when a pool is given. The
+  wires reach the evaluator encoded, with uncompressed tags so that decoding needs no
+  square roots.
+  """
 
   H = generate_h_point()
 
@@ -74,16 +200,22 @@ def benchmark_arithmetic_circuit(n_ops: int = 100) -> BenchmarkResult:
   start = perf_counter()
 
   # Create wires (garbling)
-  wires = [ArgoWire.create(v, k, H) for v, k in zip(values, keys)]
+  if pool is not None:
+    wires = pool.create_wires(values, keys, H)
+  else:
+    wires = ArgoWire.create_many(values, keys, H)
+  payload = encode_wires(wires, compressed=False)
 
   garble_time = perf_counter() - start
 
   # Evaluate - chain of additions
   start = perf_counter()
 
-  result = wires[0]
-  for wire in wires[1:]:
+  h_point, compact = decode_compact_wires(payload)
+  result = compact[0]
+  for wire in compact[1:]:
     result = result.add(wire)
+  result.to_wire(h_point)
 
   eval_time = perf_counter() - start
   total_time = (garble_time + eval_time) * 1000
@@ -147,11 +279,12 @@ def estimate_bitvm_improvement():
   print("BitVM Use Case: Schnorr Signature Verification")
   print("=" * 70)
 
-  # Binary circuit estimate
-  # Scalar mul: ~75M gates (from our calculation)
-  # Point add: ~200K gates
+  # Binary circuit, built on the measured gate count of a generated field multiplier
+  # Scalar mul: ~384 point additions
+  # Point add: ~10 field multiplications
   # SHA256: ~30K gates
-  binary_gates = 75_000_000 + 200_000 + 30_000
+  binary = count_binary_gates_for_multiplication()
+  binary_gates = binary["total_scalar_mul_gates"] + binary["single_ec_add"] + 30_000
 
   # Arithmetic circuit estimate
   # Scalar mul: ~3840 gates
@@ -180,40 +313,300 @@ def estimate_bitvm_improvement():
   print(f"  Arithmetic: {arith_dispute_size:>10,.4f} MB")
 
 
-def main():
-  print("""
-╔══════════════════════════════════════════════════════════════════════╗
-║               Garbled Circuits Performance Benchmark                 ║
-╚══════════════════════════════════════════════════════════════════════╝
-""")
+# Benchmarks take their size and the process pool shared by every run, if any
+BENCHMARKS: dict[str, Callable[[int, ParallelGarbler | None], list[BenchmarkResult]]] = {
+  "binary": lambda size, pool: [benchmark_binary_circuit(size, pool)],
+  "half-gates": lambda size, _: [benchmark_binary_circuit(size, scheme=GarblingScheme.HALF_GATES)],
+  "arithmetic": lambda size, pool: [benchmark_arithmetic_circuit(size, pool)],
+  "ec-mac": lambda size, _: benchmark_ec_mac_operations(size),
+  # Sized by --field-bits rather than --sizes: one circuit per width of the field elements
+  "field-mul": lambda bits, _: [benchmark_binary_field_mul(bits)],
+}
 
-  # Run benchmarks
-  print("Running benchmarks (this may take a moment)...\n")
+# Garbling a 256-bit multiplier takes a while, so field-mul only runs when asked for
+DEFAULT_BENCHMARKS: tuple[str, ...] = tuple(name for name in BENCHMARKS if name != "field-mul")
 
-  n_ops = 100
 
-  print("=" * 70)
-  print("Operation Benchmarks")
-  print("=" * 70)
+def garbling_pool(workers: int) -> AbstractContextManager[ParallelGarbler | None]:
+  """A process pool for parallel garbling when workers > 1, otherwise no pool at all"""
+  return ParallelGarbler(workers) if workers > 1 else nullcontext()
 
-  binary_result = benchmark_binary_circuit(n_ops)
-  print(f"\n{binary_result}")
 
-  arith_result = benchmark_arithmetic_circuit(n_ops)
-  print(f"{arith_result}")
+def measure(
+  benchmark: Callable[[], list[BenchmarkResult]], warmup: int = 1, repetitions: int = 5
+) -> list[BenchmarkResult]:
+  """
+  Run a single-shot benchmark `warmup` times untimed, then `repetitions` times, and
+  summarise the total time of every result it reports across the timed runs
+  """
+  if repetitions < 1:
+    raise ValueError("At least one timed repetition is needed")
+  for _ in range(warmup):
+    benchmark()
+  runs = [benchmark() for _ in range(repetitions)]
+  return [
+    BenchmarkResult.from_samples(
+      first.name, first.operations, [run[i].total_time_ms for run in runs]
+    )
+    for i, first in enumerate(runs[0])
+  ]
+
+
+def run_suite(
+  names: Sequence[str],
+  sizes: Sequence[int],
+  warmup: int = 1,
+  repetitions: int = 5,
+  workers: int = 1,
+  bristol: Sequence[str | Path] = (),
+  field_bits: Sequence[int] = (256,),
+) -> list[BenchmarkResult]:
+  """
+  Measure every selected benchmark at every size (field-mul at every field width instead),
+  then every Bristol circuit file
+  """
+  results = []
+  # One pool for the whole suite, so that no timed run pays for starting processes
+  with garbling_pool(workers) as pool:
+    for name in names:
+      for size in field_bits if name == "field-mul" else sizes:
+        results += measure(partial(BENCHMARKS[name], size, pool), warmup, repetitions)
+  for path in bristol:
+    results += measure(lambda path=path: [benchmark_bristol_circuit(path)], warmup, repetitions)
+  return results
 
-  print(
-    f"\nArithmetic is {binary_result.per_op_ms / arith_result.per_op_ms:.1f}x faster per operation"
+
+SWEEP_SIZES: tuple[int, ...] = (100, 1_000, 10_000, 100_000, 1_000_000)
+
+# What each benchmark scales in, for the per-unit memory figures of a sweep
+SWEEP_UNITS: dict[str, str] = {"arithmetic": "wire", "binary": "gate", "half-gates": "gate"}
+
+
+def peak_memory(benchmark: Callable[[], object]) -> int:
+  """Peak bytes traced by tracemalloc while running a benchmark once"""
+  start()
+  try:
+    reset_peak()
+    benchmark()
+    return get_traced_memory()[1]
+  finally:
+    stop()
+
+
+def sweep(
+  names: Sequence[str], sizes: Sequence[int] = SWEEP_SIZES, workers: int = 1
+) -> Iterator[ScalingResult]:
+  """
+  Run every benchmark once per size, yielding results as they complete, after one untimed
+  warmup at the smallest size so that imports, caches and tables are not billed to the
+  first measurement. Memory is traced in a second run of the same size because tracemalloc
+  slows allocation-heavy code severalfold; worker processes are not traced.
+  """
+  with garbling_pool(workers) as pool:
+    for name in names:
+      BENCHMARKS[name](min(sizes), pool)
+      for size in sizes:
+        (result,) = BENCHMARKS[name](size, pool)
+        peak = peak_memory(partial(BENCHMARKS[name], size, pool))
+        yield ScalingResult(
+          name=result.name,
+          unit=SWEEP_UNITS[name],
+          operations=result.operations,
+          total_time_ms=result.total_time_ms,
+          ops_per_second=result.operations / result.total_time_ms * 1000,
+          peak_bytes=peak,
+          bytes_per_op=peak / result.operations,
+        )
+
+
+def save_sweep(results: Iterable[ScalingResult], path: str | Path) -> None:
+  """Write sweep results as CSV, one row per benchmark and size, flushing every row"""
+  with Path(path).open("w", newline="") as file:
+    writer = DictWriter(file, fieldnames=list(ScalingResult.model_fields))
+    writer.writeheader()
+    for result in results:
+      writer.writerow(result.model_dump())
+      file.flush()
+
+
+def save_results(results: Sequence[BenchmarkResult], path: str | Path) -> None:
+  document = {"python": python_version(), "results": [result.model_dump() for result in results]}
+  Path(path).write_text(dumps(document, indent=2))
+
+
+def load_results(path: str | Path) -> list[BenchmarkResult]:
+  document = loads(Path(path).read_text())
+  return [BenchmarkResult.model_validate(result) for result in document["results"]]
+
+
+def compare_results(
+  baseline: Sequence[BenchmarkResult], current: Sequence[BenchmarkResult], threshold: float = 0.1
+) -> list[BenchmarkComparison]:
+  """Median times of every current result that also appears in the baseline"""
+  reference = {result.key: result for result in baseline}
+  return [
+    BenchmarkComparison(
+      name=result.name,
+      operations=result.operations,
+      baseline_ms=reference[result.key].median_ms,
+      current_ms=result.median_ms,
+      threshold=threshold,
+    )
+    for result in current
+    if result.key in reference
+  ]
+
+
+def parse_arguments(argv: Sequence[str] | None = None):
+  parser = ArgumentParser(
+    prog="benchmark", description="Garbled circuits performance benchmark suite"
+  )
+  parser.add_argument("-b", "--benchmarks", choices=list(BENCHMARKS), nargs="+")
+  parser.add_argument("-n", "--sizes", nargs="+", type=int, help="100 (10² to 10⁶ with --sweep)")
+  parser.add_argument(
+    "--field-bits", default=[256], nargs="+", type=int, help="field widths for field-mul"
+  )
+  parser.add_argument("-w", "--warmup", default=1, type=int)
+  parser.add_argument("-r", "--repetitions", default=5, type=int)
+  parser.add_argument("--workers", default=1, type=int, help="processes for parallel garbling")
+  parser.add_argument("--bristol", default=[], nargs="+", help="Bristol Fashion circuit files")
+  parser.add_argument("--json", help="write the results to this file")
+  parser.add_argument("--compare", help="baseline results file to compare against")
+  parser.add_argument(
+    "--threshold", default=0.1, type=float, help="slowdown flagged as a regression (0.1 = 10%%)"
   )
-  print("(Note: This is just operation overhead; the real win is gate count reduction)")
+  parser.add_argument(
+    "--instrument", action="store_true", help="count primitive calls in one extra untimed pass"
+  )
+  parser.add_argument(
+    "--sweep", action="store_true", help="time and trace memory once per size, for scaling"
+  )
+  parser.add_argument("--csv", help="write the sweep results to this file")
+  parser.add_argument("-q", "--quiet", action="store_true", help="results only, no commentary")
+  arguments = parser.parse_args(argv)
+  if arguments.sweep:
+    arguments.benchmarks = arguments.benchmarks or list(SWEEP_UNITS)
+    arguments.sizes = arguments.sizes or list(SWEEP_SIZES)
+    unsupported = set(arguments.benchmarks) - set(SWEEP_UNITS)
+    if unsupported:
+      parser.error(f"cannot sweep {', '.join(sorted(unsupported))}")
+  else:
+    arguments.benchmarks = arguments.benchmarks or list(DEFAULT_BENCHMARKS)
+    arguments.sizes = arguments.sizes or [100]
+  return arguments
+
+
+def run_sweep(arguments) -> int:
+  print("=" * 70)
+  print(f"Scaling Sweep ({', '.join(f'{size:,}' for size in arguments.sizes)})")
+  print("=" * 70 + "\n")
+
+  def reported(results: Iterable[ScalingResult]) -> Iterator[ScalingResult]:
+    for result in results:
+      print(repr(result))
+      yield result
+
+  results = reported(sweep(arguments.benchmarks, arguments.sizes, arguments.workers))
+  if arguments.csv:
+    save_sweep(results, arguments.csv)
+    print(f"\nSweep written to {arguments.csv}")
+  else:
+    for _ in results:
+      pass
+  return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+  arguments = parse_arguments(argv)
+  if arguments.sweep:
+    return run_sweep(arguments)
+  if not arguments.quiet:
+    print("""
+╔══════════════════════════════════════════════════════════════════════╗
+║               Garbled Circuits Performance Benchmark                 ║
+╚══════════════════════════════════════════════════════════════════════╝
+""")
+    print("Running benchmarks (this may take a moment)...\n")
 
-  print("\n" + "=" * 70)
-  print("Detailed EC-MAC Benchmarks")
+  print("=" * 70)
+  print(
+    f"Operation Benchmarks ({arguments.warmup} warmup, {arguments.repetitions} timed runs each)"
+  )
   print("=" * 70)
 
-  mac_results = benchmark_ec_mac_operations(n_ops)
-  for r in mac_results:
-    print(f"\n{r}")
+  results = run_suite(
+    arguments.benchmarks,
+    arguments.sizes,
+    arguments.warmup,
+    arguments.repetitions,
+    arguments.workers,
+    arguments.bristol,
+    arguments.field_bits,
+  )
+  for result in results:
+    print(f"\n{result!r}")
+
+  if arguments.json:
+    save_results(results, arguments.json)
+    print(f"\nResults written to {arguments.json}")
+
+  if arguments.instrument:
+    # A separate pass, so that the counters do not weigh on the timed runs
+    with instrument() as counters:
+      run_suite(
+        arguments.benchmarks,
+        arguments.sizes,
+        0,
+        1,
+        arguments.workers,
+        arguments.bristol,
+        arguments.field_bits,
+      )
+    print("\n" + "=" * 70)
+    print("Primitive Calls (one pass of every benchmark)")
+    print("=" * 70 + "\n")
+    print(report(counters))
+
+  regressions = []
+  if arguments.compare:
+    print("\n" + "=" * 70)
+    print(f"Comparison against {arguments.compare} (threshold {arguments.threshold:.0%})")
+    print("=" * 70 + "\n")
+    comparisons = compare_results(load_results(arguments.compare), results, arguments.threshold)
+    for comparison in comparisons:
+      print(repr(comparison))
+    regressions = [comparison for comparison in comparisons if comparison.is_regression]
+    print(f"\n{len(regressions)} regression(s) in {len(comparisons)} compared benchmark(s)")
+
+  if arguments.quiet:
+    return int(bool(regressions))
+
+  by_key = {result.key: result for result in results}
+  for size in arguments.sizes:
+    binary_result = by_key.get(f"Binary Garbled Gates @ {size}")
+    arith_result = by_key.get(f"Arithmetic (Argo) Ops @ {size}")
+    if binary_result and arith_result:
+      print(
+        f"\nArithmetic is {binary_result.per_op_ms / arith_result.per_op_ms:.1f}x faster per"
+        f" operation at {size} ops"
+      )
+      print("(Note: This is just operation overhead; the real win is gate count reduction)")
+
+  # A field multiplication is one gate in Argo but a whole generated circuit in binary;
+  # compare against the Argo gate time of the largest circuit measured
+  field_muls = {result.name: result for result in results if "-bit Field Mul" in result.name}
+  arith_size = max(
+    (size for size in arguments.sizes if f"Arithmetic (Argo) Ops @ {size}" in by_key), default=None
+  )
+  for bits in arguments.field_bits:
+    field_mul = field_muls.get(f"Binary {bits}-bit Field Mul (half-gates)")
+    if field_mul and arith_size is not None:
+      arith_result = by_key[f"Arithmetic (Argo) Ops @ {arith_size}"]
+      print(
+        f"\nOne {bits}-bit binary field multiplication: {field_mul.operations:,} gates in"
+        f" {field_mul.total_time_ms:,.1f} ms, {field_mul.total_time_ms / arith_result.per_op_ms:,.0f}x"
+        f" the time of one Argo gate (measured at {arith_size:,} ops)"
+      )
 
   # BitVM use case
   estimate_bitvm_improvement()
@@ -234,7 +627,8 @@ This enables:
 - Complex smart contract logic via optimistic execution
 - Trustless bridges with practical security assumptions
 """)
+  return int(bool(regressions))
 
 
 if __name__ == "__main__":
-  main()
+  raise SystemExit(main())
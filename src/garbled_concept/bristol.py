@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Bristol Fashion Circuits
+
+Streaming loader for circuits in Bristol Fashion
+(https://nigelsmart.github.io/MPC-Circuits/), together with a garbler and an evaluator that
+consume the gates one at a time. Neither side ever holds the gate list: the garbler yields
+each garbled table as soon as it is produced and the evaluator consumes them in the same
+order. Wire labels live in `LabelStore` rows, sixteen contiguous bytes per wire (plus the
+1-labels on a classic garbler), and a wire's row is recycled after its last use, found by a
+first streaming pass, so the stores grow to the peak number of live wires only.
+
+  header, gates = read_bristol(path)
+  last_use = wire_last_use(header, read_bristol(path)[1])
+  garbler = BristolGarbler(header, last_use=last_use)
+  with GarbledTableWriter(table_path, garbler.scheme) as writer:
+    writer.write_all(garbler.garble(gates))
+"""
+
+### Standard packages ###
+from __future__ import annotations
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+
+### Local modules ###
+from garbled_concept.models import (
+  BinaryGarbledGate,
+  BinaryGarbler,
+  BinaryLabel,
+  BinaryWire,
+  BristolHeader,
+  GarblingScheme,
+  GateType,
+  LabelStore,
+)
+from garbled_concept.models.binary_label import xor_bytes
+
+BristolGate = tuple[tuple[int, ...], tuple[int, ...], str]
+
+GATE_TYPES: dict[str, GateType] = {"AND": GateType.AND, "OR": GateType.OR, "XOR": GateType.XOR}
+
+
+def _numbers(line: str) -> list[int]:
+  return [int(token) for token in line.split()]
+
+
+def parse_header(lines: Iterator[str]) -> BristolHeader:
+  """Read the three header lines: counts, input widths and output widths"""
+  header = [_numbers(line) for line in (next(lines), next(lines), next(lines))]
+  (n_gates, n_wires), (n_inputs, *inputs), (n_outputs, *outputs) = header
+  if len(inputs) != n_inputs or len(outputs) != n_outputs:
+    raise ValueError("Malformed Bristol Fashion header")
+  return BristolHeader(n_gates=n_gates, n_wires=n_wires, inputs=inputs, outputs=outputs)
+
+
+def parse_gates(lines: Iterable[str]) -> Iterator[BristolGate]:
+  """Yield (input wires, output wires, operation) for every gate line, skipping blanks"""
+  for line in lines:
+    tokens = line.split()
+    if not tokens:
+      continue
+    n_in, n_out = int(tokens[0]), int(tokens[1])
+    wires = [int(token) for token in tokens[2 : 2 + n_in + n_out]]
+    if len(tokens) != 3 + n_in + n_out:
+      raise ValueError(f"Malformed Bristol Fashion gate: {line.strip()}")
+    yield tuple(wires[:n_in]), tuple(wires[n_in:]), tokens[-1]
+
+
+def _stream(path: Path) -> Iterator[BristolGate]:
+  with path.open() as lines:
+    parse_header(lines)
+    yield from parse_gates(lines)
+
+
+def read_bristol(path: str | Path) -> tuple[BristolHeader, Iterator[BristolGate]]:
+  """Header of a circuit file plus a lazy iterator over its gates"""
+  path = Path(path)
+  with path.open() as lines:
+    header = parse_header(lines)
+  return header, _stream(path)
+
+
+def wire_last_use(header: BristolHeader, gates: Iterable[BristolGate]) -> array:
+  """
+  Index of the last gate reading every wire, from one streaming pass; outputs are never
+  released. Costs four bytes per wire, against sixteen per label kept without it.
+  """
+  last_use = array("i", [-1]) * header.n_wires
+  for position, (inputs, _, operation) in enumerate(gates):
+    if operation != "EQ":
+      for wire in inputs:
+        last_use[wire] = position
+  for wire in header.output_wires:
+    last_use[wire] = header.n_gates
+  return last_use
+
+
+class _LiveLabels:
+  """
+  Labels of the live wires, one `LabelStore` row each (one store per label kept per wire).
+  A wire takes a free row when it is first written and hands it back when released, and
+  the stores only grow, by doubling, when every row is taken.
+  """
+
+  def __init__(self, n_stores: int = 1) -> None:
+    self.stores = [LabelStore(0) for _ in range(n_stores)]
+    self.rows: dict[int, int] = {}
+    self.free: list[int] = []
+    self.peak = 0
+
+  def __len__(self) -> int:
+    return len(self.rows)
+
+  def get(self, wire: int, store: int = 0) -> bytes:
+    return self.stores[store][self.rows[wire]]
+
+  def put(self, wire: int, *labels: bytes) -> None:
+    row = self.rows.get(wire)
+    if row is None:
+      if not self.free:
+        size = len(self.stores[0])
+        for store in self.stores:
+          store.grow(max(size, 16))
+        self.free = list(range(len(self.stores[0]) - 1, size - 1, -1))
+      row = self.rows[wire] = self.free.pop()
+      self.peak = max(self.peak, len(self.rows))
+    for store, label in zip(self.stores, labels):
+      store[row] = label
+
+  def release(self, wires: Iterable[int], position: int, last_use: Sequence[int] | None) -> None:
+    """Free the rows of the wires whose last reader is the gate at `position`"""
+    if last_use is None:
+      return
+    for wire in wires:
+      if last_use[wire] == position and wire in self.rows:
+        self.free.append(self.rows.pop(wire))
+
+
+def _split(inputs: tuple[int, ...], outputs: tuple[int, ...], operation: str):
+  """Expand MAND into its individual AND gates"""
+  if operation == "MAND":
+    half = len(outputs)
+    return [((inputs[i], inputs[half + i]), (outputs[i],), "AND") for i in range(half)]
+  return [(inputs, outputs, operation)]
+
+
+class BristolGarbler:
+  """
+  Garbles a Bristol Fashion gate stream with a `BinaryGarbler`, yielding the table of every
+  gate that has one. INV and EQW gates are free under every scheme, as are XOR gates under
+  free-XOR; an EQ gate yields the active label of its constant.
+  """
+
+  def __init__(
+    self,
+    header: BristolHeader,
+    scheme: GarblingScheme = GarblingScheme.HALF_GATES,
+    last_use: Sequence[int] | None = None,
+  ) -> None:
+    self.header = header
+    self.garbler = BinaryGarbler(scheme=scheme)
+    self.last_use = last_use
+    self.delta = self.garbler.delta.label if self.garbler.delta is not None else None
+    self.labels = _LiveLabels(1 if self.delta is not None else 2)
+    self.input_wires = [self.garbler.wire() for _ in header.input_wires]
+    for index, wire in zip(header.input_wires, self.input_wires):
+      self._put(index, wire)
+
+  @property
+  def peak_live_wires(self) -> int:
+    return self.labels.peak
+
+  @property
+  def scheme(self) -> GarblingScheme:
+    return self.garbler.scheme
+
+  def _put(self, index: int, wire: BinaryWire) -> None:
+    if self.delta is None:
+      self.labels.put(index, wire.label_0.label, wire.label_1.label)
+    else:
+      self.labels.put(index, wire.label_0.label)
+
+  def _labels(self, index: int) -> tuple[bytes, bytes]:
+    label_0 = self.labels.get(index)
+    if self.delta is None:
+      return label_0, self.labels.get(index, 1)
+    return label_0, xor_bytes(label_0, self.delta)
+
+  def _wire(self, index: int) -> BinaryWire:
+    label_0, label_1 = self._labels(index)
+    return BinaryWire(label_0=BinaryLabel(label=label_0), label_1=BinaryLabel(label=label_1))
+
+  def encode(self, bits: Sequence[int]) -> list[bytes]:
+    """Active labels for the evaluator's input bits, in input wire order"""
+    return [wire.get_label(bit).label for wire, bit in zip(self.input_wires, bits, strict=True)]
+
+  def garble(self, gates: Iterable[BristolGate]) -> Iterator[list[bytes]]:
+    """
+    Garble gates as they stream in and yield each non-empty table (MAND yields one per
+    AND); free gates yield nothing
+    """
+    labels = self.labels
+    for position, (inputs, outputs, operation) in enumerate(gates):
+      for gate_in, (out,), gate_op in _split(inputs, outputs, operation):
+        if gate_op == "EQ":
+          wire = self.garbler.wire()
+          self._put(out, wire)
+          yield [wire.get_label(gate_in[0]).label]
+        elif gate_op in {"INV", "EQW"}:
+          label_0, label_1 = self._labels(gate_in[0])
+          if gate_op == "INV":
+            label_0, label_1 = label_1, label_0
+          labels.put(out, label_0, label_1)
+        elif gate_op not in GATE_TYPES:
+          raise ValueError(f"Unsupported Bristol Fashion gate: {gate_op}")
+        else:
+          in_a, in_b = self._wire(gate_in[0]), self._wire(gate_in[1])
+          new_out = self.garbler.wire() if self.delta is None else None
+          gate = self.garbler.gate(GATE_TYPES[gate_op], in_a, in_b, new_out)
+          self._put(out, gate.out)
+          if gate.garbled_table:
+            yield gate.garbled_table
+      labels.release(inputs, position, self.last_use)
+
+  @property
+  def output_wires(self) -> list[BinaryWire]:
+    """Output wires, available once the stream is fully garbled"""
+    return [self._wire(wire) for wire in self.header.output_wires]
+
+  def decode(self, labels: Sequence[bytes]) -> list[int]:
+    """Map the evaluator's output labels back to bits"""
+    bits = []
+    for wire, label in zip(self.output_wires, labels, strict=True):
+      if label not in {wire.label_0.label, wire.label_1.label}:
+        raise ValueError("Output label does not belong to its wire")
+      bits.append(int(label == wire.label_1.label))
+    return bits
+
+
+class BristolEvaluator:
+  """
+  Evaluates a Bristol Fashion gate stream against the matching stream of non-empty tables,
+  e.g. the records of a `GarbledTableReader`
+  """
+
+  def __init__(
+    self,
+    header: BristolHeader,
+    scheme: GarblingScheme = GarblingScheme.HALF_GATES,
+    last_use: Sequence[int] | None = None,
+  ) -> None:
+    self.header = header
+    self.scheme = scheme
+    self.last_use = last_use
+    self.peak_live_wires = 0
+
+  def evaluate(
+    self, gates: Iterable[BristolGate], tables: Iterable[Sequence[bytes]], inputs: Sequence[bytes]
+  ) -> list[bytes]:
+    """Active output labels, from the active input labels"""
+    header = self.header
+    labels = _LiveLabels()
+    for wire, label in zip(header.input_wires, inputs, strict=True):
+      labels.put(wire, label)
+    tables = iter(tables)
+    index = 0
+    for position, (wires_in, wires_out, operation) in enumerate(gates):
+      for gate_in, (out,), gate_op in _split(wires_in, wires_out, operation):
+        if gate_op == "EQ":
+          labels.put(out, bytes(next(tables)[0]))
+        elif gate_op in {"INV", "EQW"}:
+          labels.put(out, labels.get(gate_in[0]))
+        else:
+          gate_type = GATE_TYPES[gate_op]
+          label_a, label_b = labels.get(gate_in[0]), labels.get(gate_in[1])
+          if gate_type == GateType.XOR and self.scheme != GarblingScheme.CLASSIC:
+            labels.put(out, xor_bytes(label_a, label_b))
+          else:
+            labels.put(
+              out,
+              BinaryGarbledGate.evaluate_table(
+                gate_type, self.scheme, index, next(tables), label_a, label_b
+              ),
+            )
+          index += 1
+      labels.release(wires_in, position, self.last_use)
+    self.peak_live_wires = labels.peak
+    return [labels.get(wire) for wire in header.output_wires]
+
+
+__all__: tuple[str, ...] = (
+  "GATE_TYPES",
+  "BristolEvaluator",
+  "BristolGarbler",
+  "BristolGate",
+  "parse_gates",
+  "parse_header",
+  "read_bristol",
+  "wire_last_use",
+)
@@ -9,13 +9,21 @@ Demonstrates:
 """
 
 ### Standard packages ###
+from argparse import ArgumentParser
+from collections.abc import Sequence
+from contextlib import nullcontext
 from secrets import randbelow
 from time import perf_counter
 
 ### Local modules ###
 from garbled_concept.ec_mac import generate_h_point, demo_homomorphic_mac
-from garbled_concept.garbled_circuit import compare_circuits, demo_binary_garbled_gate
-from garbled_concept.models import ArgoWire, MAC
+from garbled_concept.garbled_circuit import (
+  compare_circuits,
+  count_binary_gates_for_multiplication,
+  demo_binary_garbled_gate,
+)
+from garbled_concept.instrumentation import instrument, report
+from garbled_concept.models import MAC, ArgoCircuit, ArgoWire, KeyMap
 from garbled_concept.parameters import Secp256k1
 
 
@@ -51,29 +59,31 @@ def demo_arithmetic_circuit():
   print(f"Inputs: x = {x}, y = {y}")
   print(f"Expected output: 3*{x} + 2*{y} = {3 * x + 2 * y}")
 
+  # Circuit description shared by garbler and evaluator
+  circuit = ArgoCircuit()
+  in_x, in_y = circuit.input(), circuit.input()
+  out_3x = circuit.mul_const(in_x, 3)
+  out_2y = circuit.mul_const(in_y, 2)
+  circuit.output(circuit.add(out_3x, out_2y))
+
   # Garbler creates input wires with MACs
   wire_x = ArgoWire.create(x, key_x, H)
   wire_y = ArgoWire.create(y, key_y, H)
 
   print("\n--- Evaluator Computes ---")
 
-  # Evaluator: compute 3x
-  wire_3x = wire_x.mul_const(3)
+  wire_3x, wire_2y, wire_result = circuit.evaluate(
+    [wire_x, wire_y], wires=[out_3x, out_2y, *circuit.outputs]
+  )
   print(f"3x = {wire_3x.value}")
-
-  # Evaluator: compute 2y
-  wire_2y = wire_y.mul_const(2)
   print(f"2y = {wire_2y.value}")
-
-  # Evaluator: compute 3x + 2y
-  wire_result = wire_3x.add(wire_2y)
   print(f"3x + 2y = {wire_result.value}")
 
   # Garbler verifies the result MAC
   print("\n--- Garbler Verification ---")
 
-  # The output key is: 3*key_x + 2*key_y (follows from homomorphism)
-  output_key = (3 * key_x + 2 * key_y) % Secp256k1.N
+  # The output key is: 3*key_x + 2*key_y (follows from homomorphism), compiled from the circuit
+  (output_key,) = KeyMap.compile(circuit).apply([key_x, key_y])
 
   valid = wire_result.verify(output_key)
   print(f"MAC verification: {'✓ Valid' if valid else '✗ Invalid'}")
@@ -133,14 +143,19 @@ def demo_inner_product():
   wires_products = [ArgoWire.create(p, k, H) for p, k in zip(products, keys_products)]
 
   # Evaluator sums the products (this part IS homomorphic)
-  result_wire = wires_products[0]
-  for wire in wires_products[1:]:
-    result_wire = result_wire.add(wire)
+  circuit = ArgoCircuit()
+  inputs = [circuit.input() for _ in products]
+  total = inputs[0]
+  for wire in inputs[1:]:
+    total = circuit.add(total, wire)
+  circuit.output(total)
+
+  (result_wire,) = circuit.evaluate(wires_products, lazy=True)
 
   print(f"\nComputed inner product: {result_wire.value}")
 
   # Verify
-  output_key = sum(keys_products) % Secp256k1.N
+  (output_key,) = KeyMap.compile(circuit).apply(keys_products)
   valid = result_wire.verify(output_key)
   print(f"MAC verification: {'✓ Valid' if valid else '✗ Invalid'}")
 
@@ -185,7 +200,25 @@ def benchmark_operations():
   print(f"Scalar multiply: {mul_time / n_ops * 1000:.2f} ms per multiplication")
 
 
-def main():
+def main(argv: Sequence[str] | None = None) -> int:
+  parser = ArgumentParser(prog="demonstrate", description="Argo-style garbled circuits demo")
+  parser.add_argument(
+    "--instrument", action="store_true", help="report the primitive calls made by the demos"
+  )
+  arguments = parser.parse_args(argv)
+
+  with instrument() if arguments.instrument else nullcontext() as counters:
+    all_passed = run_demos()
+
+  if counters is not None:
+    print("\n" + "=" * 70)
+    print("Primitive Calls")
+    print("=" * 70 + "\n")
+    print(report(counters))
+  return int(not all_passed)
+
+
+def run_demos() -> bool:
   print("""
 ╔══════════════════════════════════════════════════════════════════════╗
 ║           Argo: Arithmetic Garbled Circuits POC                      ║
@@ -196,7 +229,8 @@ def main():
 """)
 
   # 1. Compare binary vs arithmetic circuits
-  improvement = compare_circuits()
+  compare_circuits()
+  binary_millions = count_binary_gates_for_multiplication()["total_millions"]
 
   # 2. Demo the homomorphic MAC
   mac_ok = demo_homomorphic_mac()
@@ -220,7 +254,7 @@ def main():
   print(f"""
   Key Takeaways:
 
-  1. Traditional binary garbled circuits need ~{improvement / 1000:.0f} million gates
+  1. Traditional binary garbled circuits need ~{binary_millions:,.0f} million gates
      for a single EC scalar multiplication.
 
   2. Argo's arithmetic circuits need only ~3,840 gates for the same operation.
@@ -235,7 +269,8 @@ def main():
 
   All demos passed: {mac_ok and arith_ok and inner_ok}
   """)
+  return mac_ok and arith_ok and inner_ok
 
 
 if __name__ == "__main__":
-  main()
+  raise SystemExit(main())
@@ -10,36 +10,27 @@ This enables arithmetic circuits over EC points rather than binary circuits.
 """
 
 ### Standard packages ###
-from hashlib import sha256
 from secrets import randbelow
 
 ### Local modules ###
-from garbled_concept.models import MAC, Point
+from garbled_concept.fixed_base import register_fixed_base
+from garbled_concept.generators import generator
+from garbled_concept.models import MAC, Point, VectorMAC
 from garbled_concept.parameters import Secp256k1
 
+H_DOMAIN: bytes = b"argo-h-generator"
+
 
 def generate_h_point() -> Point:
   """
-  Generate a secondary generator H such that no one knows log_G(H).
-  In practice, this is done via hash-to-curve.
-  Here we use a simplified version.
+  Generate a secondary generator H such that no one knows log_G(H), by hashing a fixed
+  "nothing up my sleeve" domain to the curve (RFC 9380); derived once and cached.
   """
-  # Hash a known string to get a deterministic "nothing up my sleeve" point
-  h = sha256(b"argo-h-generator").digest()
-  x = int.from_bytes(h, "big") % Secp256k1.P
-
-  # Find a valid y for this x (simplified - in practice use proper hash-to-curve)
-  # y^2 = x^3 + 7 (mod p)
-  y_squared = (pow(x, 3, Secp256k1.P) + 7) % Secp256k1.P
-  y = pow(y_squared, (Secp256k1.P + 1) // 4, Secp256k1.P)  # Tonelli-Shanks for p ≡ 3 (mod 4)
-
-  if pow(y, 2, Secp256k1.P) != y_squared:
-    # Try x+1 if first attempt fails
-    x = (x + 1) % Secp256k1.P
-    y_squared = (pow(x, 3, Secp256k1.P) + 7) % Secp256k1.P
-    y = pow(y_squared, (Secp256k1.P + 1) // 4, Secp256k1.P)
+  h = generator(0, H_DOMAIN)
 
-  return Point(x=x, y=y)
+  # H is the second base of every MAC, so precompute its fixed-base table once
+  register_fixed_base(h)
+  return Point.from_affine(h)
 
 
 def demo_homomorphic_mac():
@@ -86,7 +77,17 @@ def demo_homomorphic_mac():
   print(f"MAC({c}*k1, {c}*v1) = {expected_scaled.tag}")
   print(f"Match: {mac_scaled.tag == expected_scaled.tag}")
 
-  return mac_sum.tag == expected_sum.tag and mac_scaled.tag == expected_scaled.tag
+  # Vector MAC: one tag over a whole vector, homomorphic over whole vectors
+  w1, w2 = [3, 1, 4, 1, 5], [9, 2, 6, 5, 3]
+  vmac_sum = VectorMAC.create(k1, w1).add(VectorMAC.create(k2, w2))
+  expected_vector = [(a + b) % Secp256k1.N for a, b in zip(w1, w2)]
+  vector_ok = vmac_sum.verify((k1 + k2) % Secp256k1.N, expected_vector)
+
+  print("\n--- Vector MAC ---")
+  print(f"VMAC(k1, {w1}) + VMAC(k2, {w2}) = {vmac_sum.tag}")
+  print(f"Verifies as VMAC(k1+k2, {expected_vector}): {vector_ok}")
+
+  return mac_sum.tag == expected_sum.tag and mac_scaled.tag == expected_scaled.tag and vector_ok
 
 
 if __name__ == "__main__":
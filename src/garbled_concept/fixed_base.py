@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Fixed-Base Precomputation
+
+MAC creation multiplies the same two bases over and over: the curve generator G and the
+secondary generator H. For such bases we precompute, for every w-bit window position i,
+the multiples d · 2^(w·i) · B for d in [1, 2^w). A scalar multiplication then reduces to
+one table lookup and one mixed addition per window, with no doublings at all.
+"""
+
+### Local modules ###
+from garbled_concept.jacobian import (
+  INFINITY,
+  AffinePoint,
+  JacobianPoint,
+  batch_to_affine,
+  jacobian_add,
+  jacobian_add_affine,
+  jacobian_mul,
+  to_jacobian,
+)
+from garbled_concept.parameters import Secp256k1, Tuning
+
+
+class FixedBaseTable:
+  """Windowed precomputation table for a single fixed base point"""
+
+  __slots__ = ("base", "rows", "window")
+
+  def __init__(self, base: AffinePoint, window: int) -> None:
+    self.base = base
+    self.window = window
+    self.rows = self._precompute()
+
+  def _precompute(self) -> list[list[AffinePoint]]:
+    """Build rows[i][d - 1] = d · 2^(w·i) · base, normalised with one batch inversion"""
+    n_rows = -(-Secp256k1.N.bit_length() // self.window)
+    n_entries = (1 << self.window) - 1
+    flat: list[JacobianPoint] = []
+    row_base = to_jacobian(*self.base)
+    for _ in range(n_rows):
+      acc = row_base
+      flat.append(acc)
+      for _ in range(n_entries - 1):
+        acc = jacobian_add(acc, row_base)
+        flat.append(acc)
+      row_base = jacobian_add(acc, row_base)  # 2^w · row_base
+    affine = batch_to_affine(flat)
+    return [affine[i : i + n_entries] for i in range(0, len(affine), n_entries)]
+
+  def mul(self, k: int) -> JacobianPoint:
+    """Multiply the base by k using one mixed addition per non-zero window"""
+    k = k % Secp256k1.N
+    mask = (1 << self.window) - 1
+    result = INFINITY
+    for row in self.rows:
+      if not k:
+        break
+      digit = k & mask
+      if digit:
+        result = jacobian_add_affine(result, row[digit - 1])
+      k >>= self.window
+    return result
+
+
+_TABLES: dict[AffinePoint, FixedBaseTable] = {}
+
+
+def register_fixed_base(base: AffinePoint, window: int | None = None) -> FixedBaseTable:
+  """
+  Precompute (or fetch) the table for a base point. Re-registering with a different
+  window rebuilds the table; omitting the window uses `Tuning.FIXED_BASE_WINDOW`.
+  """
+  window = window or Tuning.FIXED_BASE_WINDOW
+  table = _TABLES.get(base)
+  if table is None or table.window != window:
+    table = _TABLES[base] = FixedBaseTable(base, window)
+  return table
+
+
+def fixed_base_table(base: AffinePoint) -> FixedBaseTable | None:
+  """Return the table for a base, building the generator's table on first use"""
+  table = _TABLES.get(base)
+  if table is None and base == (Secp256k1.G_X, Secp256k1.G_Y):
+    table = register_fixed_base(base)
+  return table
+
+
+def fixed_base_mul(k: int, base: AffinePoint) -> JacobianPoint:
+  """Multiply by a table when one is registered, falling back to double-and-add"""
+  table = fixed_base_table(base)
+  if table is None:
+    return jacobian_mul(k, base)
+  return table.mul(k)
+
+
+def clear_fixed_base_tables() -> None:
+  """Drop every precomputed table, releasing their memory"""
+  _TABLES.clear()
+
+
+__all__: tuple[str, ...] = (
+  "FixedBaseTable",
+  "clear_fixed_base_tables",
+  "fixed_base_mul",
+  "fixed_base_table",
+  "register_fixed_base",
+)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Generator Registry
+
+Independent secondary generators H₀, H₁, … for (vector) MACs, each hashed to the curve
+under its own domain-separated message, so that nobody knows a discrete logarithm between
+any two of them or with respect to G. Derived generators are cached per (domain, index).
+"""
+
+### Local modules ###
+from garbled_concept.hash_to_curve import hash_to_curve
+from garbled_concept.jacobian import AffinePoint
+
+DST: bytes = b"garbled-concept-V01-CS02-with-secp256k1_XMD:SHA-256_SSWU_RO_"
+DEFAULT_DOMAIN: bytes = b"argo-vector-mac"
+
+_GENERATORS: dict[tuple[bytes, int], AffinePoint] = {}
+
+
+def generator(index: int, domain: bytes = DEFAULT_DOMAIN) -> AffinePoint:
+  """The index-th generator of a domain"""
+  if index < 0:
+    raise ValueError(f"Generator index must be non-negative: {index}")
+  key = (domain, index)
+  point = _GENERATORS.get(key)
+  if point is None:
+    message = len(domain).to_bytes(2, "big") + domain + index.to_bytes(4, "big")
+    point = _GENERATORS[key] = hash_to_curve(message, DST)
+  return point
+
+
+def generators(n: int, domain: bytes = DEFAULT_DOMAIN) -> list[AffinePoint]:
+  """The first n generators of a domain"""
+  return [generator(index, domain) for index in range(n)]
+
+
+def clear_generators() -> None:
+  """Drop every cached generator"""
+  _GENERATORS.clear()
+
+
+__all__: tuple[str, ...] = (
+  "DEFAULT_DOMAIN",
+  "DST",
+  "clear_generators",
+  "generator",
+  "generators",
+)
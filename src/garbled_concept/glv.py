@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+GLV Endomorphism for secp256k1
+
+secp256k1 has an efficiently computable endomorphism φ(x, y) = (β·x, y) acting as
+multiplication by λ on the group. Splitting a scalar as k ≡ k1 + k2·λ (mod n) with
+|k1|, |k2| ≈ √n turns one 256-bit multiplication into a 128-bit double-scalar one,
+halving the number of doublings; `wnaf_mul` interleaves both halves. Other curves
+configured through `EllipticCurve` have no known endomorphism and multiply by the full
+scalar instead.
+"""
+
+### Local modules ###
+from garbled_concept.jacobian import AffinePoint
+from garbled_concept.parameters import Secp256k1
+
+SECP256K1_P: int = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+SECP256K1_N: int = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+BETA: int = 0x7AE96A2B657C07106E64479EAC3434E99CF0497512F58995C1396C28719501EE
+LAMBDA: int = 0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72
+
+# Short lattice basis {(a1, b1), (a2, b2)} of {(x, y) : x + y·λ ≡ 0 (mod n)}
+A1: int = 0x3086D221A7D46BCDE86C90E49284EB15
+B1: int = -0xE4437ED6010E88286F547FA90ABFE4C3
+A2: int = 0x114CA50F7A8E2F3F657C1108D9D44CFD8
+B2: int = A1
+
+
+def glv_available() -> bool:
+  """The endomorphism only exists when the configured curve actually is secp256k1"""
+  return Secp256k1.P == SECP256K1_P and Secp256k1.N == SECP256K1_N
+
+
+def endomorphism(p: AffinePoint) -> AffinePoint:
+  """φ(x, y) = (β·x, y) = λ · (x, y)"""
+  return (BETA * p[0] % SECP256K1_P, p[1])
+
+
+def glv_decompose(k: int) -> tuple[int, int]:
+  """Split k into signed halves with k ≡ k1 + k2·λ (mod n), each of about 128 bits"""
+  n = SECP256K1_N
+  k %= n
+  c1 = (B2 * k + n // 2) // n
+  c2 = (-B1 * k + n // 2) // n
+  k1 = k - c1 * A1 - c2 * A2
+  k2 = -c1 * B1 - c2 * B2
+  return k1, k2
+
+
+__all__: tuple[str, ...] = (
+  "BETA",
+  "LAMBDA",
+  "endomorphism",
+  "glv_available",
+  "glv_decompose",
+)
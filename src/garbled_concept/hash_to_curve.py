@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Hash to Curve for secp256k1
+
+The secp256k1_XMD:SHA-256_SSWU_RO_ suite of RFC 9380: messages are expanded with
+expand_message_xmd, hashed to two field elements, each mapped with the simplified SWU map
+onto the 3-isogenous curve E': y² = x³ + A'x + B' and carried over to secp256k1 by the
+isogeny, and the two points are added. Nobody learns the discrete logarithm of the result
+with respect to G or to any other hashed point, which is what MAC generators need.
+
+This is the straightforward (not constant-time) rendering; it only ever hashes public
+domain-separation strings. See https://www.rfc-editor.org/rfc/rfc9380
+"""
+
+### Standard packages ###
+from hashlib import sha256
+
+### Local modules ###
+from garbled_concept.jacobian import AffinePoint, jacobian_add, to_affine, to_jacobian
+
+P: int = 2**256 - 2**32 - 977
+
+# E': y² = x³ + A'x + B', 3-isogenous to secp256k1, and the SSWU constant Z
+ISO_A: int = 0x3F8731ABDD661ADCA08A5558F0F5D272E953D363CB6F0E5D405447C01A444533
+ISO_B: int = 1771
+Z: int = P - 11
+
+# 3-isogeny map E' -> secp256k1 (RFC 9380, appendix E.1)
+X_NUM: tuple[int, ...] = (
+  0x8E38E38E38E38E38E38E38E38E38E38E38E38E38E38E38E38E38E38DAAAAA8C7,
+  0x07D3D4C80BC321D5B9F315CEA7FD44C5D595D2FC0BF63B92DFFF1044F17C6581,
+  0x534C328D23F234E6E2A413DECA25CAECE4506144037C40314ECBD0B53D9DD262,
+  0x8E38E38E38E38E38E38E38E38E38E38E38E38E38E38E38E38E38E38DAAAAA88C,
+)
+X_DEN: tuple[int, ...] = (
+  0xD35771193D94918A9CA34CCBB7B640DD86CD409542F8487D9FE6B745781EB49B,
+  0xEDADC6F64383DC1DF7C4B2D51B54225406D36B641F5E41BBC52A56612A8C6D14,
+  1,
+)
+Y_NUM: tuple[int, ...] = (
+  0x4BDA12F684BDA12F684BDA12F684BDA12F684BDA12F684BDA12F684B8E38E23C,
+  0xC75E0C32D5CB7C0FA9D0A54B12A0A6D5647AB046D686DA6FDFFC90FC201D71A3,
+  0x29A6194691F91A73715209EF6512E576722830A201BE2018A765E85A9ECEE931,
+  0x2F684BDA12F684BDA12F684BDA12F684BDA12F684BDA12F684BDA12F38E38D84,
+)
+Y_DEN: tuple[int, ...] = (
+  0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFF93B,
+  0x7A06534BB8BDB49FD5E9E6632722C2989467C1BFC8E8D978DFB425D2685C2573,
+  0x6484AA716545CA2CF3A70C3FA8FE337E0A3D21162F0D6299A7BF8192BFD2A76F,
+  1,
+)
+
+
+def expand_message_xmd(msg: bytes, dst: bytes, length: int) -> bytes:
+  """expand_message_xmd with SHA-256 (RFC 9380, section 5.3.1)"""
+  ell = -(-length // 32)
+  if ell > 255 or length > 65535 or len(dst) > 255:
+    raise ValueError("expand_message_xmd request is too long")
+  dst_prime = dst + bytes([len(dst)])
+  b_0 = sha256(bytes(64) + msg + length.to_bytes(2, "big") + b"\x00" + dst_prime).digest()
+  b_i = sha256(b_0 + b"\x01" + dst_prime).digest()
+  uniform = b_i
+  for i in range(2, ell + 1):
+    mixed = bytes(x ^ y for x, y in zip(b_0, b_i))
+    b_i = sha256(mixed + bytes([i]) + dst_prime).digest()
+    uniform += b_i
+  return uniform[:length]
+
+
+def hash_to_field(msg: bytes, dst: bytes, count: int = 2) -> list[int]:
+  """`count` elements of GF(p), 48 bytes (k = 128 bits of slack) each"""
+  uniform = expand_message_xmd(msg, dst, 48 * count)
+  return [int.from_bytes(uniform[48 * i : 48 * (i + 1)], "big") % P for i in range(count)]
+
+
+def _sqrt(a: int) -> int | None:
+  root = pow(a, (P + 1) // 4, P)
+  return root if root * root % P == a else None
+
+
+def map_to_curve_sswu(u: int) -> AffinePoint:
+  """Simplified SWU map of a field element onto E' (RFC 9380, section 6.6.2)"""
+  z_u2 = Z * u * u % P
+  denominator = (z_u2 * z_u2 + z_u2) % P
+  if denominator == 0:
+    x1 = ISO_B * pow(Z * ISO_A, -1, P) % P
+  else:
+    x1 = (P - ISO_B) * pow(ISO_A, -1, P) * (1 + pow(denominator, -1, P)) % P
+  gx1 = (x1 * x1 * x1 + ISO_A * x1 + ISO_B) % P
+  y = _sqrt(gx1)
+  x = x1
+  if y is None:
+    x = z_u2 * x1 % P
+    y = _sqrt((x * x * x + ISO_A * x + ISO_B) % P)
+  if u % 2 != y % 2:
+    y = P - y
+  return (x, y)
+
+
+def _polynomial(coefficients: tuple[int, ...], x: int) -> int:
+  result = 0
+  for coefficient in reversed(coefficients):
+    result = (result * x + coefficient) % P
+  return result
+
+
+def iso_map(p: AffinePoint) -> AffinePoint:
+  """Carry a point of E' over to secp256k1 through the 3-isogeny"""
+  x, y = p
+  x_den, y_den = _polynomial(X_DEN, x), _polynomial(Y_DEN, x)
+  x_out = _polynomial(X_NUM, x) * pow(x_den, -1, P) % P
+  y_out = y * _polynomial(Y_NUM, x) * pow(y_den, -1, P) % P
+  return (x_out, y_out)
+
+
+def hash_to_curve(msg: bytes, dst: bytes) -> AffinePoint:
+  """Hash a message to a secp256k1 point (random-oracle encoding; cofactor is 1)"""
+  u_0, u_1 = hash_to_field(msg, dst)
+  q_0 = iso_map(map_to_curve_sswu(u_0))
+  q_1 = iso_map(map_to_curve_sswu(u_1))
+  point = to_affine(jacobian_add(to_jacobian(*q_0), to_jacobian(*q_1)))
+  if point is None:
+    raise ValueError("Hash to curve produced the point at infinity")
+  return point
+
+
+__all__: tuple[str, ...] = (
+  "expand_message_xmd",
+  "hash_to_curve",
+  "hash_to_field",
+  "iso_map",
+  "map_to_curve_sswu",
+)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Instrumentation
+
+Opt-in call counters and timers for the hot primitives (point arithmetic, modular
+inversion, garbling hashes) and for every gate type, to attribute the cost of a circuit to
+the work it actually triggers:
+
+  with instrument() as counters:
+    circuit.evaluate(inputs)
+  print(report(counters))
+
+Instrumented functions check a single module flag and call straight through while
+instrumentation is off, so the disabled cost is one extra call frame. Timings are inclusive
+(a MAC addition also counts the point addition inside it), and counters are kept per
+process: work done by `ParallelGarbler` workers is not seen by the parent.
+"""
+
+### Standard packages ###
+from __future__ import annotations
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from inspect import signature
+from time import perf_counter
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_enabled: bool = False
+
+
+class Counter:
+  """Calls, items processed (e.g. rows of a batched hash) and inclusive seconds"""
+
+  __slots__ = ("calls", "items", "seconds")
+
+  def __init__(self) -> None:
+    self.calls = 0
+    self.items = 0
+    self.seconds = 0.0
+
+  def __repr__(self) -> str:
+    return f"Counter(calls={self.calls}, items={self.items}, seconds={self.seconds:.6f})"
+
+
+_COUNTERS: dict[str, Counter] = {}
+
+
+def is_enabled() -> bool:
+  return _enabled
+
+
+def record(name: str, seconds: float = 0.0, items: int = 1) -> None:
+  """Account one call of `name` by hand, for work that is not a single function call"""
+  counter = _COUNTERS.get(name)
+  if counter is None:
+    counter = _COUNTERS[name] = Counter()
+  counter.calls += 1
+  counter.items += items
+  counter.seconds += seconds
+
+
+def instrumented(
+  name: str,
+  key: Callable[..., Any] | None = None,
+  items: Callable[..., int] | None = None,
+) -> Callable[[F], F]:
+  """
+  Count and time calls to the decorated function under `name`, suffixed with `key(*args)`
+  when given (e.g. the gate type); `items(*args)` sizes batched calls. Both receive every
+  parameter positionally, defaults filled in, however the function itself was called.
+  """
+
+  def decorate(func: F) -> F:
+    parameters = signature(func)
+
+    def positional(args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[Any, ...]:
+      bound = parameters.bind(*args, **kwargs)
+      bound.apply_defaults()
+      return bound.args
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+      if not _enabled:
+        return func(*args, **kwargs)
+      start = perf_counter()
+      try:
+        return func(*args, **kwargs)
+      finally:
+        elapsed = perf_counter() - start
+        if key is not None or items is not None:
+          args = positional(args, kwargs)
+        label = name if key is None else f"{name} {key(*args)}"
+        record(label, elapsed, 1 if items is None else items(*args))
+
+    return wrapper  # type: ignore[return-value]
+
+  return decorate
+
+
+def reset() -> None:
+  _COUNTERS.clear()
+
+
+def counters() -> dict[str, Counter]:
+  """The live counters, by name"""
+  return _COUNTERS
+
+
+@contextmanager
+def instrument(fresh: bool = True) -> Iterator[dict[str, Counter]]:
+  """Enable instrumentation for the duration of the block, starting from zero by default"""
+  global _enabled
+  if fresh:
+    reset()
+  previous, _enabled = _enabled, True
+  try:
+    yield _COUNTERS
+  finally:
+    _enabled = previous
+
+
+def report(counted: dict[str, Counter] | None = None) -> str:
+  """Counters as a table, most expensive first"""
+  counted = _COUNTERS if counted is None else counted
+  if not counted:
+    return "No instrumented calls recorded"
+  width = max(len(name) for name in counted)
+  lines = [f"{'primitive':<{width}} {'calls':>10} {'items':>10} {'total ms':>11} {'µs/call':>9}"]
+  for name, counter in sorted(counted.items(), key=lambda item: -item[1].seconds):
+    lines.append(
+      f"{name:<{width}} {counter.calls:>10,} {counter.items:>10,}"
+      f" {counter.seconds * 1000:>11.2f} {counter.seconds / counter.calls * 1e6:>9.2f}"
+    )
+  return "\n".join(lines)
+
+
+__all__: tuple[str, ...] = (
+  "Counter",
+  "counters",
+  "instrument",
+  "instrumented",
+  "is_enabled",
+  "record",
+  "report",
+  "reset",
+)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Jacobian Coordinates for secp256k1
+
+A Jacobian point (X, Y, Z) represents the affine point (X / Z², Y / Z³), with Z = 0
+standing in for the point at infinity. Additions and doublings in this representation
+need no modular inversion, so a full scalar multiplication pays for exactly one inversion
+when the result is converted back to affine coordinates.
+
+Formulas are specialised for short Weierstrass curves with a = 0 (y² = x³ + 7).
+See https://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian-0.html
+"""
+
+### Local modules ###
+from garbled_concept.parameters import Secp256k1
+
+AffinePoint = tuple[int, int]
+JacobianPoint = tuple[int, int, int]
+
+INFINITY: JacobianPoint = (1, 1, 0)
+
+
+def to_jacobian(x: int, y: int) -> JacobianPoint:
+  """Lift an affine point into Jacobian coordinates"""
+  return (x, y, 1)
+
+
+def to_affine(p: JacobianPoint) -> AffinePoint | None:
+  """Normalise a Jacobian point to affine coordinates; returns None for infinity"""
+  x, y, z = p
+  if z == 0:
+    return None
+  prime = Secp256k1.P
+  z_inv = pow(z, -1, prime)
+  z_inv_2 = z_inv * z_inv % prime
+  return (x * z_inv_2 % prime, y * z_inv_2 * z_inv % prime)
+
+
+def batch_to_affine(points: list[JacobianPoint]) -> list[AffinePoint | None]:
+  """
+  Normalise many Jacobian points at once using Montgomery's trick, paying for a single
+  modular inversion plus three multiplications per point.
+  """
+  prime = Secp256k1.P
+  prefix: list[int] = []
+  acc = 1
+  for _, _, z in points:
+    if z != 0:
+      acc = acc * z % prime
+    prefix.append(acc)
+  acc_inv = pow(acc, -1, prime)
+  result: list[AffinePoint | None] = [None] * len(points)
+  for i in range(len(points) - 1, -1, -1):
+    x, y, z = points[i]
+    if z == 0:
+      continue
+    z_inv = acc_inv * (prefix[i - 1] if i > 0 else 1) % prime
+    acc_inv = acc_inv * z % prime
+    z_inv_2 = z_inv * z_inv % prime
+    result[i] = (x * z_inv_2 % prime, y * z_inv_2 * z_inv % prime)
+  return result
+
+
+def jacobian_eq(p: JacobianPoint, q: JacobianPoint) -> bool:
+  """Compare two Jacobian points by cross-multiplying, without inverting either Z"""
+  x1, y1, z1 = p
+  x2, y2, z2 = q
+  if z1 == 0 or z2 == 0:
+    return z1 == z2
+  prime = Secp256k1.P
+  z1z1 = z1 * z1 % prime
+  z2z2 = z2 * z2 % prime
+  return x1 * z2z2 % prime == x2 * z1z1 % prime and y1 * z2z2 * z2 % prime == y2 * z1z1 * z1 % prime
+
+
+def jacobian_eq_affine(p: JacobianPoint, q: AffinePoint | None) -> bool:
+  """Compare a Jacobian point with an affine one by cross-multiplying, without inverting Z"""
+  x1, y1, z1 = p
+  if q is None or z1 == 0:
+    return q is None and z1 == 0
+  prime = Secp256k1.P
+  z1z1 = z1 * z1 % prime
+  return x1 == q[0] * z1z1 % prime and y1 == q[1] * z1z1 * z1 % prime
+
+
+def jacobian_neg(p: JacobianPoint) -> JacobianPoint:
+  """Negate a Jacobian point"""
+  x, y, z = p
+  return (x, -y % Secp256k1.P, z)
+
+
+def jacobian_double(p: JacobianPoint) -> JacobianPoint:
+  """Point doubling (dbl-2009-l)"""
+  x1, y1, z1 = p
+  if z1 == 0 or y1 == 0:
+    return INFINITY
+  prime = Secp256k1.P
+  a = x1 * x1 % prime
+  b = y1 * y1 % prime
+  c = b * b % prime
+  d = 2 * ((x1 + b) * (x1 + b) - a - c) % prime
+  e = 3 * a
+  f = e * e % prime
+  x3 = (f - 2 * d) % prime
+  y3 = (e * (d - x3) - 8 * c) % prime
+  z3 = 2 * y1 * z1 % prime
+  return (x3, y3, z3)
+
+
+def jacobian_add(p: JacobianPoint, q: JacobianPoint) -> JacobianPoint:
+  """Point addition of two Jacobian points (add-2007-bl)"""
+  x1, y1, z1 = p
+  x2, y2, z2 = q
+  if z1 == 0:
+    return q
+  if z2 == 0:
+    return p
+  prime = Secp256k1.P
+  z1z1 = z1 * z1 % prime
+  z2z2 = z2 * z2 % prime
+  u1 = x1 * z2z2 % prime
+  u2 = x2 * z1z1 % prime
+  s1 = y1 * z2 * z2z2 % prime
+  s2 = y2 * z1 * z1z1 % prime
+  h = (u2 - u1) % prime
+  r = (s2 - s1) % prime
+  if h == 0:
+    return jacobian_double(p) if r == 0 else INFINITY
+  hh = h * h % prime
+  hhh = h * hh % prime
+  v = u1 * hh % prime
+  x3 = (r * r - hhh - 2 * v) % prime
+  y3 = (r * (v - x3) - s1 * hhh) % prime
+  z3 = z1 * z2 * h % prime
+  return (x3, y3, z3)
+
+
+def jacobian_add_affine(p: JacobianPoint, q: AffinePoint) -> JacobianPoint:
+  """Mixed addition of a Jacobian point and an affine point (madd-2007-bl)"""
+  x1, y1, z1 = p
+  x2, y2 = q
+  if z1 == 0:
+    return (x2, y2, 1)
+  prime = Secp256k1.P
+  z1z1 = z1 * z1 % prime
+  u2 = x2 * z1z1 % prime
+  s2 = y2 * z1 * z1z1 % prime
+  h = (u2 - x1) % prime
+  r = (s2 - y1) % prime
+  if h == 0:
+    return jacobian_double(p) if r == 0 else INFINITY
+  hh = h * h % prime
+  hhh = h * hh % prime
+  v = x1 * hh % prime
+  x3 = (r * r - hhh - 2 * v) % prime
+  y3 = (r * (v - x3) - y1 * hhh) % prime
+  z3 = z1 * h % prime
+  return (x3, y3, z3)
+
+
+def jacobian_mul(k: int, p: AffinePoint) -> JacobianPoint:
+  """Left-to-right double-and-add with mixed additions against an affine base"""
+  k = k % Secp256k1.N
+  result = INFINITY
+  for bit in bin(k)[2:]:
+    result = jacobian_double(result)
+    if bit == "1":
+      result = jacobian_add_affine(result, p)
+  return result
+
+
+__all__: tuple[str, ...] = (
+  "INFINITY",
+  "AffinePoint",
+  "JacobianPoint",
+  "batch_to_affine",
+  "jacobian_add",
+  "jacobian_add_affine",
+  "jacobian_double",
+  "jacobian_eq",
+  "jacobian_eq_affine",
+  "jacobian_mul",
+  "jacobian_neg",
+  "to_affine",
+  "to_jacobian",
+)
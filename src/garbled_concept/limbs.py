@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Batched Multi-Limb Field Arithmetic (NumPy)
+
+Stores a batch of n 256-bit field elements as a (8, n) array of 32-bit limbs held in uint64
+lanes, least significant limb first, so the same modular operation runs across the whole
+batch in a handful of vectorised NumPy calls. A limb product fits in 64 bits and is split
+into its low and high halves before accumulation, so column sums never overflow.
+
+Both secp256k1 moduli are pseudo-Mersenne numbers m = 2²⁵⁶ - c, which lets reduction fold
+the bits above 2²⁵⁶ back in as high · c instead of performing a long division.
+
+This backend is optional and only importable when NumPy is installed.
+"""
+
+### Standard packages ###
+from __future__ import annotations
+from collections.abc import Sequence
+
+### Third-party packages ###
+import numpy as np
+
+### Local modules ###
+from garbled_concept.fixed_base import FixedBaseTable
+from garbled_concept.jacobian import JacobianPoint, jacobian_add_affine
+from garbled_concept.parameters import Secp256k1
+
+LIMBS: int = 8
+LIMB_BITS: int = 32
+LIMB_MASK = np.uint64((1 << LIMB_BITS) - 1)
+CHUNK_LANES: int = 2048
+
+Limbs = np.ndarray
+
+
+def to_limbs(values: Sequence[int]) -> Limbs:
+  """Pack non-negative integers below 2²⁵⁶ into a (8, n) limb array"""
+  raw = b"".join(value.to_bytes(32, "little") for value in values)
+  return np.frombuffer(raw, dtype="<u4").reshape(len(values), LIMBS).T.astype(np.uint64)
+
+
+def from_limbs(limbs: Limbs) -> list[int]:
+  """Unpack a (8, n) limb array of normalised limbs back into Python integers"""
+  raw = np.ascontiguousarray(limbs.T.astype("<u4")).tobytes()
+  return [int.from_bytes(raw[i : i + 32], "little") for i in range(0, len(raw), 32)]
+
+
+def _carry(columns: Limbs) -> Limbs:
+  """
+  Propagate carries so that every limb but the last is below 2³². All columns shed their
+  carry at once; a further round is only needed when a carry ripples into a full limb.
+  """
+  while True:
+    carries = columns[:-1] >> LIMB_BITS
+    if not carries.any():
+      return columns
+    columns[:-1] &= LIMB_MASK
+    columns[1:] += carries
+
+
+def _mul_columns(a: Limbs, b: Limbs) -> Limbs:
+  """Schoolbook product of two normalised limb arrays into len(a) + len(b) columns"""
+  columns = np.zeros((len(a) + len(b), a.shape[1]), dtype=np.uint64)
+  for i in range(len(a)):
+    products = a[i] * b
+    columns[i : i + len(b)] += products & LIMB_MASK
+    columns[i + 1 : i + len(b) + 1] += products >> LIMB_BITS
+  return _carry(columns)
+
+
+class LimbField:
+  """Modular arithmetic over batches for a modulus m = 2²⁵⁶ - c with c < 2²⁵⁵"""
+
+  __slots__ = ("c", "c_limbs", "c_small", "modulus")
+
+  def __init__(self, modulus: int) -> None:
+    c = (1 << (LIMBS * LIMB_BITS)) - modulus
+    if not 0 < c < 1 << 255:
+      raise ValueError("Modulus must lie strictly between 2²⁵⁵ and 2²⁵⁶")
+    self.modulus = modulus
+    self.c = c
+    n_limbs = -(-c.bit_length() // LIMB_BITS)
+    self.c_limbs = to_limbs([c])[:n_limbs]
+    self.c_small = [int(limb) for limb in self.c_limbs[:, 0]] if c >> 16 * n_limbs == 0 else []
+
+  def _reduce(self, columns: Limbs) -> Limbs:
+    """Fully reduce carried columns of any length into [0, m)"""
+    while len(columns) > LIMBS:
+      high = columns[LIMBS:]
+      nonzero = np.flatnonzero(high.any(axis=1))
+      if not len(nonzero):
+        columns = columns[:LIMBS]
+        break
+      high = high[: nonzero[-1] + 1]
+      if self.c_small:
+        # Every limb of c is below 2¹⁶ (true for P, where c = 2³² + 977), so high · c is a
+        # few shifted, scaled copies of high that fit in a lane without splitting products
+        width = max(LIMBS, len(high) + len(self.c_small)) + 1
+        merged = np.zeros((width, columns.shape[1]), dtype=np.uint64)
+        merged[:LIMBS] += columns[:LIMBS]
+        for j, limb in enumerate(self.c_small):
+          if limb:
+            merged[j : j + len(high)] += high * np.uint64(limb)
+      else:
+        folded = _mul_columns(high, np.repeat(self.c_limbs, columns.shape[1], axis=1))
+        width = max(LIMBS, len(folded)) + 1
+        merged = np.zeros((width, columns.shape[1]), dtype=np.uint64)
+        merged[:LIMBS] += columns[:LIMBS]
+        merged[: len(folded)] += folded
+      columns = _carry(merged)
+    return self._subtract_once(columns)
+
+  def _subtract_once(self, a: Limbs) -> Limbs:
+    """Map a value in [0, 2²⁵⁶) into [0, m): a ≥ m exactly when a + c overflows 2²⁵⁶"""
+    shifted = np.zeros((LIMBS + 1, a.shape[1]), dtype=np.uint64)
+    shifted[:LIMBS] = a
+    shifted[: len(self.c_limbs)] += self.c_limbs
+    _carry(shifted)
+    overflow = shifted[LIMBS] != 0
+    return np.where(overflow, shifted[:LIMBS], a)
+
+  def constant(self, value: int, n: int) -> Limbs:
+    return np.repeat(to_limbs([value % self.modulus]), n, axis=1)
+
+  def add(self, a: Limbs, b: Limbs) -> Limbs:
+    columns = np.zeros((LIMBS + 1, a.shape[1]), dtype=np.uint64)
+    columns[:LIMBS] = a + b
+    return self._reduce(_carry(columns))
+
+  def neg(self, a: Limbs) -> Limbs:
+    """m - a, computed limb by limb with borrows in signed 64-bit lanes"""
+    modulus = to_limbs([self.modulus]).astype(np.int64)
+    result = np.empty_like(a)
+    borrow = np.zeros(a.shape[1], dtype=np.int64)
+    for i in range(LIMBS):
+      diff = modulus[i] - a[i].astype(np.int64) - borrow
+      borrow = (diff < 0).astype(np.int64)
+      result[i] = (diff + (borrow << LIMB_BITS)).astype(np.uint64)
+    return self._subtract_once(result)
+
+  def sub(self, a: Limbs, b: Limbs) -> Limbs:
+    return self.add(a, self.neg(b))
+
+  def mul(self, a: Limbs, b: Limbs) -> Limbs:
+    return self._reduce(_mul_columns(a, b))
+
+  def mul_small(self, a: Limbs, k: int) -> Limbs:
+    """Multiply by a small non-negative constant k < 2³¹"""
+    columns = np.zeros((LIMBS + 1, a.shape[1]), dtype=np.uint64)
+    columns[:LIMBS] = a * np.uint64(k)
+    return self._reduce(_carry(columns))
+
+  def square(self, a: Limbs) -> Limbs:
+    return self.mul(a, a)
+
+  def is_zero(self, a: Limbs) -> np.ndarray:
+    return ~a.any(axis=0)
+
+
+FieldP = LimbField(Secp256k1.P)
+FieldN = LimbField(Secp256k1.N)
+
+
+def batch_jacobian_add_affine(
+  x1: Limbs, y1: Limbs, z1: Limbs, x2: Limbs, y2: Limbs, active: np.ndarray | None = None
+) -> tuple[Limbs, Limbs, Limbs]:
+  """
+  Lane-wise `jacobian_add_affine` (madd-2007-bl). Lanes where `active` is False keep the
+  first operand. The rare lanes hitting an exceptional case (an operand at infinity or
+  equal x-coordinates) are recomputed with the scalar formulas.
+  """
+  f = FieldP
+  z1z1 = f.square(z1)
+  u2 = f.mul(x2, z1z1)
+  s2 = f.mul(f.mul(y2, z1), z1z1)
+  h = f.sub(u2, x1)
+  r = f.sub(s2, y1)
+  hh = f.square(h)
+  hhh = f.mul(h, hh)
+  v = f.mul(x1, hh)
+  x3 = f.sub(f.sub(f.square(r), hhh), f.mul_small(v, 2))
+  y3 = f.sub(f.mul(r, f.sub(v, x3)), f.mul(y1, hhh))
+  z3 = f.mul(z1, h)
+  if active is None:
+    active = np.ones(x1.shape[1], dtype=bool)
+  x3 = np.where(active, x3, x1)
+  y3 = np.where(active, y3, y1)
+  z3 = np.where(active, z3, z1)
+  exceptional = np.flatnonzero(active & (f.is_zero(z1) | f.is_zero(h)))
+  if len(exceptional):
+    lanes = [from_limbs(limbs[:, exceptional]) for limbs in (x1, y1, z1, x2, y2)]
+    fixed = [jacobian_add_affine((px, py, pz), (qx, qy)) for px, py, pz, qx, qy in zip(*lanes)]
+    for column, limbs in zip(zip(*fixed), (x3, y3, z3)):
+      limbs[:, exceptional] = to_limbs(column)
+  return x3, y3, z3
+
+
+def batch_from_limbs(x: Limbs, y: Limbs, z: Limbs) -> list[JacobianPoint]:
+  """Unpack lane-wise Jacobian coordinates into scalar Jacobian tuples"""
+  return list(zip(from_limbs(x), from_limbs(y), from_limbs(z)))
+
+
+_TABLE_LIMBS: dict[tuple[tuple[int, int], int], tuple[Limbs, Limbs]] = {}
+
+
+def _table_limbs(table: FixedBaseTable) -> tuple[Limbs, Limbs]:
+  """Limb arrays of a fixed-base table, shaped (rows, 8, 2^w - 1), converted once"""
+  key = (table.base, table.window)
+  if key not in _TABLE_LIMBS:
+    xs = np.stack([to_limbs([x for x, _ in row]) for row in table.rows])
+    ys = np.stack([to_limbs([y for _, y in row]) for row in table.rows])
+    _TABLE_LIMBS[key] = (xs, ys)
+  return _TABLE_LIMBS[key]
+
+
+def _window_digits(scalars: Sequence[int], window: int, n_rows: int) -> np.ndarray:
+  """Split every scalar into its w-bit windows, returning an (n, rows) digit array"""
+  order = Secp256k1.N
+  raw = b"".join((k % order).to_bytes(32, "little") for k in scalars)
+  bits = np.unpackbits(
+    np.frombuffer(raw, dtype=np.uint8).reshape(len(scalars), 32), axis=1, bitorder="little"
+  )
+  padded = np.zeros((len(scalars), n_rows * window), dtype=np.int64)
+  width = min(bits.shape[1], padded.shape[1])
+  padded[:, :width] = bits[:, :width]
+  weights = 1 << np.arange(window, dtype=np.int64)
+  return padded.reshape(len(scalars), n_rows, window) @ weights
+
+
+def _fixed_base_chunk(terms: Sequence[tuple[FixedBaseTable, Sequence[int]]]) -> list[JacobianPoint]:
+  n = len(terms[0][1])
+  f = FieldP
+  x, y, z = (np.zeros((LIMBS, n), dtype=np.uint64) for _ in range(3))
+  one = f.constant(1, n)
+  started = np.zeros(n, dtype=bool)
+  for table, scalars in terms:
+    xs, ys = _table_limbs(table)
+    digits = _window_digits(scalars, table.window, len(table.rows))
+    for i in range(len(table.rows)):
+      active = digits[:, i] != 0
+      if not active.any():
+        continue
+      index = np.maximum(digits[:, i], 1) - 1
+      x2, y2 = xs[i][:, index], ys[i][:, index]
+      x, y, z = batch_jacobian_add_affine(x, y, z, x2, y2, active & started)
+      fresh = active & ~started
+      x = np.where(fresh, x2, x)
+      y = np.where(fresh, y2, y)
+      z = np.where(fresh, one, z)
+      started |= active
+  return batch_from_limbs(x, y, z)
+
+
+def batch_fixed_base_mul(
+  terms: Sequence[tuple[FixedBaseTable, Sequence[int]]],
+) -> list[JacobianPoint]:
+  """
+  For every lane i, compute Σₜ kₜᵢ · Bₜ over fixed-base tables, running each table row as
+  one lane-wise mixed addition across the batch. Lanes are processed in chunks of
+  `CHUNK_LANES` so that the working arrays stay cache-resident.
+  """
+  n = len(terms[0][1])
+  result: list[JacobianPoint] = []
+  for start in range(0, n, CHUNK_LANES):
+    stop = start + CHUNK_LANES
+    result += _fixed_base_chunk([(table, scalars[start:stop]) for table, scalars in terms])
+  return result
+
+
+__all__: tuple[str, ...] = (
+  "FieldN",
+  "FieldP",
+  "LimbField",
+  "batch_fixed_base_mul",
+  "batch_from_limbs",
+  "batch_jacobian_add_affine",
+  "from_limbs",
+  "to_limbs",
+)
@@ -1,22 +1,46 @@
 #!/usr/bin/env python3
 
 ### Local modules ###
+from garbled_concept.models.argo_circuit import ArgoCircuit
 from garbled_concept.models.argo_wire import ArgoWire
+from garbled_concept.models.benchmark_comparison import BenchmarkComparison
 from garbled_concept.models.benchmark_result import BenchmarkResult
+from garbled_concept.models.binary_circuit import BinaryCircuit
 from garbled_concept.models.binary_garbled_gate import BinaryGarbledGate
+from garbled_concept.models.binary_garbler import BinaryGarbler
 from garbled_concept.models.binary_label import BinaryLabel
 from garbled_concept.models.binary_wire import BinaryWire
+from garbled_concept.models.bristol_header import BristolHeader
+from garbled_concept.models.compact_wire import CompactWire
+from garbled_concept.models.garbling_scheme import GarblingScheme
 from garbled_concept.models.gate_type import GateType
+from garbled_concept.models.key_map import KeyMap
+from garbled_concept.models.label_store import LabelStore
+from garbled_concept.models.lazy_wire import LazyWire
 from garbled_concept.models.m_a_c import MAC
 from garbled_concept.models.point import Point
+from garbled_concept.models.scaling_result import ScalingResult
+from garbled_concept.models.vector_m_a_c import VectorMAC
 
 __all__: tuple[str, ...] = (
+  "MAC",
+  "ArgoCircuit",
   "ArgoWire",
+  "BenchmarkComparison",
   "BenchmarkResult",
+  "BinaryCircuit",
   "BinaryGarbledGate",
+  "BinaryGarbler",
   "BinaryLabel",
   "BinaryWire",
+  "BristolHeader",
+  "CompactWire",
+  "GarblingScheme",
   "GateType",
-  "MAC",
+  "KeyMap",
+  "LabelStore",
+  "LazyWire",
   "Point",
+  "ScalingResult",
+  "VectorMAC",
 )
@@ -2,14 +2,19 @@
 
 ### Standard packages ###
 from __future__ import annotations
+from collections.abc import Sequence
+from secrets import randbits
 from typing import Any
 
 ### Third-party packages ###
 from pydantic import BaseModel
 
 ### Local modules ###
+from garbled_concept.instrumentation import instrumented
+from garbled_concept.jacobian import AffinePoint
 from garbled_concept.models.m_a_c import MAC
 from garbled_concept.models.point import Point
+from garbled_concept.multi_scalar import msm
 from garbled_concept.parameters import Secp256k1
 
 
@@ -34,6 +39,15 @@ class ArgoWire(BaseModel):
     mac = MAC.create(key, value, h_point)
     return cls(value=value, mac=mac, h_point=h_point)
 
+  @classmethod
+  def create_many(
+    cls, values: Sequence[int], keys: Sequence[int], h_point: Point
+  ) -> list[ArgoWire]:
+    """Create many wires at once; see `MAC.create_many`"""
+    macs = MAC.create_many(keys, values, h_point)
+    return [cls(value=value, mac=mac, h_point=h_point) for value, mac in zip(values, macs)]
+
+  @instrumented("gate", key=lambda *_: "ADD")
   def add(self, other: ArgoWire) -> ArgoWire:
     """
     Addition gate: output = input1 + input2
@@ -45,6 +59,23 @@ class ArgoWire(BaseModel):
     new_mac = self.mac.add(other.mac)
     return ArgoWire(value=new_value, mac=new_mac, h_point=self.h_point)
 
+  @classmethod
+  def linear_combination(cls, wires: Sequence[ArgoWire], coeffs: Sequence[int]) -> ArgoWire:
+    """
+    Linear combination gate: output = Σ cᵢ * inputᵢ
+
+    Equivalent to chaining `mul_const` and `add`, but the output MAC is computed with one
+    multi-scalar multiplication: Σ cᵢ * MAC(kᵢ, vᵢ) = MAC(Σ cᵢ*kᵢ, Σ cᵢ*vᵢ)
+    """
+    if not wires:
+      raise ValueError("Linear combination needs at least one wire")
+    if len(wires) != len(coeffs):
+      raise ValueError("Wires and coefficients must have the same length")
+    new_value = sum(c * wire.value for wire, c in zip(wires, coeffs)) % Secp256k1.N
+    new_mac = MAC.linear_combination([wire.mac for wire in wires], coeffs)
+    return cls(value=new_value, mac=new_mac, h_point=wires[0].h_point)
+
+  @instrumented("gate", key=lambda *_: "MUL")
   def mul_const(self, c: int) -> ArgoWire:
     """
     Multiplication by constant: output = c * input
@@ -58,8 +89,43 @@ class ArgoWire(BaseModel):
 
   def verify(self, key: int) -> bool:
     """Verify the MAC (garbler only)"""
-    expected = MAC.create(key, self.value, self.h_point)
-    return self.mac.tag == expected.tag
+    return self.mac.verify(key, self.value, self.h_point)
+
+  @classmethod
+  def verify_batch(cls, wires: Sequence[ArgoWire], keys: Sequence[int]) -> list[int]:
+    """
+    Verify many wires at once (garbler only); returns the indices of invalid wires.
+
+    With random 128-bit weights rᵢ, every MAC is valid (except with probability 2⁻¹²⁸)
+    exactly when Σ rᵢ * MACᵢ - (Σ rᵢ*kᵢ) * G - (Σ rᵢ*vᵢ) * H is the point at infinity,
+    which costs a single multi-scalar multiplication. Only when that check fails are the
+    wires verified one by one to find the culprits.
+    """
+    if len(wires) != len(keys):
+      raise ValueError("Wires and keys must have the same length")
+    if not wires:
+      return []
+    order = Secp256k1.N
+    scalars: list[int] = []
+    points: list[AffinePoint | None] = []
+    key_sum = 0
+    value_sums: dict[AffinePoint | None, int] = {}
+    for wire, key in zip(wires, keys):
+      weight = randbits(128)
+      scalars.append(weight)
+      points.append(wire.mac.tag.affine)
+      key_sum += weight * key
+      h = wire.h_point.affine
+      value_sums[h] = value_sums.get(h, 0) + weight * wire.value
+    scalars.append(-key_sum % order)
+    points.append((Secp256k1.G_X, Secp256k1.G_Y))
+    for h, value_sum in value_sums.items():
+      scalars.append(-value_sum % order)
+      points.append(h)
+    _, _, z = msm(scalars, points)
+    if z == 0:
+      return []
+    return [i for i, (wire, key) in enumerate(zip(wires, keys)) if not wire.verify(key)]
 
 
 __all__: tuple[str, ...] = ("ArgoWire",)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+### Third-party packages ###
+from pydantic import BaseModel, StrictFloat, StrictInt, StrictStr
+
+
+class BenchmarkComparison(BaseModel):
+  """Median time of one benchmark against the same benchmark in a saved baseline"""
+
+  name: StrictStr
+  operations: StrictInt
+  baseline_ms: StrictFloat
+  current_ms: StrictFloat
+  threshold: StrictFloat
+
+  @property
+  def ratio(self) -> float:
+    """Current over baseline time; above 1 is slower"""
+    return self.current_ms / self.baseline_ms
+
+  @property
+  def is_regression(self) -> bool:
+    """Slower than the baseline by more than the threshold (a fraction, e.g. 0.1 for 10%)"""
+    return self.ratio > 1 + self.threshold
+
+  def __repr__(self):
+    status = "REGRESSION" if self.is_regression else "ok"
+    return (
+      f"{self.name} @ {self.operations}: {self.baseline_ms:.2f} -> {self.current_ms:.2f} ms"
+      f" ({self.ratio - 1:+.1%}) {status}"
+    )
+
+
+__all__: tuple[str, ...] = ("BenchmarkComparison",)
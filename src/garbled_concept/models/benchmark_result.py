@@ -1,17 +1,72 @@
 #!/usr/bin/env python3
 
+### Standard packages ###
+from __future__ import annotations
+from collections.abc import Sequence
+from statistics import median, pstdev, quantiles
+from typing import Any
+
 ### Third-party packages ###
 from pydantic import BaseModel, StrictFloat, StrictInt, StrictStr
 
 
 class BenchmarkResult(BaseModel):
+  """
+  Timing of one benchmark at one size. `total_time_ms` and `per_op_ms` describe the median
+  run; the summary statistics are derived from `samples_ms`, one entry per timed repetition
+  (a single-shot result is its own only sample).
+  """
+
   name: StrictStr
   operations: StrictInt
   total_time_ms: StrictFloat
   per_op_ms: StrictFloat
+  samples_ms: list[StrictFloat] = []
+  min_ms: StrictFloat = 0.0
+  median_ms: StrictFloat = 0.0
+  p95_ms: StrictFloat = 0.0
+  stddev_ms: StrictFloat = 0.0
+
+  def model_post_init(self, __context: Any) -> None:
+    if not self.samples_ms:
+      self.samples_ms = [self.total_time_ms]
+    samples = self.samples_ms
+    self.min_ms = min(samples)
+    self.median_ms = median(samples)
+    self.p95_ms = (
+      quantiles(samples, n=20, method="inclusive")[-1] if len(samples) > 1 else samples[0]
+    )
+    self.stddev_ms = pstdev(samples)
+
+  @classmethod
+  def from_samples(cls, name: str, operations: int, samples_ms: Sequence[float]) -> BenchmarkResult:
+    """Summarise repeated runs, reporting the median run as the total"""
+    total = float(median(samples_ms))
+    return cls(
+      name=name,
+      operations=operations,
+      total_time_ms=total,
+      per_op_ms=total / operations,
+      samples_ms=[float(sample) for sample in samples_ms],
+    )
+
+  @property
+  def repetitions(self) -> int:
+    return len(self.samples_ms)
+
+  @property
+  def key(self) -> str:
+    """Identifies the same benchmark at the same size across runs, e.g. in a baseline file"""
+    return f"{self.name} @ {self.operations}"
 
   def __repr__(self):
-    return f"{self.name}: {self.per_op_ms:.4f} ms/op ({self.operations} ops, {self.total_time_ms:.2f} ms total)"
+    summary = f"{self.name}: {self.per_op_ms:.4f} ms/op ({self.operations} ops, {self.total_time_ms:.2f} ms total)"
+    if self.repetitions > 1:
+      summary += (
+        f" min {self.min_ms:.2f} / p95 {self.p95_ms:.2f} ± {self.stddev_ms:.2f} ms"
+        f" over {self.repetitions} runs"
+      )
+    return summary
 
 
 __all__: tuple[str, ...] = ("BenchmarkResult",)
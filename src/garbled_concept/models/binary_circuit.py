@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+
+### Standard packages ###
+from __future__ import annotations
+from collections import Counter
+from collections.abc import Sequence
+from pathlib import Path
+
+### Third-party packages ###
+from pydantic import BaseModel, StrictInt, StrictStr
+
+### Local modules ###
+from garbled_concept.models.bristol_header import BristolHeader
+
+# Constant wires never reach a gate: operations on them are folded away while building
+ZERO: int = -1
+ONE: int = -2
+
+
+class BinaryCircuit(BaseModel):
+  """
+  Boolean circuit of AND, XOR and INV gates, built gate by gate and exported in Bristol
+  Fashion so that `BristolGarbler` and `BristolEvaluator` can run it.
+
+  Like `ArgoCircuit`, gates live in flat parallel arrays and the builder methods hand out
+  wire indices; multi-bit values are lists of wires, least significant bit first. The
+  builder folds constants (x & 0 = 0, x ^ 1 = ¬x, ...) and the export drops gates no output
+  depends on, so gate counts are those of the circuit a garbler would actually run:
+
+    circuit = BinaryCircuit()
+    a, b = circuit.input(8), circuit.input(8)
+    circuit.output([circuit.xor(x, y) for x, y in zip(a, b)])
+    header, gates = circuit.to_bristol()
+  """
+
+  n_wires: StrictInt = 0
+  inputs: list[list[StrictInt]] = []
+  outputs: list[list[StrictInt]] = []
+  operations: list[StrictStr] = []
+  in_a: list[StrictInt] = []
+  in_b: list[StrictInt] = []
+  out: list[StrictInt] = []
+
+  def _new_wire(self) -> int:
+    self.n_wires += 1
+    return self.n_wires - 1
+
+  def _gate(self, operation: str, a: int, b: int = -1) -> int:
+    wire = self._new_wire()
+    self.operations.append(operation)
+    self.in_a.append(a)
+    self.in_b.append(b)
+    self.out.append(wire)
+    return wire
+
+  def input(self, width: int) -> list[int]:
+    """Declare a `width`-bit input value"""
+    wires = [self._new_wire() for _ in range(width)]
+    self.inputs.append(wires)
+    return wires
+
+  @staticmethod
+  def constant(bit: int) -> int:
+    return ONE if bit else ZERO
+
+  def constant_bits(self, value: int, width: int) -> list[int]:
+    """A public constant as `width` constant wires"""
+    if not 0 <= value < 1 << width:
+      raise ValueError(f"{value} does not fit in {width} bits")
+    return [self.constant(value >> i & 1) for i in range(width)]
+
+  def inv(self, a: int) -> int:
+    if a < 0:
+      return ONE if a == ZERO else ZERO
+    return self._gate("INV", a)
+
+  def xor(self, a: int, b: int) -> int:
+    if a < 0:
+      a, b = b, a
+    if b == ZERO:
+      return a
+    if b == ONE:
+      return self.inv(a)
+    if a == b:
+      return ZERO
+    return self._gate("XOR", a, b)
+
+  def and_(self, a: int, b: int) -> int:
+    if a < 0:
+      a, b = b, a
+    if b == ZERO:
+      return ZERO
+    if b == ONE or a == b:
+      return a
+    return self._gate("AND", a, b)
+
+  def or_(self, a: int, b: int) -> int:
+    """a ∨ b = a ⊕ b ⊕ (a ∧ b), one AND under free-XOR"""
+    return self.xor(self.xor(a, b), self.and_(a, b))
+
+  def output(self, wires: Sequence[int]) -> None:
+    """
+    Declare an output value. Bristol Fashion gives every output bit a wire of its own, so
+    input wires, constants and repeated wires are copied first (copies are free).
+    """
+    taken = {wire for value in self.outputs for wire in value}
+    inputs = {wire for value in self.inputs for wire in value}
+    value = []
+    for wire in wires:
+      if wire < 0:
+        wire = self._gate("EQ", int(wire == ONE))
+      elif wire in taken or wire in inputs:
+        wire = self._gate("EQW", wire)
+      taken.add(wire)
+      value.append(wire)
+    self.outputs.append(value)
+
+  @property
+  def n_gates(self) -> int:
+    return len(self.operations)
+
+  def live_gates(self) -> list[int]:
+    """Indices of the gates some output depends on, in circuit order"""
+    live = {wire for value in self.outputs for wire in value}
+    gates = []
+    for gate in range(self.n_gates - 1, -1, -1):
+      if self.out[gate] in live:
+        gates.append(gate)
+        if self.operations[gate] != "EQ":
+          live.add(self.in_a[gate])
+          if self.in_b[gate] >= 0:
+            live.add(self.in_b[gate])
+    return gates[::-1]
+
+  def gate_counts(self) -> dict[str, int]:
+    """Live gates by operation"""
+    return dict(Counter(self.operations[gate] for gate in self.live_gates()))
+
+  def to_bristol(self) -> tuple[BristolHeader, list[tuple[tuple[int, ...], tuple[int, ...], str]]]:
+    """
+    Live gates renumbered into Bristol Fashion order: input wires first, then internal
+    wires in gate order, output wires last
+    """
+    gates = self.live_gates()
+    output_wires = [wire for value in self.outputs for wire in value]
+    outputs = set(output_wires)
+    order = [wire for value in self.inputs for wire in value]
+    order += [self.out[gate] for gate in gates if self.out[gate] not in outputs]
+    order += output_wires
+    number = {wire: index for index, wire in enumerate(order)}
+    bristol = []
+    for gate in gates:
+      operation, a, b = self.operations[gate], self.in_a[gate], self.in_b[gate]
+      if operation == "EQ":
+        inputs = (a,)
+      else:
+        inputs = (number[a],) if b < 0 else (number[a], number[b])
+      bristol.append((inputs, (number[self.out[gate]],), operation))
+    header = BristolHeader(
+      n_gates=len(bristol),
+      n_wires=len(order),
+      inputs=[len(value) for value in self.inputs],
+      outputs=[len(value) for value in self.outputs],
+    )
+    return header, bristol
+
+  def write_bristol(self, path: str | Path) -> BristolHeader:
+    """Write the circuit as a Bristol Fashion file"""
+    header, gates = self.to_bristol()
+    with Path(path).open("w") as file:
+      file.write(f"{header.n_gates} {header.n_wires}\n")
+      file.write(" ".join(map(str, [len(header.inputs), *header.inputs])) + "\n")
+      file.write(" ".join(map(str, [len(header.outputs), *header.outputs])) + "\n\n")
+      for inputs, outputs, operation in gates:
+        wires = " ".join(map(str, [*inputs, *outputs]))
+        file.write(f"{len(inputs)} {len(outputs)} {wires} {operation}\n")
+    return header
+
+  def evaluate_values(self, values: Sequence[int]) -> list[int]:
+    """Evaluate on plain integers, one per input value, without any garbling"""
+    if len(values) != len(self.inputs):
+      raise ValueError(f"Expected {len(self.inputs)} inputs, got {len(values)}")
+    bits = [0] * self.n_wires
+    for wires, value in zip(self.inputs, values):
+      for i, wire in enumerate(wires):
+        bits[wire] = value >> i & 1
+    for operation, a, b, out in zip(self.operations, self.in_a, self.in_b, self.out):
+      if operation == "AND":
+        bits[out] = bits[a] & bits[b]
+      elif operation == "XOR":
+        bits[out] = bits[a] ^ bits[b]
+      elif operation == "INV":
+        bits[out] = bits[a] ^ 1
+      elif operation == "EQ":
+        bits[out] = a
+      else:
+        bits[out] = bits[a]
+    return [sum(bits[wire] << i for i, wire in enumerate(value)) for value in self.outputs]
+
+
+__all__: tuple[str, ...] = ("ONE", "ZERO", "BinaryCircuit")
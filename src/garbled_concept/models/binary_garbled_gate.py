@@ -1,35 +1,127 @@
 #!/usr/bin/env python3
 
 ### Standard packages ###
-from secrets import SystemRandom
+from __future__ import annotations
+from collections.abc import Sequence
 from typing import Any
 
 ### Third-party packages ###
-from pydantic import BaseModel
+from pydantic import BaseModel, StrictInt
 
 ### Local modules ###
-from garbled_concept.models.binary_label import BinaryLabel
+from garbled_concept.fixed_key_aes import garbling_hash, garbling_hash_many
+from garbled_concept.instrumentation import instrumented
+from garbled_concept.models.binary_label import BinaryLabel, xor_bytes
 from garbled_concept.models.binary_wire import BinaryWire
+from garbled_concept.models.garbling_scheme import GarblingScheme
 from garbled_concept.models.gate_type import GateType
 
 
 class BinaryGarbledGate(BaseModel):
   """
-  Traditional binary garbled gate using point-and-permute + row reduction.
+  Traditional binary garbled gate using point-and-permute and a fixed-key AES hash.
 
   For an AND gate with inputs A, B and output C:
   - Garbler creates encrypted table mapping (label_A, label_B) -> label_C
-  - Evaluator can only decrypt the one row corresponding to their labels
+  - Rows are ordered by the permute bits of the input labels, so the evaluator decrypts
+    exactly the one row corresponding to their labels
+
+  Under the free-XOR schemes every wire's labels differ by the global offset `delta`:
+  XOR gates need no table at all, and the output wire of a gate may be left out, in which
+  case the gate derives it. With half-gates, AND and OR gates need only two rows.
+
+  `index` is the gate's position in its circuit and tweaks every hash of the gate; it must
+  be unique per circuit, or two gates sharing input wires would reuse the same pads.
   """
 
   gate_type: GateType
   in_a: BinaryWire
   in_b: BinaryWire
-  out: BinaryWire
+  out: BinaryWire | None = None
   garbled_table: list[bytes] = []
+  scheme: GarblingScheme = GarblingScheme.CLASSIC
+  delta: BinaryLabel | None = None
+  index: StrictInt
 
+  @instrumented("garble", key=lambda self, _: self.gate_type.value)
   def model_post_init(self, __context: Any) -> None:
-    self.garbled_table = self._garble()
+    if self.scheme != GarblingScheme.CLASSIC and self.delta is None:
+      raise ValueError(f"{self.scheme.value} garbling needs the global offset delta")
+    # Row hashes computed in bulk by `garble_many` arrive through the validation context
+    hashes = __context.get("hashes") if __context else None
+    if self.out is None:
+      if self.scheme == GarblingScheme.CLASSIC:
+        raise ValueError("Classic garbling needs an output wire")
+      if self.is_free:
+        self.out = self._garble_free_xor()
+        return
+      if self.scheme == GarblingScheme.HALF_GATES:
+        self.out, self.garbled_table = self._garble_half_gates(hashes or self._hash())
+        return
+      self.out = BinaryWire.create(self.delta)
+    elif self.scheme == GarblingScheme.HALF_GATES and not self.is_free:
+      if not self.garbled_table:
+        raise ValueError("Half-gates garbling derives the output wire; leave it out")
+    # A table garbled elsewhere (e.g. by a worker process) is taken as is
+    if not self.garbled_table and not self.is_free:
+      self.garbled_table = self._garble(hashes or self._hash())
+
+  @classmethod
+  def garble_many(cls, gates: Sequence[dict[str, Any]]) -> list[BinaryGarbledGate]:
+    """
+    Garble gates whose input wires are all known, hashing every row of every gate in a
+    single batched fixed-key AES call; each item holds the keyword arguments of one gate
+    """
+    rows = [
+      cls.hash_rows(
+        gate["gate_type"],
+        gate["in_a"],
+        gate["in_b"],
+        gate.get("scheme", GarblingScheme.CLASSIC),
+        gate["index"],
+      )
+      for gate in gates
+    ]
+    hashes = garbling_hash_many([row for gate_rows in rows for row in gate_rows])
+    garbled, offset = [], 0
+    for gate, gate_rows in zip(gates, rows):
+      context = {"hashes": hashes[offset : offset + len(gate_rows)]}
+      garbled.append(cls.model_validate(gate, context=context))
+      offset += len(gate_rows)
+    return garbled
+
+  @staticmethod
+  def hash_rows(
+    gate_type: GateType,
+    in_a: BinaryWire,
+    in_b: BinaryWire,
+    scheme: GarblingScheme,
+    index: int,
+  ) -> list[tuple[bytes, bytes | None, int]]:
+    """Inputs to the garbling hash for one gate, in the order its garbling consumes them"""
+    if gate_type == GateType.XOR and scheme != GarblingScheme.CLASSIC:
+      return []
+    if scheme == GarblingScheme.HALF_GATES:
+      j_0, j_1 = 2 * index, 2 * index + 1
+      return [
+        (in_a.label_0.label, None, j_0),
+        (in_a.label_1.label, None, j_0),
+        (in_b.label_0.label, None, j_1),
+        (in_b.label_1.label, None, j_1),
+      ]
+    return [
+      (in_a.get_label(a).label, in_b.get_label(b).label, index) for a in [0, 1] for b in [0, 1]
+    ]
+
+  def _hash(self) -> list[bytes]:
+    return garbling_hash_many(
+      self.hash_rows(self.gate_type, self.in_a, self.in_b, self.scheme, self.index)
+    )
+
+  @property
+  def is_free(self) -> bool:
+    """XOR gates cost nothing under the free-XOR schemes"""
+    return self.gate_type == GateType.XOR and self.scheme != GarblingScheme.CLASSIC
 
   def _gate_func(self, a: int, b: int) -> int:
     """Evaluate the gate function"""
@@ -41,43 +133,93 @@ class BinaryGarbledGate(BaseModel):
       return a | b
     raise ValueError(f"Unsupported gate type: {self.gate_type}")
 
-  def _garble(self) -> list[bytes]:
-    """Create the garbled table"""
-    table = []
-
-    # For each possible input combination
-    for a in [0, 1]:
-      for b in [0, 1]:
-        # Get input labels
-        label_a = self.in_a.get_label(a)
-        label_b = self.in_b.get_label(b)
-
-        # Compute output value and get output label
-        out_val = self._gate_func(a, b)
-        label_out = self.out.get_label(out_val)
-
-        # Encrypt output label with input labels
-        key = label_a.hash_with(label_b)
-        encrypted = bytes(k ^ o for k, o in zip(key, label_out.label))
-
-        table.append(encrypted)
-
-    # Shuffle table (in practice, use point-and-permute)
-    SystemRandom().shuffle(table)
+  def _garble(self, keys: Sequence[bytes]) -> list[bytes]:
+    """
+    Create the garbled table from the row keys: every row is placed by the permute bits of
+    its input labels
+    """
+    for wire in (self.in_a, self.in_b):
+      if wire.label_0.permute_bit == wire.label_1.permute_bit:
+        raise ValueError("Wire labels must differ in their permute bit")
+
+    table = [b""] * 4
+    # Keys follow the input combinations (0, 0), (0, 1), (1, 0), (1, 1)
+    for (a, b), key in zip([(a, b) for a in [0, 1] for b in [0, 1]], keys):
+      # Encrypt the output label under the input labels
+      label_out = self.out.get_label(self._gate_func(a, b))
+      row = 2 * (a ^ self.in_a.permute_bit) + (b ^ self.in_b.permute_bit)
+      table[row] = xor_bytes(key, label_out.label)
     return table
 
+  def _garble_free_xor(self) -> BinaryWire:
+    """Free-XOR: the output 0-label is the XOR of the input 0-labels"""
+    label_0 = self.in_a.label_0 ^ self.in_b.label_0
+    return BinaryWire(label_0=label_0, label_1=label_0 ^ self.delta)
+
+  def _garble_half_gates(self, hashes: Sequence[bytes]) -> tuple[BinaryWire, list[bytes]]:
+    """
+    Half-gates AND (Zahur, Rosulek and Evans, 2015): a generator half and an evaluator half
+    of one row each. OR is garbled as an AND with inverted inputs and output.
+    """
+    if self.gate_type not in {GateType.AND, GateType.OR}:
+      raise ValueError(f"Unsupported gate type: {self.gate_type}")
+    inverted = self.gate_type == GateType.OR
+    h_a_0, h_a_1, h_b_0, h_b_1 = hashes
+    a_0 = self.in_a.label_0
+    if inverted:
+      a_0, h_a_0, h_a_1, h_b_0, h_b_1 = self.in_a.label_1, h_a_1, h_a_0, h_b_1, h_b_0
+    p_a, p_b = a_0.permute_bit, self.in_b.get_label(inverted).permute_bit
+    delta = self.delta.label
+
+    # Generator half-gate
+    t_g = xor_bytes(h_a_0, h_a_1)
+    if p_b:
+      t_g = xor_bytes(t_g, delta)
+    w_g = xor_bytes(h_a_0, t_g) if p_a else h_a_0
+
+    # Evaluator half-gate
+    t_e = xor_bytes(xor_bytes(h_b_0, h_b_1), a_0.label)
+    w_e = xor_bytes(h_b_0, xor_bytes(t_e, a_0.label)) if p_b else h_b_0
+
+    label_0 = BinaryLabel(label=xor_bytes(w_g, w_e))
+    out = BinaryWire(label_0=label_0, label_1=label_0 ^ self.delta)
+    return (out.inverted() if inverted else out), [t_g, t_e]
+
   def evaluate(self, label_a: BinaryLabel, label_b: BinaryLabel) -> BinaryLabel:
     """Evaluator decrypts the garbled table"""
-    key = label_a.hash_with(label_b)
-
-    # Try to decrypt each row (in practice, point-and-permute tells us which)
-    for encrypted in self.garbled_table:
-      decrypted = bytes(k ^ e for k, e in zip(key, encrypted))
-      # In real implementation, would verify decryption succeeded
-      # Here we just return first decryption (simplified)
-      return BinaryLabel(label=decrypted)
-
-    raise ValueError("Decryption failed")
+    label = self.evaluate_table(
+      self.gate_type, self.scheme, self.index, self.garbled_table, label_a.label, label_b.label
+    )
+    return BinaryLabel(label=label)
+
+  @staticmethod
+  @instrumented("evaluate", key=lambda gate_type, *_: gate_type.value)
+  def evaluate_table(
+    gate_type: GateType,
+    scheme: GarblingScheme,
+    index: int,
+    table: Sequence[bytes],
+    label_a: bytes,
+    label_b: bytes,
+  ) -> bytes:
+    """
+    Evaluate a gate from its table and the two active labels alone, which is all an
+    evaluator holds; works on raw bytes so streaming evaluators need no per-gate models
+    """
+    if gate_type == GateType.XOR and scheme != GarblingScheme.CLASSIC:
+      return xor_bytes(label_a, label_b)
+    p_a, p_b = label_a[0] & 1, label_b[0] & 1
+    if scheme == GarblingScheme.HALF_GATES:
+      t_g, t_e = table
+      w_g, w_e = garbling_hash_many([(label_a, None, 2 * index), (label_b, None, 2 * index + 1)])
+      if p_a:
+        w_g = xor_bytes(w_g, t_g)
+      if p_b:
+        w_e = xor_bytes(w_e, xor_bytes(t_e, label_a))
+      return xor_bytes(w_g, w_e)
+
+    # Point-and-permute: the permute bits select the single row to decrypt
+    return xor_bytes(garbling_hash(label_a, label_b, index), table[2 * p_a + p_b])
 
 
 __all__: tuple[str, ...] = ("BinaryGarbledGate",)
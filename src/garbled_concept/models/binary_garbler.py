@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+### Standard packages ###
+from collections.abc import Sequence
+from typing import Any
+
+### Third-party packages ###
+from pydantic import BaseModel, StrictInt
+
+### Local modules ###
+from garbled_concept.models.binary_garbled_gate import BinaryGarbledGate
+from garbled_concept.models.binary_label import BinaryLabel
+from garbled_concept.models.binary_wire import BinaryWire
+from garbled_concept.models.garbling_scheme import GarblingScheme
+from garbled_concept.models.gate_type import GateType
+from garbled_concept.models.label_store import LabelStore
+
+
+class BinaryGarbler(BaseModel):
+  """
+  Garbling context for one binary circuit: fixes the scheme, holds the global offset Δ
+  shared by every wire under free-XOR, and numbers gates so that each hashes with its own
+  tweak.
+  """
+
+  scheme: GarblingScheme = GarblingScheme.HALF_GATES
+  delta: BinaryLabel | None = None
+  n_gates: StrictInt = 0
+
+  def model_post_init(self, __context: Any) -> None:
+    if self.scheme != GarblingScheme.CLASSIC and self.delta is None:
+      self.delta = BinaryLabel.random_offset()
+
+  def wire(self) -> BinaryWire:
+    """Draw an input wire for this circuit"""
+    return BinaryWire.create(self.delta)
+
+  def label_stores(self, n_wires: int) -> tuple[LabelStore, LabelStore | None]:
+    """
+    Fresh 0-labels for n wires in one contiguous store, plus the matching 1-labels under
+    the classic scheme (free-XOR 1-labels are 0-labels ⊕ Δ and need no storage)
+    """
+    zeros = LabelStore.random(n_wires)
+    if self.scheme != GarblingScheme.CLASSIC:
+      return zeros, None
+    return zeros, LabelStore.random(n_wires, permute_bits=zeros)
+
+  def gate(
+    self, gate_type: GateType, in_a: BinaryWire, in_b: BinaryWire, out: BinaryWire | None = None
+  ) -> BinaryGarbledGate:
+    """Garble the next gate; the output wire is derived unless the classic scheme is used"""
+    gate = BinaryGarbledGate(
+      gate_type=gate_type,
+      in_a=in_a,
+      in_b=in_b,
+      out=out if self.scheme == GarblingScheme.CLASSIC else None,
+      scheme=self.scheme,
+      delta=self.delta,
+      index=self.n_gates,
+    )
+    self.n_gates += 1
+    return gate
+
+  def gates(
+    self, specs: Sequence[tuple[GateType, BinaryWire, BinaryWire, BinaryWire | None]]
+  ) -> list[BinaryGarbledGate]:
+    """
+    Garble a batch of gates whose input wires are all known already (a circuit layer, or
+    any classic gates), hashing all of their rows in one fixed-key AES call
+    """
+    classic = self.scheme == GarblingScheme.CLASSIC
+    gates = BinaryGarbledGate.garble_many(
+      [
+        {
+          "gate_type": gate_type,
+          "in_a": in_a,
+          "in_b": in_b,
+          "out": out if classic else None,
+          "scheme": self.scheme,
+          "delta": self.delta,
+          "index": self.n_gates + offset,
+        }
+        for offset, (gate_type, in_a, in_b, out) in enumerate(specs)
+      ]
+    )
+    self.n_gates += len(gates)
+    return gates
+
+
+__all__: tuple[str, ...] = ("BinaryGarbler",)
@@ -2,32 +2,40 @@
 
 ### Standard packages ###
 from __future__ import annotations
-from hashlib import sha256
 from secrets import token_bytes
 
 ### Third-party packages ###
 from pydantic import BaseModel
 
 
+def xor_bytes(a: bytes, b: bytes) -> bytes:
+  """XOR two equal-length byte strings as big integers rather than byte by byte"""
+  return (int.from_bytes(a, "little") ^ int.from_bytes(b, "little")).to_bytes(len(a), "little")
+
+
 class BinaryLabel(BaseModel):
   """Wire label for binary garbled circuits (traditional Yao)"""
 
   label: bytes  # 128-bit random label
 
   @classmethod
-  def random(cls) -> BinaryLabel:
-    return cls(label=token_bytes(16))
+  def random(cls, permute_bit: int | None = None) -> BinaryLabel:
+    label = token_bytes(16)
+    if permute_bit is not None:
+      label = bytes([label[0] & 0xFE | permute_bit]) + label[1:]
+    return cls(label=label)
 
-  def __xor__(self, other: BinaryLabel) -> BinaryLabel:
-    return BinaryLabel(label=bytes(a ^ b for a, b in zip(self.label, other.label)))
+  @classmethod
+  def random_offset(cls) -> BinaryLabel:
+    """Free-XOR offset Δ; its permute bit is set so that a wire's two labels differ in it"""
+    return cls.random(1)
+
+  @property
+  def permute_bit(self) -> int:
+    return self.label[0] & 1
 
-  def hash_with(self, *others: BinaryLabel) -> bytes:
-    """Hash labels together for garbled table encryption"""
-    hash_string = sha256()
-    hash_string.update(self.label)
-    for other in others:
-      hash_string.update(other.label)
-    return hash_string.digest()[:16]
+  def __xor__(self, other: BinaryLabel) -> BinaryLabel:
+    return BinaryLabel(label=xor_bytes(self.label, other.label))
 
 
-__all__: tuple[str, ...] = ("BinaryLabel",)
+__all__: tuple[str, ...] = ("BinaryLabel", "xor_bytes")
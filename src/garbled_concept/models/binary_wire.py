@@ -17,8 +17,24 @@ class BinaryWire(BaseModel):
   label_1: BinaryLabel
 
   @classmethod
-  def create(cls) -> BinaryWire:
-    return cls(label_0=BinaryLabel.random(), label_1=BinaryLabel.random())
+  def create(cls, delta: BinaryLabel | None = None) -> BinaryWire:
+    """
+    Draw a wire whose labels differ in their permute bit; under free-XOR the 1-label is the
+    0-label shifted by the offset delta
+    """
+    label_0 = BinaryLabel.random()
+    if delta is not None:
+      return cls(label_0=label_0, label_1=label_0 ^ delta)
+    return cls(label_0=label_0, label_1=BinaryLabel.random(1 - label_0.permute_bit))
+
+  def inverted(self) -> BinaryWire:
+    """The same labels with their meanings swapped, i.e. a free NOT"""
+    return BinaryWire(label_0=self.label_1, label_1=self.label_0)
+
+  @property
+  def permute_bit(self) -> int:
+    """Permute (select) bit of the 0-label; the evaluator sees it XOR the wire's value"""
+    return self.label_0.permute_bit
 
   def get_label(self, value: int) -> BinaryLabel:
     return self.label_1 if value else self.label_0
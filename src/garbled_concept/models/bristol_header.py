@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+
+### Third-party packages ###
+from pydantic import BaseModel, StrictInt
+
+
+class BristolHeader(BaseModel):
+  """
+  Header of a Bristol Fashion circuit: gate and wire counts plus the bit width of every
+  input and output value. Inputs occupy the first wires and outputs the last ones.
+  """
+
+  n_gates: StrictInt
+  n_wires: StrictInt
+  inputs: list[StrictInt]
+  outputs: list[StrictInt]
+
+  @property
+  def input_wires(self) -> range:
+    return range(sum(self.inputs))
+
+  @property
+  def output_wires(self) -> range:
+    return range(self.n_wires - sum(self.outputs), self.n_wires)
+
+
+__all__: tuple[str, ...] = ("BristolHeader",)
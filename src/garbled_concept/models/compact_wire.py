@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+### Standard packages ###
+from __future__ import annotations
+from collections.abc import Sequence
+
+### Local modules ###
+from garbled_concept.instrumentation import instrumented
+from garbled_concept.jacobian import (
+  INFINITY,
+  AffinePoint,
+  JacobianPoint,
+  batch_to_affine,
+  jacobian_add,
+  jacobian_eq,
+  to_affine,
+)
+from garbled_concept.models.argo_wire import ArgoWire
+from garbled_concept.models.m_a_c import MAC, mac_tag
+from garbled_concept.models.point import Point
+from garbled_concept.multi_scalar import msm
+from garbled_concept.parameters import Secp256k1
+from garbled_concept.wnaf import wnaf_mul
+
+
+class CompactWire:
+  """
+  Validation-free internal counterpart of `ArgoWire` for hot evaluation paths.
+
+  Holds the value and a Jacobian MAC tag in two slots; the H generator is shared by the
+  caller instead of stored per wire. Tags are only normalised to affine when converted
+  back to `ArgoWire`, so chains of additions never pay for a modular inversion.
+  """
+
+  __slots__ = ("tag", "value")
+
+  def __init__(self, value: int, tag: JacobianPoint) -> None:
+    self.value = value
+    self.tag = tag
+
+  def __repr__(self) -> str:
+    return f"CompactWire(value={self.value})"
+
+  @classmethod
+  def create(cls, value: int, key: int, h: AffinePoint | None) -> CompactWire:
+    """Create a new wire with a value and fresh, unnormalised MAC"""
+    value = value % Secp256k1.N
+    return cls(value, mac_tag(key, value, h))
+
+  @classmethod
+  def from_wire(cls, wire: ArgoWire) -> CompactWire:
+    tag = wire.mac.tag
+    return cls(wire.value, INFINITY if tag.is_infinity else (tag.x, tag.y, 1))
+
+  @staticmethod
+  def to_wires(wires: Sequence[CompactWire], h_point: Point) -> list[ArgoWire]:
+    """Convert back to `ArgoWire`s, normalising all tags with a single batch inversion"""
+    tags = batch_to_affine([wire.tag for wire in wires])
+    return [
+      ArgoWire(value=wire.value, mac=MAC(tag=Point.from_affine(tag)), h_point=h_point)
+      for wire, tag in zip(wires, tags)
+    ]
+
+  def to_wire(self, h_point: Point) -> ArgoWire:
+    mac = MAC(tag=Point.from_affine(to_affine(self.tag)))
+    return ArgoWire(value=self.value, mac=mac, h_point=h_point)
+
+  @instrumented("gate", key=lambda *_: "ADD")
+  def add(self, other: CompactWire) -> CompactWire:
+    """Addition gate; see `ArgoWire.add`"""
+    return CompactWire((self.value + other.value) % Secp256k1.N, jacobian_add(self.tag, other.tag))
+
+  @instrumented("gate", key=lambda *_: "MUL")
+  def mul_const(self, c: int) -> CompactWire:
+    """Multiplication by constant; see `ArgoWire.mul_const`"""
+    c = c % Secp256k1.N
+    tag = to_affine(self.tag)
+    if tag is None or c == 0:
+      return CompactWire(c * self.value % Secp256k1.N, INFINITY)
+    return CompactWire(c * self.value % Secp256k1.N, wnaf_mul(c, tag))
+
+  @staticmethod
+  def linear_combination(wires: Sequence[CompactWire], coeffs: Sequence[int]) -> CompactWire:
+    """Linear combination gate; see `ArgoWire.linear_combination`"""
+    if len(wires) != len(coeffs):
+      raise ValueError("Wires and coefficients must have the same length")
+    value = sum(c * wire.value for wire, c in zip(wires, coeffs)) % Secp256k1.N
+    return CompactWire(value, msm(coeffs, batch_to_affine([wire.tag for wire in wires])))
+
+  def verify(self, key: int, h: AffinePoint | None) -> bool:
+    """Verify the MAC (garbler only)"""
+    return jacobian_eq(self.tag, mac_tag(key, self.value, h))
+
+
+__all__: tuple[str, ...] = ("CompactWire",)
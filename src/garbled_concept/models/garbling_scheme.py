@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+
+### Standard packages ###
+from enum import Enum
+
+
+class GarblingScheme(Enum):
+  CLASSIC = "CLASSIC"  # Independent labels, four rows for every gate
+  FREE_XOR = "FREE_XOR"  # Global offset Δ, XOR gates without rows
+  HALF_GATES = "HALF_GATES"  # Free-XOR plus two-row AND / OR gates
+
+
+__all__: tuple[str, ...] = ("GarblingScheme",)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+### Standard packages ###
+from __future__ import annotations
+from collections.abc import Sequence
+
+### Third-party packages ###
+from pydantic import BaseModel, StrictInt
+
+### Local modules ###
+from garbled_concept.models.argo_circuit import ArgoCircuit
+from garbled_concept.parameters import Secp256k1
+
+
+class KeyMap(BaseModel):
+  """
+  Garbler-side key propagation compiled from an `ArgoCircuit`.
+
+  Every gate is linear, so each output key is a fixed linear combination of the input keys:
+  k_out = Σ cᵢ * kᵢ (mod N). The combinations are compiled once into a sparse matrix in
+  compressed-row form and reused for every garbling of the same circuit; applying it is
+  pure scalar arithmetic and never touches an EC point.
+  """
+
+  n_inputs: StrictInt
+  indptr: list[StrictInt]
+  indices: list[StrictInt]
+  coeffs: list[StrictInt]
+
+  @classmethod
+  def compile(cls, circuit: ArgoCircuit, wires: Sequence[int] | None = None) -> KeyMap:
+    """Compile the map for the requested wires (the circuit outputs by default)"""
+    indptr, indices, coeffs = [0], [], []
+    for form in circuit.linear_forms(wires):
+      for index in sorted(form):
+        indices.append(index)
+        coeffs.append(form[index])
+      indptr.append(len(indices))
+    return cls(n_inputs=len(circuit.inputs), indptr=indptr, indices=indices, coeffs=coeffs)
+
+  @property
+  def n_outputs(self) -> int:
+    return len(self.indptr) - 1
+
+  def apply(self, keys: Sequence[int]) -> list[int]:
+    """Propagate input keys to output keys"""
+    if len(keys) != self.n_inputs:
+      raise ValueError(f"Expected {self.n_inputs} keys, got {len(keys)}")
+    modulus, indices, coeffs = Secp256k1.N, self.indices, self.coeffs
+    return [
+      sum(coeffs[j] * keys[indices[j]] for j in range(start, stop)) % modulus
+      for start, stop in zip(self.indptr, self.indptr[1:])
+    ]
+
+  def matrix(self) -> list[list[int]]:
+    """Dense n_outputs × n_inputs key-propagation matrix"""
+    rows = [[0] * self.n_inputs for _ in range(self.n_outputs)]
+    for row, (start, stop) in enumerate(zip(self.indptr, self.indptr[1:])):
+      for j in range(start, stop):
+        rows[row][self.indices[j]] = self.coeffs[j]
+    return rows
+
+
+__all__: tuple[str, ...] = ("KeyMap",)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+
+### Standard packages ###
+from __future__ import annotations
+from collections.abc import Sequence
+from secrets import token_bytes
+from typing import Any
+
+### Local modules ###
+from garbled_concept.models.binary_label import BinaryLabel
+from garbled_concept.models.binary_wire import BinaryWire
+from garbled_concept.parameters import Tuning
+
+try:
+  import numpy as np
+except ImportError:  # NumPy is an optional extra; fall back to a bytearray
+  np = None
+
+LABEL_BYTES: int = 16
+
+
+class LabelStore:
+  """
+  One 16-byte label per wire for a whole binary circuit, kept in a single contiguous
+  buffer instead of per-label objects: a NumPy uint8[n, 16] array when NumPy is installed
+  and selected through `Tuning.BATCH_BACKEND`, a bytearray otherwise.
+
+  A garbler under free-XOR needs one store of 0-labels plus the offset Δ; a classic garbler
+  keeps a second store for the 1-labels; an evaluator keeps one store of active labels.
+  Slicing returns views onto the same buffer, and XOR runs over whole stores or gathered
+  rows at once.
+  """
+
+  __slots__ = ("data",)
+
+  def __init__(self, n_labels: int = 0, backend: str | None = None, data: Any = None) -> None:
+    if data is not None:
+      self.data = data
+      return
+    backend = backend or Tuning.BATCH_BACKEND
+    if backend == "numpy" and np is None:
+      raise ValueError("The numpy backend requires NumPy to be installed")
+    if backend != "python" and np is not None:
+      self.data = np.zeros((n_labels, LABEL_BYTES), dtype=np.uint8)
+    else:
+      self.data = bytearray(n_labels * LABEL_BYTES)
+
+  @classmethod
+  def random(
+    cls, n_labels: int, permute_bits: LabelStore | None = None, backend: str | None = None
+  ) -> LabelStore:
+    """
+    Fresh random labels; with `permute_bits` given, every label takes the opposite permute
+    bit of the matching label there, as classic 1-labels must
+    """
+    store = cls(0, backend)
+    raw = token_bytes(n_labels * LABEL_BYTES)
+    if store.is_numpy:
+      store.data = np.frombuffer(raw, dtype=np.uint8).reshape(n_labels, LABEL_BYTES).copy()
+      if permute_bits is not None:
+        store.data[:, 0] = store.data[:, 0] & 0xFE | (permute_bits.permute_bits() ^ 1)
+    else:
+      store.data = bytearray(raw)
+      if permute_bits is not None:
+        for i, bit in enumerate(permute_bits.permute_bits()):
+          store.data[i * LABEL_BYTES] = store.data[i * LABEL_BYTES] & 0xFE | (bit ^ 1)
+    return store
+
+  @classmethod
+  def from_labels(cls, labels: Sequence[bytes], backend: str | None = None) -> LabelStore:
+    store = cls(0, backend)
+    raw = b"".join(labels)
+    if store.is_numpy:
+      store.data = np.frombuffer(raw, dtype=np.uint8).reshape(len(labels), LABEL_BYTES).copy()
+    else:
+      store.data = bytearray(raw)
+    return store
+
+  @property
+  def is_numpy(self) -> bool:
+    return not isinstance(self.data, (bytearray, memoryview))
+
+  @property
+  def nbytes(self) -> int:
+    return self.data.nbytes if self.is_numpy else len(self.data)
+
+  def __len__(self) -> int:
+    return len(self.data) if self.is_numpy else len(self.data) // LABEL_BYTES
+
+  def __getitem__(self, index: int | slice) -> bytes | LabelStore:
+    """A label as bytes, or for a slice a view sharing this store's buffer"""
+    if isinstance(index, slice):
+      start, stop, step = index.indices(len(self))
+      if step != 1:
+        raise ValueError("Label store views must be contiguous")
+      if self.is_numpy:
+        return LabelStore(data=self.data[start:stop])
+      return LabelStore(data=memoryview(self.data)[start * LABEL_BYTES : stop * LABEL_BYTES])
+    if self.is_numpy:
+      return self.data[index].tobytes()
+    index = range(len(self))[index]
+    return bytes(self.data[index * LABEL_BYTES : (index + 1) * LABEL_BYTES])
+
+  def __setitem__(self, index: int, label: bytes) -> None:
+    if self.is_numpy:
+      self.data[index] = np.frombuffer(label, dtype=np.uint8)
+    else:
+      index = range(len(self))[index]
+      self.data[index * LABEL_BYTES : (index + 1) * LABEL_BYTES] = label
+
+  def grow(self, n_labels: int) -> None:
+    """Append `n_labels` zero labels in place; no slice view of this store may be alive"""
+    if self.is_numpy:
+      self.data = np.concatenate((self.data, np.zeros((n_labels, LABEL_BYTES), np.uint8)))
+    else:
+      self.data.extend(bytes(n_labels * LABEL_BYTES))
+
+  def to_bytes(self) -> bytes:
+    return self.data.tobytes() if self.is_numpy else bytes(self.data)
+
+  def label(self, index: int) -> BinaryLabel:
+    return BinaryLabel(label=self[index])
+
+  def wire(
+    self, index: int, delta: bytes | None = None, ones: LabelStore | None = None
+  ) -> BinaryWire:
+    """Materialise a wire from 0-labels here plus either the offset Δ or a 1-label store"""
+    label_0 = self.label(index)
+    label_1 = label_0 ^ BinaryLabel(label=delta) if delta is not None else ones.label(index)
+    return BinaryWire(label_0=label_0, label_1=label_1)
+
+  def permute_bits(self, indices: Sequence[int] | None = None) -> Any:
+    """Least significant bit of every label (or of the labels at `indices`)"""
+    if self.is_numpy:
+      column = self.data[:, 0] & 1
+      return column if indices is None else column[np.asarray(indices, dtype=np.intp)]
+    rows = range(len(self)) if indices is None else indices
+    return [self.data[i * LABEL_BYTES] & 1 for i in rows]
+
+  def gather(self, indices: Sequence[int]) -> LabelStore:
+    """Copy the labels at `indices` into a new store"""
+    if self.is_numpy:
+      return LabelStore(data=self.data[np.asarray(indices, dtype=np.intp)])
+    return LabelStore(data=bytearray(b"".join(self[i] for i in indices)))
+
+  def xor(self, other: LabelStore | bytes) -> LabelStore:
+    """Row-wise XOR with another store of the same length, or with one label (e.g. Δ)"""
+    if self.is_numpy:
+      rhs = other.data if isinstance(other, LabelStore) else np.frombuffer(other, dtype=np.uint8)
+      return LabelStore(data=self.data ^ rhs)
+    rhs = other.to_bytes() if isinstance(other, LabelStore) else other * len(self)
+    if len(rhs) != len(self.data):
+      raise ValueError("Label stores must have the same length")
+    # One big-integer XOR over the whole buffer instead of a loop over labels
+    value = int.from_bytes(self.data, "little") ^ int.from_bytes(rhs, "little")
+    return LabelStore(data=bytearray(value.to_bytes(len(self.data), "little")))
+
+  def select(self, values: Sequence[int], delta: bytes) -> LabelStore:
+    """Active labels for plain bits under free-XOR: row i becomes label_0 ⊕ values[i] · Δ"""
+    if self.is_numpy:
+      bits = np.asarray(values, dtype=np.uint8).reshape(-1, 1)
+      return LabelStore(data=self.data ^ bits * np.frombuffer(delta, dtype=np.uint8))
+    mask = b"".join(delta if value else bytes(LABEL_BYTES) for value in values)
+    return self.xor(LabelStore(data=bytearray(mask)))
+
+  def xor_gates(self, in_a: Sequence[int], in_b: Sequence[int], out: Sequence[int]) -> None:
+    """Evaluate a layer of free-XOR gates in place: label[out] = label[in_a] ⊕ label[in_b]"""
+    if self.is_numpy:
+      a, b = np.asarray(in_a, dtype=np.intp), np.asarray(in_b, dtype=np.intp)
+      self.data[np.asarray(out, dtype=np.intp)] = self.data[a] ^ self.data[b]
+      return
+    for a, b, c in zip(in_a, in_b, out):
+      value = int.from_bytes(self[a], "little") ^ int.from_bytes(self[b], "little")
+      self[c] = value.to_bytes(LABEL_BYTES, "little")
+
+
+__all__: tuple[str, ...] = ("LABEL_BYTES", "LabelStore")
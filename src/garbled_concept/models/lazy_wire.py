@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+### Standard packages ###
+from __future__ import annotations
+from collections.abc import Sequence
+
+### Local modules ###
+from garbled_concept.jacobian import AffinePoint
+from garbled_concept.models.compact_wire import CompactWire
+from garbled_concept.multi_scalar import msm, msm_many
+from garbled_concept.parameters import Secp256k1
+
+
+class LazyWire:
+  """
+  Wire whose value is propagated eagerly but whose MAC is kept symbolic.
+
+  The tag is tracked as a sparse linear form {input index: coefficient} over the circuit's
+  input tags; by homomorphism, the wire's tag is Σ cᵢ * tagᵢ. Gates only touch scalars, and
+  a tag is materialised on request with a single multi-scalar multiplication.
+  """
+
+  __slots__ = ("form", "value")
+
+  def __init__(self, value: int, form: dict[int, int]) -> None:
+    self.value = value
+    self.form = form
+
+  def __repr__(self) -> str:
+    return f"LazyWire(value={self.value}, terms={len(self.form)})"
+
+  @classmethod
+  def input(cls, value: int, index: int) -> LazyWire:
+    """The i-th circuit input, whose tag is exactly input tag i"""
+    return cls(value % Secp256k1.N, {index: 1})
+
+  def add(self, other: LazyWire) -> LazyWire:
+    """Addition gate: merge the two linear forms"""
+    modulus = Secp256k1.N
+    form = dict(self.form)
+    for index, coeff in other.form.items():
+      total = (form.get(index, 0) + coeff) % modulus
+      if total:
+        form[index] = total
+      else:
+        form.pop(index, None)
+    return LazyWire((self.value + other.value) % modulus, form)
+
+  def mul_const(self, c: int) -> LazyWire:
+    """Multiplication by constant: scale every coefficient"""
+    modulus = Secp256k1.N
+    c = c % modulus
+    if c == 0:
+      return LazyWire(0, {})
+    return LazyWire(c * self.value % modulus, {i: c * v % modulus for i, v in self.form.items()})
+
+  def materialize(self, tags: Sequence[AffinePoint | None]) -> CompactWire:
+    """Compute the actual tag Σ cᵢ * tagᵢ from the input tags"""
+    return CompactWire(self.value, msm(list(self.form.values()), [tags[i] for i in self.form]))
+
+  @staticmethod
+  def materialize_many(
+    wires: Sequence[LazyWire], tags: Sequence[AffinePoint | None]
+  ) -> list[CompactWire]:
+    """Materialise several wires together, sharing the precomputation over the input tags"""
+    results = msm_many([wire.form for wire in wires], tags)
+    return [CompactWire(wire.value, tag) for wire, tag in zip(wires, results)]
+
+
+__all__: tuple[str, ...] = ("LazyWire",)
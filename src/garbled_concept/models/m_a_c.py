@@ -2,13 +2,27 @@
 
 ### Standard packages ###
 from __future__ import annotations
+from collections.abc import Sequence
+from importlib.util import find_spec
 
 ### Third-party packages ###
 from pydantic import BaseModel
 
 ### Local modules ###
+from garbled_concept.fixed_base import fixed_base_mul, fixed_base_table
+from garbled_concept.instrumentation import instrumented
+from garbled_concept.jacobian import (
+  AffinePoint,
+  JacobianPoint,
+  batch_to_affine,
+  jacobian_add,
+  jacobian_eq_affine,
+  to_affine,
+)
 from garbled_concept.models.point import Point
-from garbled_concept.parameters import Secp256k1
+from garbled_concept.multi_scalar import msm, shamir_mul
+from garbled_concept.parameters import Secp256k1, Tuning
+from garbled_concept.wnaf import wnaf_mul
 
 
 def extended_gcd(a: int, b: int) -> tuple[int, int, int]:
@@ -20,16 +34,21 @@ def extended_gcd(a: int, b: int) -> tuple[int, int, int]:
   return gcd, x, y
 
 
+@instrumented("mod_inverse")
 def mod_inverse(a: int, m: int) -> int:
-  """Extended Euclidean algorithm for modular inverse"""
-  if a < 0:
-    a = a % m
-  g, x, _ = extended_gcd(a, m)
-  if g != 1:
-    raise ValueError("Modular inverse does not exist")
-  return x % m
+  """Modular inverse; delegates to the built-in (iterative) extended Euclidean algorithm"""
+  try:
+    return pow(a, -1, m)
+  except ValueError:
+    raise ValueError("Modular inverse does not exist") from None
 
 
+def from_jacobian(p: JacobianPoint) -> Point:
+  """Convert an internal Jacobian point back to an affine `Point`"""
+  return Point.from_affine(to_affine(p))
+
+
+@instrumented("point_add")
 def point_add(p1: Point, p2: Point) -> Point:
   """Add two EC points"""
   if p1.is_infinity:
@@ -53,22 +72,50 @@ def point_add(p1: Point, p2: Point) -> Point:
   return Point(x=x3, y=y3)
 
 
+@instrumented("point_mul")
 def point_mul(k: int, p: Point) -> Point:
-  """Scalar multiplication using double-and-add"""
-  if k == 0:
+  """Scalar multiplication by GLV-split windowed NAF in Jacobian coordinates"""
+  if p.is_infinity or k % Secp256k1.N == 0:
     return Point.infinity()
+  return from_jacobian(wnaf_mul(k, (p.x, p.y)))
+
 
-  k = k % Secp256k1.N
-  result = Point.infinity()
-  addend = p
+@instrumented("mac_tag")
+def mac_tag(key: int, value: int, h: AffinePoint | None) -> JacobianPoint:
+  """
+  Compute k · G + v · H in Jacobian coordinates.
 
-  while k:
-    if k & 1:
-      result = point_add(result, addend)
-    addend = point_add(addend, addend)
-    k >>= 1
+  Uses the fixed-base tables when both G and H have one, which needs no doublings at all;
+  otherwise both terms share one chain of doublings through Shamir's trick.
+  """
+  g = (Secp256k1.G_X, Secp256k1.G_Y)
+  if h is None:
+    return fixed_base_mul(key, g)
+  h_table = fixed_base_table(h)
+  if h_table is not None:
+    return jacobian_add(fixed_base_mul(key, g), h_table.mul(value))
+  return shamir_mul(key, g, value, h)
+
+
+@instrumented("mac_tags", items=lambda keys, *_: len(keys))
+def mac_tags(
+  keys: Sequence[int], values: Sequence[int], h: AffinePoint | None
+) -> list[JacobianPoint]:
+  """
+  Compute k · G + v · H for a whole batch. Wide batches against registered bases run on the
+  NumPy limb backend when it is installed and selected through `Tuning.BATCH_BACKEND`.
+  """
+  backend = Tuning.BATCH_BACKEND
+  if backend == "auto":
+    wide = len(keys) >= Tuning.BATCH_NUMPY_THRESHOLD
+    backend = "numpy" if wide and find_spec("numpy") is not None else "python"
+  h_table = None if h is None else fixed_base_table(h)
+  if backend == "numpy" and h_table is not None:
+    from garbled_concept.limbs import batch_fixed_base_mul
 
-  return result
+    g_table = fixed_base_table((Secp256k1.G_X, Secp256k1.G_Y))
+    return batch_fixed_base_mul([(g_table, keys), (h_table, values)])
+  return [mac_tag(key, value, h) for key, value in zip(keys, values)]
 
 
 class MAC(BaseModel):
@@ -90,10 +137,20 @@ class MAC(BaseModel):
   @classmethod
   def create(cls, key: int, value: int, h_point: Point) -> MAC:
     """Create a MAC for a value"""
-    g_term = point_mul(key, Point.generator())
-    h_term = point_mul(value, h_point)
-    tag = point_add(g_term, h_term)
-    return cls(tag=tag)
+    return cls(tag=from_jacobian(mac_tag(key, value, h_point.affine)))
+
+  @classmethod
+  def create_many(cls, keys: Sequence[int], values: Sequence[int], h_point: Point) -> list[MAC]:
+    """Create MACs in bulk, normalising every tag to affine with a single batch inversion"""
+    if len(keys) != len(values):
+      raise ValueError("Keys and values must have the same length")
+    tags = batch_to_affine(mac_tags(keys, values, h_point.affine))
+    return [cls(tag=Point.from_affine(tag)) for tag in tags]
+
+  @classmethod
+  def linear_combination(cls, macs: Sequence[MAC], coeffs: Sequence[int]) -> MAC:
+    """Homomorphic linear combination Σ cᵢ · MACᵢ evaluated as one multi-scalar multiplication"""
+    return cls(tag=from_jacobian(msm(coeffs, [mac.tag.affine for mac in macs])))
 
   def add(self, other: MAC) -> MAC:
     """Homomorphic addition"""
@@ -105,5 +162,10 @@ class MAC(BaseModel):
     new_tag = point_mul(scalar, self.tag)
     return MAC(tag=new_tag)
 
+  def verify(self, key: int, value: int, h_point: Point) -> bool:
+    """Check the tag against a recomputed k · G + v · H without normalising it to affine"""
+    expected = mac_tag(key, value, h_point.affine)
+    return jacobian_eq_affine(expected, self.tag.affine)
+
 
 __all__: tuple[str, ...] = ("MAC",)
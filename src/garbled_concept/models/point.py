@@ -7,6 +7,7 @@ from __future__ import annotations
 from pydantic import BaseModel, StrictBool, StrictInt
 
 ### Local modules ###
+from garbled_concept.jacobian import AffinePoint
 from garbled_concept.parameters import Secp256k1
 
 
@@ -25,6 +26,18 @@ class Point(BaseModel):
   def generator(cls) -> Point:
     return cls(x=Secp256k1.G_X, y=Secp256k1.G_Y)
 
+  @classmethod
+  def from_affine(cls, p: AffinePoint | None) -> Point:
+    """Wrap an internal affine tuple, with None standing for infinity"""
+    if p is None:
+      return cls.infinity()
+    return cls(x=p[0], y=p[1])
+
+  @property
+  def affine(self) -> AffinePoint | None:
+    """Internal affine tuple used by the arithmetic engine, None for infinity"""
+    return None if self.is_infinity else (self.x, self.y)
+
   def __eq__(self, other: Point) -> bool:
     if self.is_infinity and other.is_infinity:
       return True
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+
+### Third-party packages ###
+from pydantic import BaseModel, StrictFloat, StrictInt, StrictStr
+
+
+class ScalingResult(BaseModel):
+  """
+  One benchmark at one size in a scaling sweep: time and throughput from an untraced run,
+  peak Python heap (tracemalloc) from a separate traced run of the same size
+  """
+
+  name: StrictStr
+  unit: StrictStr
+  operations: StrictInt
+  total_time_ms: StrictFloat
+  ops_per_second: StrictFloat
+  peak_bytes: StrictInt
+  bytes_per_op: StrictFloat
+
+  def __repr__(self):
+    return (
+      f"{self.name} @ {self.operations:,} {self.unit}s: {self.total_time_ms:,.1f} ms,"
+      f" {self.ops_per_second:,.0f} {self.unit}s/s, peak {self.peak_bytes / 2**20:,.1f} MiB"
+      f" ({self.bytes_per_op:,.0f} B/{self.unit})"
+    )
+
+
+__all__: tuple[str, ...] = ("ScalingResult",)
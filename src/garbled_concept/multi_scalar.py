@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Multi-Scalar Multiplication
+
+Evaluates sums of scalar multiples Σ kᵢ · Pᵢ with shared doublings instead of running an
+independent double-and-add per term.
+"""
+
+### Standard packages ###
+from collections.abc import Mapping, Sequence
+
+### Local modules ###
+from garbled_concept.instrumentation import instrumented
+from garbled_concept.jacobian import (
+  INFINITY,
+  AffinePoint,
+  JacobianPoint,
+  batch_to_affine,
+  jacobian_add,
+  jacobian_add_affine,
+  jacobian_double,
+  to_jacobian,
+)
+from garbled_concept.parameters import Secp256k1
+
+STRAUS_THRESHOLD: int = 128
+STRAUS_WINDOW: int = 4
+
+
+def joint_sparse_form(k0: int, k1: int) -> list[tuple[int, int]]:
+  """
+  Joint sparse form of two non-negative scalars, most significant digit first.
+
+  Digits are in {-1, 0, 1} and on average only half of the columns are non-zero,
+  against three quarters for the plain binary expansion of two random scalars.
+  """
+  digits: list[tuple[int, int]] = []
+  d0 = d1 = 0
+  while k0 + d0 > 0 or k1 + d1 > 0:
+    l0, l1 = d0 + k0, d1 + k1
+    u0 = u1 = 0
+    if l0 & 1:
+      u0 = 1 if l0 & 3 == 1 else -1
+      if l0 & 7 in (3, 5) and l1 & 3 == 2:
+        u0 = -u0
+    if l1 & 1:
+      u1 = 1 if l1 & 3 == 1 else -1
+      if l1 & 7 in (3, 5) and l0 & 3 == 2:
+        u1 = -u1
+    if 2 * d0 == 1 + u0:
+      d0 = 1 - d0
+    if 2 * d1 == 1 + u1:
+      d1 = 1 - d1
+    k0 >>= 1
+    k1 >>= 1
+    digits.append((u0, u1))
+  digits.reverse()
+  return digits
+
+
+def shamir_mul(k0: int, p0: AffinePoint, k1: int, p1: AffinePoint) -> JacobianPoint:
+  """
+  Simultaneous double-scalar multiplication k0 · P0 + k1 · P1 (Shamir's trick over the
+  joint sparse form), sharing a single chain of doublings between both scalars.
+  """
+  k0 %= Secp256k1.N
+  k1 %= Secp256k1.N
+  prime = Secp256k1.P
+  x0, y0 = p0
+  x1, y1 = p1
+  p_sum, p_diff = batch_to_affine(
+    [
+      jacobian_add_affine(to_jacobian(x0, y0), (x1, y1)),
+      jacobian_add_affine(to_jacobian(x0, y0), (x1, -y1 % prime)),
+    ]
+  )
+  table: dict[tuple[int, int], AffinePoint | None] = {
+    (1, 0): p0,
+    (-1, 0): (x0, -y0 % prime),
+    (0, 1): p1,
+    (0, -1): (x1, -y1 % prime),
+    (1, 1): p_sum,
+    (-1, -1): p_sum and (p_sum[0], -p_sum[1] % prime),
+    (1, -1): p_diff,
+    (-1, 1): p_diff and (p_diff[0], -p_diff[1] % prime),
+  }
+  result = INFINITY
+  for column in joint_sparse_form(k0, k1):
+    result = jacobian_double(result)
+    addend = table.get(column)
+    if addend is not None:
+      result = jacobian_add_affine(result, addend)
+  return result
+
+
+def straus_tables(points: Sequence[AffinePoint]) -> list[list[AffinePoint | None]]:
+  """The first 2^w - 1 multiples of every point, normalised with one batch inversion"""
+  n_entries = (1 << STRAUS_WINDOW) - 1
+  flat: list[JacobianPoint] = []
+  for point in points:
+    acc = to_jacobian(*point)
+    flat.append(acc)
+    for _ in range(n_entries - 1):
+      acc = jacobian_add_affine(acc, point)
+      flat.append(acc)
+  affine = batch_to_affine(flat)
+  return [affine[i : i + n_entries] for i in range(0, len(affine), n_entries)]
+
+
+def straus_mul(scalars: Sequence[int], points: Sequence[AffinePoint]) -> JacobianPoint:
+  """
+  Interleaved fixed-window multiplication: every point gets a table of its first 2^w - 1
+  multiples and all terms share one chain of doublings.
+  """
+  return straus_sum(scalars, straus_tables(points))
+
+
+def straus_sum(
+  scalars: Sequence[int], tables: Sequence[Sequence[AffinePoint | None]]
+) -> JacobianPoint:
+  """Σ kᵢ · Pᵢ from the `straus_tables` of the points, which several sums can share"""
+  mask = (1 << STRAUS_WINDOW) - 1
+  bits = max(k.bit_length() for k in scalars)
+  result = INFINITY
+  n_windows = -(-bits // STRAUS_WINDOW)
+  for shift in range((n_windows - 1) * STRAUS_WINDOW, -1, -STRAUS_WINDOW):
+    for _ in range(STRAUS_WINDOW):
+      result = jacobian_double(result)
+    for k, table in zip(scalars, tables):
+      digit = (k >> shift) & mask
+      if digit and table[digit - 1] is not None:
+        result = jacobian_add_affine(result, table[digit - 1])
+  return result
+
+
+def pippenger_window(n: int) -> int:
+  """Pick the bucket width c minimising ⌈256 / c⌉ · (n + 2^(c+1)) point additions"""
+  bits = Secp256k1.N.bit_length()
+  return min(range(1, 17), key=lambda c: -(-bits // c) * (n + (2 << c)))
+
+
+def pippenger_mul(scalars: Sequence[int], points: Sequence[AffinePoint]) -> JacobianPoint:
+  """
+  Bucket method: per c-bit window, drop every point into the bucket of its digit, then
+  collapse the buckets with a running sum so that bucket d is counted d times.
+  """
+  window = pippenger_window(len(points))
+  mask = (1 << window) - 1
+  bits = max(k.bit_length() for k in scalars)
+  result = INFINITY
+  n_windows = -(-bits // window)
+  for shift in range((n_windows - 1) * window, -1, -window):
+    for _ in range(window):
+      result = jacobian_double(result)
+    buckets: list[JacobianPoint] = [INFINITY] * mask
+    for k, point in zip(scalars, points):
+      digit = (k >> shift) & mask
+      if digit:
+        buckets[digit - 1] = jacobian_add_affine(buckets[digit - 1], point)
+    running = window_sum = INFINITY
+    for bucket in reversed(buckets):
+      running = jacobian_add(running, bucket)
+      window_sum = jacobian_add(window_sum, running)
+    result = jacobian_add(result, window_sum)
+  return result
+
+
+@instrumented("msm", items=lambda scalars, _: len(scalars))
+def msm(scalars: Sequence[int], points: Sequence[AffinePoint | None]) -> JacobianPoint:
+  """
+  Multi-scalar multiplication Σ kᵢ · Pᵢ; `None` entries stand for the point at infinity.
+
+  Small inputs go through Straus' interleaving, larger ones through Pippenger's bucket
+  method whose cost per term shrinks as the number of terms grows.
+  """
+  if len(scalars) != len(points):
+    raise ValueError("Scalars and points must have the same length")
+  order = Secp256k1.N
+  terms = [(k % order, p) for k, p in zip(scalars, points) if p is not None and k % order]
+  if not terms:
+    return INFINITY
+  reduced = [k for k, _ in terms]
+  bases = [p for _, p in terms]
+  if len(terms) < STRAUS_THRESHOLD:
+    return straus_mul(reduced, bases)
+  return pippenger_mul(reduced, bases)
+
+
+@instrumented("msm_many", items=lambda rows, _: len(rows))
+def msm_many(
+  rows: Sequence[Mapping[int, int]], points: Sequence[AffinePoint | None]
+) -> list[JacobianPoint]:
+  """
+  Several multi-scalar multiplications over one list of points, each row a sparse
+  {point index: scalar} map, e.g. every output tag of a circuit over its input tags.
+
+  Straus' tables are built once for all the points the rows use and normalised with a
+  single batch inversion, so each further row only pays its own doublings and additions;
+  rows with many terms go through Pippenger's method on their own.
+  """
+  order = Secp256k1.N
+  reduced = [
+    {i: k % order for i, k in row.items() if points[i] is not None and k % order} for row in rows
+  ]
+  shared = sorted({i for row in reduced if len(row) < STRAUS_THRESHOLD for i in row})
+  tables = dict(zip(shared, straus_tables([points[i] for i in shared])))
+  results: list[JacobianPoint] = []
+  for row in reduced:
+    if not row:
+      results.append(INFINITY)
+    elif len(row) < STRAUS_THRESHOLD:
+      results.append(straus_sum(list(row.values()), [tables[i] for i in row]))
+    else:
+      results.append(pippenger_mul(list(row.values()), [points[i] for i in row]))
+  return results
+
+
+__all__: tuple[str, ...] = (
+  "joint_sparse_form",
+  "msm",
+  "msm_many",
+  "pippenger_mul",
+  "pippenger_window",
+  "shamir_mul",
+  "straus_mul",
+  "straus_sum",
+  "straus_tables",
+)
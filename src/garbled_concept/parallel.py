@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Parallel Garbling
+
+Pure-Python big-integer arithmetic holds the GIL, so garbling is sharded across worker
+processes instead of threads. Work travels in chunks as plain integers and bytes rather
+than pydantic models, and each worker builds its own fixed-base tables on first use and
+keeps them for the lifetime of the pool.
+"""
+
+### Standard packages ###
+from __future__ import annotations
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from types import TracebackType
+
+### Third-party packages ###
+from typing_extensions import Self
+
+### Local modules ###
+from garbled_concept.fixed_base import register_fixed_base
+from garbled_concept.jacobian import AffinePoint, batch_to_affine
+from garbled_concept.models import (
+  MAC,
+  ArgoWire,
+  BinaryGarbledGate,
+  BinaryLabel,
+  BinaryWire,
+  GateType,
+  Point,
+)
+from garbled_concept.models.m_a_c import mac_tags
+from garbled_concept.parameters import Tuning
+
+# Gate type, gate index, then the two labels of input a, input b and the output
+GateSpec = tuple[str, int, bytes, bytes, bytes, bytes, bytes, bytes]
+
+
+def _mac_chunk(
+  keys: Sequence[int], values: Sequence[int], h: AffinePoint | None
+) -> list[AffinePoint | None]:
+  """Worker: affine MAC tags for one chunk; H's table is built once per process"""
+  if h is not None:
+    register_fixed_base(h)
+  return batch_to_affine(mac_tags(keys, values, h))
+
+
+def _gate_chunk(specs: Sequence[GateSpec]) -> list[list[bytes]]:
+  """Worker: garbled tables for one chunk of gates given as raw labels, hashed in one batch"""
+  gates = []
+  for gate_type, index, *labels in specs:
+    a_0, a_1, b_0, b_1, out_0, out_1 = (BinaryLabel(label=label) for label in labels)
+    gates.append(
+      {
+        "gate_type": GateType(gate_type),
+        "in_a": BinaryWire(label_0=a_0, label_1=a_1),
+        "in_b": BinaryWire(label_0=b_0, label_1=b_1),
+        "out": BinaryWire(label_0=out_0, label_1=out_1),
+        "index": index,
+      }
+    )
+  return [gate.garbled_table for gate in BinaryGarbledGate.garble_many(gates)]
+
+
+class ParallelGarbler:
+  """
+  Process pool for garbling Argo input wires and binary gates; use as a context manager
+  so that the workers, and the tables they hold, are reused across calls.
+  """
+
+  def __init__(self, workers: int | None = None, chunk_size: int | None = None) -> None:
+    self.workers = workers or Tuning.GARBLE_WORKERS or cpu_count() or 1
+    self.chunk_size = chunk_size or Tuning.GARBLE_CHUNK_SIZE
+    self.executor = ProcessPoolExecutor(max_workers=self.workers)
+    self.n_gates = 0
+
+  def __enter__(self) -> Self:
+    return self
+
+  def __exit__(
+    self,
+    exc_type: type[BaseException] | None,
+    exc_value: BaseException | None,
+    traceback: TracebackType | None,
+  ) -> None:
+    self.shutdown()
+
+  def shutdown(self) -> None:
+    self.executor.shutdown()
+
+  def _chunks(self, n: int) -> list[slice]:
+    return [slice(start, start + self.chunk_size) for start in range(0, n, self.chunk_size)]
+
+  def create_macs(self, keys: Sequence[int], values: Sequence[int], h_point: Point) -> list[MAC]:
+    """Parallel `MAC.create_many`"""
+    if len(keys) != len(values):
+      raise ValueError("Keys and values must have the same length")
+    h = h_point.affine
+    chunks = self._chunks(len(keys))
+    futures = [self.executor.submit(_mac_chunk, keys[part], values[part], h) for part in chunks]
+    return [MAC(tag=Point.from_affine(tag)) for future in futures for tag in future.result()]
+
+  def create_wires(
+    self, values: Sequence[int], keys: Sequence[int], h_point: Point
+  ) -> list[ArgoWire]:
+    """Parallel `ArgoWire.create_many`"""
+    macs = self.create_macs(keys, values, h_point)
+    return [ArgoWire(value=value, mac=mac, h_point=h_point) for value, mac in zip(values, macs)]
+
+  def garble_gates(
+    self,
+    gates: Sequence[tuple[GateType, BinaryWire, BinaryWire, BinaryWire]],
+    first_index: int | None = None,
+  ) -> list[BinaryGarbledGate]:
+    """
+    Garble (gate type, input a, input b, output) specifications across the workers. Gates
+    are numbered on from `first_index`, by default from where the previous call left off,
+    so that every gate of the pool hashes with its own tweak.
+    """
+    first = self.n_gates if first_index is None else first_index
+    self.n_gates = first + len(gates)
+    specs: list[GateSpec] = [
+      (
+        gate_type.value,
+        first + offset,
+        in_a.label_0.label,
+        in_a.label_1.label,
+        in_b.label_0.label,
+        in_b.label_1.label,
+        out.label_0.label,
+        out.label_1.label,
+      )
+      for offset, (gate_type, in_a, in_b, out) in enumerate(gates)
+    ]
+    futures = [self.executor.submit(_gate_chunk, specs[part]) for part in self._chunks(len(specs))]
+    tables = [table for future in futures for table in future.result()]
+    return [
+      BinaryGarbledGate(
+        gate_type=gate_type,
+        in_a=in_a,
+        in_b=in_b,
+        out=out,
+        garbled_table=table,
+        index=first + offset,
+      )
+      for offset, ((gate_type, in_a, in_b, out), table) in enumerate(zip(gates, tables))
+    ]
+
+
+__all__: tuple[str, ...] = ("ParallelGarbler",)
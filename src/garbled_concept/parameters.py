@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+### Standard packages ###
+from typing import Literal
+
 ### Third-party packages ###
 from pydantic import Field, StrictInt
 from pydantic_settings import BaseSettings
@@ -33,6 +36,55 @@ class EllipticCurve(BaseSettings):
   )
 
 
+class PerformanceTuning(BaseSettings):
+  """Knobs trading memory for speed in the elliptic curve arithmetic"""
+
+  FIXED_BASE_WINDOW: int = Field(
+    alias="FIXED_BASE_WINDOW",
+    default=6,
+    description="Window width (bits) of fixed-base tables; each holds ⌈256/w⌉·(2^w-1) points",
+    ge=1,
+    le=12,
+  )
+  WNAF_WINDOW: int = Field(
+    alias="WNAF_WINDOW",
+    default=5,
+    description="Width of the windowed NAF used by variable-base multiplication",
+    ge=2,
+    le=10,
+  )
+  WNAF_CACHE_SIZE: int = Field(
+    alias="WNAF_CACHE_SIZE",
+    default=0,
+    description="Number of per-point odd-multiple tables kept in the LRU cache; 0 disables it",
+    ge=0,
+  )
+  BATCH_BACKEND: Literal["auto", "numpy", "python"] = Field(
+    alias="BATCH_BACKEND",
+    default="auto",
+    description="Field arithmetic for bulk MAC creation; auto uses NumPy limbs on wide batches",
+  )
+  BATCH_NUMPY_THRESHOLD: int = Field(
+    alias="BATCH_NUMPY_THRESHOLD",
+    default=1024,
+    description="Smallest batch for which the auto backend switches to NumPy limbs",
+    ge=1,
+  )
+  GARBLE_WORKERS: int = Field(
+    alias="GARBLE_WORKERS",
+    default=0,
+    description="Worker processes for parallel garbling; 0 uses one per CPU",
+    ge=0,
+  )
+  GARBLE_CHUNK_SIZE: int = Field(
+    alias="GARBLE_CHUNK_SIZE",
+    default=256,
+    description="Wires or gates handed to a worker process per task",
+    ge=1,
+  )
+
+
 Secp256k1 = EllipticCurve()
+Tuning = PerformanceTuning()
 
-__all__: tuple[str, ...] = ("EllipticCurve", "Secp256k1")
+__all__: tuple[str, ...] = ("EllipticCurve", "PerformanceTuning", "Secp256k1", "Tuning")
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Garbled Table Files
+
+Binary on-disk format for the garbled tables of a circuit, written incrementally by the
+garbler and replayed by the evaluator through `mmap` without loading or copying it:
+
+  header   magic "GCTF" | version u8 | scheme u8 | rows per record u16 | records u64
+  records  records × (rows per record × 16 bytes)
+
+Every gate with a non-empty table occupies one fixed-size record, so record i lives at
+offset 16 + i · record size; tables with fewer rows (e.g. an EQ gate's single label) are
+zero-padded. Free gates take no record at all.
+"""
+
+### Standard packages ###
+from __future__ import annotations
+from collections.abc import Iterable, Iterator, Sequence
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from struct import Struct
+from types import TracebackType
+
+### Third-party packages ###
+from typing_extensions import Self
+
+### Local modules ###
+from garbled_concept.models import GarblingScheme
+from garbled_concept.models.label_store import LABEL_BYTES
+
+MAGIC: bytes = b"GCTF"
+VERSION: int = 1
+HEADER = Struct("<4sBBHQ")
+
+SCHEMES: tuple[GarblingScheme, ...] = tuple(GarblingScheme)
+ROWS_PER_RECORD: dict[GarblingScheme, int] = {
+  GarblingScheme.CLASSIC: 4,
+  GarblingScheme.FREE_XOR: 4,
+  GarblingScheme.HALF_GATES: 2,
+}
+
+
+class GarbledTableWriter:
+  """
+  Appends garbled tables to a table file as they are produced; the file is finalised by
+  `close`, which leaving the writer as a context manager calls
+  """
+
+  def __init__(self, path: str | Path, scheme: GarblingScheme) -> None:
+    self.path = Path(path)
+    self.scheme = scheme
+    self.rows = ROWS_PER_RECORD[scheme]
+    self.n_records = 0
+    self.file = self.path.open("wb")
+    self.file.write(self._header())
+
+  def _header(self) -> bytes:
+    return HEADER.pack(MAGIC, VERSION, SCHEMES.index(self.scheme), self.rows, self.n_records)
+
+  def __enter__(self) -> Self:
+    return self
+
+  def __exit__(
+    self,
+    exc_type: type[BaseException] | None,
+    exc_value: BaseException | None,
+    traceback: TracebackType | None,
+  ) -> None:
+    self.close()
+
+  def write(self, table: Sequence[bytes]) -> None:
+    """Append one table as a record; empty tables of free gates are skipped"""
+    if not table:
+      return
+    if len(table) > self.rows:
+      raise ValueError(f"Table has {len(table)} rows, records hold {self.rows}")
+    if self.file.closed:
+      raise ValueError("Garbled table writer is closed")
+    self.file.write(b"".join(table).ljust(self.rows * LABEL_BYTES, b"\x00"))
+    self.n_records += 1
+
+  def write_all(self, tables: Iterable[Sequence[bytes]]) -> None:
+    for table in tables:
+      self.write(table)
+
+  def close(self) -> None:
+    """Patch the record count into the header and close the file"""
+    if self.file.closed:
+      return
+    self.file.seek(0)
+    self.file.write(self._header())
+    self.file.close()
+
+
+class GarbledTableReader:
+  """
+  Memory-maps a table file; records come back as memoryview slices of the mapping, so
+  replaying a circuit larger than RAM touches only the pages it is currently reading.
+  Views are released when the reader closes, and `tables` releases each record once the
+  next one is requested: copy any row kept beyond that.
+  """
+
+  def __init__(self, path: str | Path) -> None:
+    with Path(path).open("rb") as file:
+      self.mmap = mmap(file.fileno(), 0, access=ACCESS_READ)
+    self.view = memoryview(self.mmap)
+    self.records: list[memoryview] = []
+    magic, version, scheme, rows, n_records = HEADER.unpack_from(self.view)
+    if magic != MAGIC or version != VERSION:
+      raise ValueError("Not a garbled table file")
+    self.scheme = SCHEMES[scheme]
+    self.rows = rows
+    self.record_size = rows * LABEL_BYTES
+    self.n_records = n_records
+    if len(self.view) != HEADER.size + n_records * self.record_size:
+      raise ValueError("Garbled table file is truncated")
+
+  def __enter__(self) -> Self:
+    return self
+
+  def __exit__(
+    self,
+    exc_type: type[BaseException] | None,
+    exc_value: BaseException | None,
+    traceback: TracebackType | None,
+  ) -> None:
+    self.close()
+
+  def __len__(self) -> int:
+    return self.n_records
+
+  def record(self, index: int) -> list[memoryview]:
+    """Rows of record `index` as zero-copy views"""
+    if not 0 <= index < self.n_records:
+      raise IndexError(f"Record out of range: {index}")
+    start = HEADER.size + index * self.record_size
+    rows = [
+      self.view[start + row : start + row + LABEL_BYTES]
+      for row in range(0, self.record_size, LABEL_BYTES)
+    ]
+    self.records += rows
+    return rows
+
+  def _release(self) -> None:
+    for row in self.records:
+      row.release()
+    self.records.clear()
+
+  def tables(self) -> Iterator[list[memoryview]]:
+    """Every record in order, as the evaluator consumes them"""
+    for index in range(self.n_records):
+      self._release()
+      yield self.record(index)
+    self._release()
+
+  def close(self) -> None:
+    """Release every record view handed out, then unmap the file"""
+    self._release()
+    self.view.release()
+    self.mmap.close()
+
+
+__all__: tuple[str, ...] = (
+  "HEADER",
+  "MAGIC",
+  "ROWS_PER_RECORD",
+  "VERSION",
+  "GarbledTableReader",
+  "GarbledTableWriter",
+)
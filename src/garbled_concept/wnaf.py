@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Windowed NAF Variable-Base Multiplication
+
+A width-w NAF writes the scalar with odd digits in (-2^(w-1), 2^(w-1)), at most one of
+any w consecutive digits being non-zero, so a multiplication needs a table of the odd
+multiples P, 3P, ..., (2^(w-1) - 1)P and about bits / (w + 1) additions. On secp256k1 the
+scalar is first split with the GLV endomorphism and both halves share the doublings.
+
+Wires with high fan-out are multiplied by many constants, so the odd-multiple tables can be
+kept in an opt-in, size-bounded LRU cache keyed by the base point.
+"""
+
+### Standard packages ###
+from collections import OrderedDict
+
+### Third-party packages ###
+from pydantic import BaseModel, StrictInt
+
+### Local modules ###
+from garbled_concept.glv import endomorphism, glv_available, glv_decompose
+from garbled_concept.instrumentation import instrumented
+from garbled_concept.jacobian import (
+  INFINITY,
+  AffinePoint,
+  JacobianPoint,
+  batch_to_affine,
+  jacobian_add,
+  jacobian_add_affine,
+  jacobian_double,
+  to_jacobian,
+)
+from garbled_concept.parameters import Secp256k1, Tuning
+
+OddMultiples = tuple[list[AffinePoint], list[AffinePoint]]
+
+
+class TableCacheStats(BaseModel):
+  hits: StrictInt
+  misses: StrictInt
+  evictions: StrictInt
+  size: StrictInt
+  max_entries: StrictInt
+
+  @property
+  def hit_rate(self) -> float:
+    lookups = self.hits + self.misses
+    return self.hits / lookups if lookups else 0.0
+
+
+class OddMultipleCache:
+  """Least-recently-used cache of odd-multiple tables keyed by affine base point"""
+
+  __slots__ = ("entries", "evictions", "hits", "max_entries", "misses")
+
+  def __init__(self, max_entries: int) -> None:
+    self.entries: OrderedDict[AffinePoint, tuple[int, OddMultiples]] = OrderedDict()
+    self.max_entries = max_entries
+    self.hits = self.misses = self.evictions = 0
+
+  def get(self, base: AffinePoint, width: int) -> OddMultiples | None:
+    entry = self.entries.get(base)
+    if entry is None or entry[0] != width:
+      self.misses += 1
+      return None
+    self.hits += 1
+    self.entries.move_to_end(base)
+    return entry[1]
+
+  def put(self, base: AffinePoint, width: int, tables: OddMultiples) -> None:
+    self.entries[base] = (width, tables)
+    self.entries.move_to_end(base)
+    while len(self.entries) > self.max_entries:
+      self.entries.popitem(last=False)
+      self.evictions += 1
+
+  def stats(self) -> TableCacheStats:
+    return TableCacheStats(
+      hits=self.hits,
+      misses=self.misses,
+      evictions=self.evictions,
+      size=len(self.entries),
+      max_entries=self.max_entries,
+    )
+
+
+_CACHE = OddMultipleCache(Tuning.WNAF_CACHE_SIZE)
+
+
+def configure_table_cache(max_entries: int) -> None:
+  """
+  Resize the odd-multiple table cache, resetting its contents and statistics; 0 disables it.
+  Each entry holds 2^(w-1) affine points, roughly 3 KiB at the default width of 5.
+  """
+  global _CACHE
+  _CACHE = OddMultipleCache(max_entries)
+
+
+def table_cache_stats() -> TableCacheStats:
+  """Hit, miss and eviction counters of the odd-multiple table cache"""
+  return _CACHE.stats()
+
+
+def wnaf(k: int, width: int) -> list[int]:
+  """Width-w non-adjacent form of a non-negative scalar, least significant digit first"""
+  digits: list[int] = []
+  modulus = 1 << width
+  half = modulus >> 1
+  while k:
+    digit = 0
+    if k & 1:
+      digit = k & (modulus - 1)
+      if digit >= half:
+        digit -= modulus
+      k -= digit
+    digits.append(digit)
+    k >>= 1
+  return digits
+
+
+def odd_multiples(p: AffinePoint, width: int) -> list[AffinePoint]:
+  """Affine P, 3P, 5P, ..., (2^(w-1) - 1)P normalised with one batch inversion"""
+  acc = to_jacobian(*p)
+  twice = jacobian_double(acc)
+  multiples = [acc]
+  for _ in range((1 << (width - 2)) - 1):
+    acc = jacobian_add(acc, twice)
+    multiples.append(acc)
+  return batch_to_affine(multiples)  # type: ignore[return-value]
+
+
+def _tables(p: AffinePoint, width: int) -> OddMultiples:
+  """Odd multiples of P and of φ(P), served from the cache when it is enabled"""
+  if _CACHE.max_entries:
+    tables = _CACHE.get(p, width)
+    if tables is not None:
+      return tables
+  table = odd_multiples(p, width)
+  tables = (table, [endomorphism(q) for q in table] if glv_available() else [])
+  if _CACHE.max_entries:
+    _CACHE.put(p, width, tables)
+  return tables
+
+
+@instrumented("wnaf_mul")
+def wnaf_mul(k: int, p: AffinePoint, width: int | None = None) -> JacobianPoint:
+  """Variable-base multiplication k · P by interleaved wNAF, GLV-split when available"""
+  width = width or Tuning.WNAF_WINDOW
+  table, endo_table = _tables(p, width)
+  if glv_available():
+    k1, k2 = glv_decompose(k)
+    terms = [(k1, table), (k2, endo_table)]
+  else:
+    terms = [(k % Secp256k1.N, table)]
+  prime = Secp256k1.P
+  expansions = [(wnaf(abs(k), width), multiples, k < 0) for k, multiples in terms]
+  result = INFINITY
+  for i in range(max(len(digits) for digits, _, _ in expansions) - 1, -1, -1):
+    result = jacobian_double(result)
+    for digits, multiples, negated in expansions:
+      if i < len(digits) and digits[i]:
+        digit = digits[i]
+        x, y = multiples[abs(digit) >> 1]
+        result = jacobian_add_affine(result, (x, -y % prime) if (digit < 0) != negated else (x, y))
+  return result
+
+
+__all__: tuple[str, ...] = (
+  "OddMultipleCache",
+  "TableCacheStats",
+  "configure_table_cache",
+  "odd_multiples",
+  "table_cache_stats",
+  "wnaf",
+  "wnaf_mul",
+)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+### Third-party packages ###
+from pytest import mark, raises
+
+### Local modules ###
+from garbled_concept.instrumentation import instrument
+from garbled_concept.models import ArgoCircuit, ArgoWire, GateType, Point
+from garbled_concept.parameters import Secp256k1
+
+
+def test_evaluate_values() -> None:
+  circuit = ArgoCircuit()
+  x, y = circuit.input(), circuit.input()
+  circuit.output(circuit.add(circuit.mul_const(x, 3), circuit.mul_const(y, 2)))
+  assert circuit.evaluate_values([5, 7]) == [29]
+
+
+def test_topological_order_is_cached_until_the_circuit_grows() -> None:
+  circuit = ArgoCircuit()
+  x = circuit.input()
+  doubled = circuit.mul_const(x, 2)
+  order = circuit.topological_order()
+  assert order == [0]
+  assert circuit.topological_order() is order
+  circuit.output(circuit.add(doubled, x))
+  assert circuit.topological_order() == [0, 1]
+  assert circuit.evaluate_values([4]) == [12]
+
+
+def test_topological_order_of_unordered_gates() -> None:
+  # Gate 0 reads the output of gate 1, as a deserialised circuit might
+  circuit = ArgoCircuit.model_validate(
+    {
+      "n_wires": 3,
+      "inputs": [0],
+      "outputs": [2],
+      "gate_types": [GateType.MUL, GateType.MUL],
+      "in_a": [1, 0],
+      "in_b": [-1, -1],
+      "constants": [5, 3],
+      "out": [2, 1],
+    }
+  )
+  assert circuit.topological_order() == [1, 0]
+  assert circuit.evaluate_values([2]) == [30]
+
+
+def test_topological_order_follows_direct_field_changes() -> None:
+  circuit = ArgoCircuit()
+  x = circuit.input()
+  circuit.output(circuit.mul_const(circuit.mul_const(x, 5), 3))
+  assert circuit.evaluate_values([2]) == [30]
+  # Appending a gate by hand, reading the current output wire
+  circuit.gate_types.append(GateType.ADD)
+  circuit.in_a.append(2)
+  circuit.in_b.append(0)
+  circuit.constants.append(0)
+  circuit.out.append(3)
+  circuit.n_wires += 1
+  circuit.outputs.append(3)
+  assert circuit.topological_order() == [0, 1, 2]
+  assert circuit.evaluate_values([2]) == [30, 32]
+  # Rewiring without changing any length: gate 0 now reads gate 1, which reads the input
+  circuit.in_a = [2, 0, 1]
+  circuit.out = [1, 2, 3]
+  circuit.outputs = [1]
+  assert circuit.topological_order() == [1, 0, 2]
+  assert circuit.evaluate_values([2]) == [30]
+
+
+def test_cycle_is_rejected() -> None:
+  circuit = ArgoCircuit.model_validate(
+    {
+      "n_wires": 3,
+      "inputs": [0],
+      "outputs": [2],
+      "gate_types": [GateType.ADD, GateType.MUL],
+      "in_a": [0, 1],
+      "in_b": [2, -1],
+      "constants": [0, 2],
+      "out": [1, 2],
+    }
+  )
+  with raises(ValueError):
+    circuit.topological_order()
+
+
+def mixed_circuit() -> ArgoCircuit:
+  """ADD, MUL and constant multiples, with wires shared between outputs of several depths"""
+  circuit = ArgoCircuit()
+  x, y, z = circuit.input(), circuit.input(), circuit.input()
+  xy = circuit.add(x, circuit.mul_const(y, 3))
+  deep = xy
+  for c in (2, -1, Secp256k1.N - 5):
+    deep = circuit.add(circuit.mul_const(deep, c), z)
+  circuit.output(xy)
+  circuit.output(deep)
+  circuit.output(circuit.mul_const(circuit.add(xy, circuit.mul_const(xy, -1)), 7))
+  circuit.output(z)
+  return circuit
+
+
+@mark.parametrize("values", [[1, 2, 3], [0, 0, 0], [Secp256k1.N - 1, 5, 1 << 200]])
+def test_lazy_evaluation_matches_eager(values: list[int]) -> None:
+  circuit = mixed_circuit()
+  h_point = Point.from_affine((Secp256k1.G_X, Secp256k1.G_Y))
+  keys = [101, 202, 303]
+  inputs = ArgoWire.create_many(values, keys, h_point)
+  eager = circuit.evaluate(inputs)
+  with instrument() as counted:
+    lazy = circuit.evaluate(inputs, lazy=True)
+  assert lazy == eager
+  assert [wire.value for wire in lazy] == circuit.evaluate_values(values)
+  # All output tags come out of one batched multi-scalar multiplication
+  assert counted["msm_many"].calls == 1
+  assert "msm" not in counted
+  # The output keys follow the same linear forms as the tags
+  for wire, form in zip(lazy, circuit.linear_forms()):
+    assert wire.verify(sum(c * keys[i] for i, c in form.items()))
+
+
+def test_lazy_evaluation_of_selected_wires() -> None:
+  circuit = mixed_circuit()
+  h_point = Point.from_affine((Secp256k1.G_X, Secp256k1.G_Y))
+  inputs = ArgoWire.create_many([4, 5, 6], [7, 8, 9], h_point)
+  wires = [0, 4, 3]
+  assert circuit.evaluate(inputs, lazy=True, wires=wires) == circuit.evaluate(inputs, wires=wires)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+### Third-party packages ###
+from pytest import MonkeyPatch, mark, raises
+
+### Local modules ###
+from garbled_concept.jacobian import jacobian_mul, to_affine
+from garbled_concept.models import MAC, ArgoWire, Point
+from garbled_concept.parameters import Secp256k1
+
+G = (Secp256k1.G_X, Secp256k1.G_Y)
+N: int = Secp256k1.N
+
+H_POINTS: tuple[Point, ...] = tuple(
+  Point.from_affine(to_affine(jacobian_mul(k, G))) for k in (3, 5)
+)
+KEYS: list[int] = [11 * i + 1 for i in range(8)]
+VALUES: list[int] = [0, 1, N - 1, 1 << 200, 42, 7, 123456789, 2]
+
+
+def batch() -> list[ArgoWire]:
+  """Valid wires, alternating between two secondary generators"""
+  return [
+    ArgoWire.create(value, key, H_POINTS[i % 2]) for i, (value, key) in enumerate(zip(VALUES, KEYS))
+  ]
+
+
+def test_valid_batch_passes(monkeypatch: MonkeyPatch) -> None:
+  wires = batch()
+  # A passing batch is settled by the single combined check, without per-wire verification
+  monkeypatch.delattr(ArgoWire, "verify")
+  assert ArgoWire.verify_batch(wires, KEYS) == []
+  assert ArgoWire.verify_batch([], []) == []
+
+
+def test_derived_wires_pass() -> None:
+  wires = batch()
+  derived = [wires[0].add(wires[2]), wires[1].mul_const(5)]
+  assert ArgoWire.verify_batch(derived, [KEYS[0] + KEYS[2], 5 * KEYS[1]]) == []
+
+
+@mark.parametrize("index", [0, 3, 7])
+def test_tampered_value_is_pinpointed(index: int) -> None:
+  wires = batch()
+  wires[index] = wires[index].model_copy(update={"value": wires[index].value + 1})
+  assert ArgoWire.verify_batch(wires, KEYS) == [index]
+
+
+@mark.parametrize("index", [0, 4])
+def test_tampered_tag_is_pinpointed(index: int) -> None:
+  wires = batch()
+  wire = wires[index]
+  forged = MAC.create(KEYS[index] + 1, wire.value, wire.h_point)
+  wires[index] = wire.model_copy(update={"mac": forged})
+  assert ArgoWire.verify_batch(wires, KEYS) == [index]
+
+
+def test_wrong_keys_and_several_culprits() -> None:
+  wires = batch()
+  keys = [*KEYS]
+  keys[1] += 1
+  wires[5] = wires[5].model_copy(update={"h_point": H_POINTS[0]})
+  assert ArgoWire.verify_batch(wires, keys) == [1, 5]
+
+
+def test_swapped_tags_are_rejected() -> None:
+  # The tags still sum to the same point, which the random weights of the batch check catch
+  wires = batch()
+  wires[2], wires[4] = (
+    wires[2].model_copy(update={"mac": wires[4].mac}),
+    wires[4].model_copy(update={"mac": wires[2].mac}),
+  )
+  assert ArgoWire.verify_batch(wires, KEYS) == [2, 4]
+
+
+def test_length_mismatch() -> None:
+  with raises(ValueError):
+    ArgoWire.verify_batch(batch(), KEYS[:-1])
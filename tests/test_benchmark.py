@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+### Standard packages ###
+from csv import DictReader
+from itertools import count
+from pathlib import Path
+from statistics import pstdev
+
+### Third-party packages ###
+from pytest import CaptureFixture, approx, raises
+
+### Local modules ###
+from garbled_concept.benchmark import compare_results, main, measure, save_sweep, sweep
+from garbled_concept.models import BenchmarkResult, ScalingResult
+
+SAMPLES: list[float] = [12.0, 10.0, 11.0, 30.0, 10.0]
+
+
+def single_shot(name: str, operations: int, total_ms: float) -> BenchmarkResult:
+  return BenchmarkResult(
+    name=name, operations=operations, total_time_ms=total_ms, per_op_ms=total_ms / operations
+  )
+
+
+def test_from_samples_statistics() -> None:
+  result = BenchmarkResult.from_samples("Fixed", 4, SAMPLES)
+  assert result.repetitions == 5
+  assert (result.min_ms, result.median_ms, result.total_time_ms) == (10.0, 11.0, 11.0)
+  assert result.per_op_ms == 11.0 / 4
+  assert result.stddev_ms == approx(pstdev(SAMPLES))
+  # Inclusive 95th percentile: 5% of the way from the 4th to the 5th sorted sample
+  assert result.p95_ms == approx(12.0 + 0.8 * (30.0 - 12.0))
+  assert result.key == "Fixed @ 4"
+
+
+def test_single_shot_result_is_its_own_sample() -> None:
+  result = single_shot("Once", 2, 8.0)
+  assert result.samples_ms == [8.0]
+  assert (result.min_ms, result.median_ms, result.p95_ms, result.stddev_ms) == (8.0, 8.0, 8.0, 0.0)
+
+
+def test_measure_discards_warmup_runs() -> None:
+  calls = count()
+
+  def benchmark() -> list[BenchmarkResult]:
+    run = next(calls)
+    return [single_shot("First", 10, 100.0 * run), single_shot("Second", 20, 1.0 + run)]
+
+  first, second = measure(benchmark, warmup=2, repetitions=3)
+  assert next(calls) == 5
+  assert first.samples_ms == [200.0, 300.0, 400.0]
+  assert (first.name, first.operations, first.median_ms) == ("First", 10, 300.0)
+  assert second.samples_ms == [3.0, 4.0, 5.0]
+  with raises(ValueError):
+    measure(benchmark, repetitions=0)
+
+
+def test_compare_results_matches_name_and_size() -> None:
+  baseline = [
+    BenchmarkResult.from_samples("Binary", 100, [10.0, 10.0]),
+    BenchmarkResult.from_samples("Binary", 1000, [100.0]),
+    BenchmarkResult.from_samples("Gone", 100, [1.0]),
+  ]
+  current = [
+    BenchmarkResult.from_samples("Binary", 1000, [105.0]),
+    BenchmarkResult.from_samples("Binary", 100, [12.0, 11.0, 13.0]),
+    BenchmarkResult.from_samples("New", 100, [1.0]),
+  ]
+  slower, faster = compare_results(baseline, current, threshold=0.1)
+  assert (slower.operations, slower.baseline_ms, slower.current_ms) == (1000, 100.0, 105.0)
+  assert not slower.is_regression
+  assert (faster.operations, faster.baseline_ms, faster.current_ms) == (100, 10.0, 12.0)
+  assert faster.ratio == approx(1.2)
+  assert faster.is_regression
+  assert compare_results(baseline, current, threshold=0.25)[1].is_regression is False
+
+
+def test_field_mul_compared_at_one_argo_size(capsys: CaptureFixture[str]) -> None:
+  main(["-b", "arithmetic", "field-mul", "-n", "3", "6", "--field-bits", "8", "-w", "0", "-r", "1"])
+  output = capsys.readouterr().out
+  assert "One 8-bit binary field multiplication" in output
+  assert "the time of one Argo gate (measured at 6 ops)" in output
+
+
+def test_sweep_rows(tmp_path: Path) -> None:
+  rows = list(sweep(["binary", "arithmetic"], [10, 20]))
+  assert [(row.unit, row.operations) for row in rows] == [
+    ("gate", 10),
+    ("gate", 20),
+    ("wire", 10),
+    ("wire", 20),
+  ]
+  for row in rows:
+    assert row.ops_per_second == approx(row.operations / row.total_time_ms * 1000)
+    assert row.peak_bytes > 0
+    assert row.bytes_per_op == approx(row.peak_bytes / row.operations)
+  path = tmp_path / "scaling.csv"
+  save_sweep(rows, path)
+  with path.open(newline="") as file:
+    written = list(DictReader(file))
+  assert list(written[0]) == list(ScalingResult.model_fields)
+  assert [int(row["operations"]) for row in written] == [10, 20, 10, 20]
+  assert [row["name"] for row in written] == [row.name for row in rows]
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+### Standard packages ###
+from random import Random
+
+### Third-party packages ###
+from pytest import mark
+
+### Local modules ###
+from garbled_concept.binary_arithmetic import (
+  KARATSUBA_THRESHOLD,
+  default_modulus,
+  is_probable_prime,
+  mod_add_circuit,
+  mod_mul_circuit,
+  mod_sub,
+  mul_circuit,
+)
+from garbled_concept.garbled_circuit import (
+  count_binary_gates_for_multiplication,
+  measure_field_operations,
+)
+from garbled_concept.models import BinaryCircuit
+from garbled_concept.parameters import Secp256k1
+
+
+def operands(bits: int, bound: int, seed: int = 3) -> list[tuple[int, int]]:
+  rng = Random(seed)
+  edges = [(0, 0), (1, bound - 1), (bound - 1, bound - 1), (bound - 2, 2)]
+  return edges + [(rng.randrange(bound), rng.randrange(bound)) for _ in range(6)]
+
+
+def test_default_modulus() -> None:
+  assert default_modulus(256) == Secp256k1.P
+  assert default_modulus(8) == 251
+  assert is_probable_prime(default_modulus(61))
+  assert not is_probable_prime(default_modulus(61) + 2)
+
+
+@mark.parametrize("bits", [KARATSUBA_THRESHOLD + 1, 2 * KARATSUBA_THRESHOLD, 48])
+def test_karatsuba_above_threshold(bits: int) -> None:
+  karatsuba, schoolbook = mul_circuit(bits, karatsuba=True), mul_circuit(bits)
+  for a, b in operands(bits, 1 << bits):
+    assert karatsuba.evaluate_values([a, b]) == [a * b] == schoolbook.evaluate_values([a, b])
+  assert karatsuba.gate_counts()["AND"] < schoolbook.gate_counts()["AND"]
+
+
+@mark.parametrize("bits", [32, 40])
+def test_modular_arithmetic(bits: int) -> None:
+  p = default_modulus(bits)
+  add, mul = mod_add_circuit(bits), mod_mul_circuit(bits, karatsuba=True)
+  circuit = BinaryCircuit()
+  x, y = circuit.input(bits), circuit.input(bits)
+  circuit.output(mod_sub(circuit, x, y, p))
+  for a, b in operands(bits, p):
+    assert add.evaluate_values([a, b]) == [(a + b) % p]
+    assert mul.evaluate_values([a, b]) == [a * b % p]
+    assert circuit.evaluate_values([a, b]) == [(a - b) % p]
+
+
+def test_256_bit_field_multiplier() -> None:
+  circuit = mod_mul_circuit(256, karatsuba=True)
+  for a, b in operands(256, Secp256k1.P)[:5]:
+    assert circuit.evaluate_values([a, b]) == [a * b % Secp256k1.P]
+  counts = circuit.gate_counts()
+  measured = measure_field_operations(256)
+  assert (measured["field_mul_and"], measured["field_mul_total"]) == (183_953, 575_563)
+  assert (counts["AND"], sum(counts.values())) == (183_953, 575_563)
+  estimate = count_binary_gates_for_multiplication(256)
+  assert estimate["single_field_mul_and"] == counts["AND"]
+  assert estimate["single_field_mul_total"] == sum(counts.values())
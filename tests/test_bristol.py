@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+### Standard packages ###
+from pathlib import Path
+from random import Random
+
+### Third-party packages ###
+from pytest import mark, raises
+
+### Local modules ###
+from garbled_concept.binary_arithmetic import default_modulus, mod_add_circuit, mod_mul_circuit
+from garbled_concept.bristol import (
+  BristolEvaluator,
+  BristolGarbler,
+  parse_gates,
+  parse_header,
+  read_bristol,
+  wire_last_use,
+)
+from garbled_concept.models import BinaryCircuit, GarblingScheme
+from garbled_concept.table_file import GarbledTableReader, GarbledTableWriter
+
+
+# Two 2-bit inputs a and b; outputs (a0 AND b0, NOT (a1 AND b1)) through one MAND gate
+MAND_CIRCUIT: str = """3 8
+2 2 2
+1 2
+
+4 2 0 1 2 3 4 5 MAND
+1 1 4 6 EQW
+1 1 5 7 INV
+"""
+
+
+def mixed_circuit() -> BinaryCircuit:
+  """Every gate kind Bristol export produces: AND, XOR, INV, EQ and EQW"""
+  circuit = BinaryCircuit()
+  a, b = circuit.input(4), circuit.input(4)
+  value = [circuit.or_(x, y) for x, y in zip(a, b)]
+  circuit.output([*value, circuit.inv(a[0]), circuit.constant(1), circuit.constant(0), b[3]])
+  return circuit
+
+
+def chain_circuit(depth: int) -> BinaryCircuit:
+  """A deep circuit whose every intermediate wire is read once, by the next gate"""
+  circuit = BinaryCircuit()
+  a, b = circuit.input(1)[0], circuit.input(1)[0]
+  value = circuit.and_(a, b)
+  for _ in range(depth):
+    value = circuit.and_(circuit.xor(value, a), circuit.inv(b))
+  circuit.output([value])
+  return circuit
+
+
+def bits(values: list[int], widths: list[int]) -> list[int]:
+  return [value >> i & 1 for value, width in zip(values, widths) for i in range(width)]
+
+
+def unpack(bits_out: list[int], widths: list[int]) -> list[int]:
+  values, position = [], 0
+  for width in widths:
+    values.append(sum(bit << i for i, bit in enumerate(bits_out[position : position + width])))
+    position += width
+  return values
+
+
+def test_write_read_round_trip(tmp_path: Path) -> None:
+  circuit = mod_add_circuit(8)
+  header, gates = circuit.to_bristol()
+  path = tmp_path / "mod_add.txt"
+  assert circuit.write_bristol(path) == header
+  read_header, read_gates = read_bristol(path)
+  assert read_header == header
+  assert list(read_gates) == gates
+
+
+@mark.parametrize(
+  "text",
+  ["2 4\n2 2\n1 1\n", "2 4\n2 1 1\n1\n", "2\n1 2\n1 1\n"],
+  ids=["input-count", "output-count", "gate-count"],
+)
+def test_malformed_header(text: str) -> None:
+  with raises(ValueError):
+    parse_header(iter(text.splitlines()))
+
+
+@mark.parametrize("line", ["2 1 0 1 AND", "2 1 0 1 2 3 AND", "1 1 0 INV"])
+def test_malformed_gate(line: str) -> None:
+  with raises(ValueError):
+    list(parse_gates([line]))
+
+
+def test_parse_gates_skips_blank_lines() -> None:
+  assert list(parse_gates(["", "2 1 0 1 2 XOR", "  "])) == [((0, 1), (2,), "XOR")]
+
+
+@mark.parametrize("scheme", list(GarblingScheme))
+def test_mand_gate(tmp_path: Path, scheme: GarblingScheme) -> None:
+  path = tmp_path / "mand.txt"
+  path.write_text(MAND_CIRCUIT)
+  header, gates = read_bristol(path)
+  assert (header.n_gates, header.n_wires, header.inputs, header.outputs) == (3, 8, [2, 2], [2])
+  gates = list(gates)
+  last_use = wire_last_use(header, gates)
+  garbler = BristolGarbler(header, scheme, last_use)
+  tables = list(garbler.garble(gates))
+  assert len(tables) == 2
+  for a, b in [(0, 0), (1, 2), (3, 3), (2, 3)]:
+    labels = BristolEvaluator(header, scheme, last_use).evaluate(
+      gates, tables, garbler.encode(bits([a, b], [2, 2]))
+    )
+    assert garbler.decode(labels) == [a & b & 1, 1 - (a >> 1 & b >> 1)]
+
+
+@mark.parametrize("release", [False, True], ids=["kept", "released"])
+@mark.parametrize("scheme", list(GarblingScheme))
+@mark.parametrize(
+  "circuit, bound",
+  [(mixed_circuit(), 1 << 4), (mod_mul_circuit(8), default_modulus(8))],
+  ids=["mixed", "mod-mul"],
+)
+def test_garble_evaluate_from_file(
+  tmp_path: Path, scheme: GarblingScheme, circuit: BinaryCircuit, bound: int, release: bool
+) -> None:
+  path = tmp_path / "circuit.txt"
+  header = circuit.write_bristol(path)
+  last_use = wire_last_use(header, read_bristol(path)[1]) if release else None
+  garbler = BristolGarbler(header, scheme, last_use)
+  table_path = tmp_path / "tables.gct"
+  with GarbledTableWriter(table_path, scheme) as writer:
+    writer.write_all(garbler.garble(read_bristol(path)[1]))
+  rng = Random(1)
+  for _ in range(4):
+    values = [rng.randrange(bound) for _ in header.inputs]
+    with GarbledTableReader(table_path) as reader:
+      labels = BristolEvaluator(header, scheme, last_use).evaluate(
+        read_bristol(path)[1], reader.tables(), garbler.encode(bits(values, header.inputs))
+      )
+    assert unpack(garbler.decode(labels), header.outputs) == circuit.evaluate_values(values)
+
+
+@mark.parametrize("scheme", list(GarblingScheme))
+def test_labels_released_after_last_use(scheme: GarblingScheme) -> None:
+  circuit = chain_circuit(200)
+  header, gates = circuit.to_bristol()
+  last_use = wire_last_use(header, gates)
+  garbler = BristolGarbler(header, scheme, last_use)
+  tables = list(garbler.garble(gates))
+  evaluator = BristolEvaluator(header, scheme, last_use)
+  for values in ([0, 0], [0, 1], [1, 0], [1, 1]):
+    labels = evaluator.evaluate(gates, tables, garbler.encode(values))
+    assert garbler.decode(labels) == circuit.evaluate_values(values)
+    assert evaluator.peak_live_wires < 8 < header.n_wires
+  assert garbler.peak_live_wires < 8
+  assert sum(len(store) for store in garbler.labels.stores) <= 32
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+### Third-party packages ###
+from pytest import mark, raises
+
+### Local modules ###
+from garbled_concept.codec import (
+  decode_compact_wires,
+  decode_point,
+  decode_wires,
+  encode_point,
+  encode_wires,
+)
+from garbled_concept.ec_mac import generate_h_point
+from garbled_concept.jacobian import jacobian_eq
+from garbled_concept.models import ArgoWire, Point
+
+
+@mark.parametrize("compressed", [True, False])
+def test_point_round_trip(compressed: bool) -> None:
+  for point in (Point.generator(), generate_h_point(), Point.infinity()):
+    assert decode_point(encode_point(point, compressed)) == point
+
+
+@mark.parametrize("compressed", [True, False])
+def test_wire_array_round_trip(compressed: bool) -> None:
+  h_point = generate_h_point()
+  wires = ArgoWire.create_many([0, 1, 42], [5, 6, 7], h_point)
+  data = encode_wires(wires, compressed)
+  assert decode_wires(data) == wires
+  decoded_h, compact = decode_compact_wires(data)
+  assert decoded_h == h_point
+  for wire, decoded in zip(wires, compact):
+    assert decoded.value == wire.value
+    assert jacobian_eq(decoded.tag, (wire.mac.tag.x, wire.mac.tag.y, 1))
+
+
+def test_empty_wire_array() -> None:
+  data = encode_wires([])
+  assert decode_wires(data) == []
+  assert decode_compact_wires(data) == (Point.infinity(), [])
+
+
+def test_truncated_wire_array() -> None:
+  data = encode_wires(ArgoWire.create_many([1], [2], generate_h_point()))
+  with raises(ValueError):
+    decode_wires(data[:-1])
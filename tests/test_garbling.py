@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+### Standard packages ###
+from itertools import product
+
+### Third-party packages ###
+from pytest import mark
+
+### Local modules ###
+from garbled_concept.models import (
+  BinaryGarbledGate,
+  BinaryGarbler,
+  GarblingScheme,
+  GateType,
+)
+
+TRUTH: dict[GateType, dict[tuple[int, int], int]] = {
+  GateType.AND: {(a, b): a & b for a, b in product((0, 1), repeat=2)},
+  GateType.OR: {(a, b): a | b for a, b in product((0, 1), repeat=2)},
+  GateType.XOR: {(a, b): a ^ b for a, b in product((0, 1), repeat=2)},
+}
+
+
+def garble(garbler: BinaryGarbler, gate_type: GateType) -> BinaryGarbledGate:
+  out = garbler.wire() if garbler.scheme == GarblingScheme.CLASSIC else None
+  return garbler.gate(gate_type, garbler.wire(), garbler.wire(), out)
+
+
+@mark.parametrize("scheme", list(GarblingScheme))
+@mark.parametrize("gate_type", list(TRUTH))
+def test_truth_table(scheme: GarblingScheme, gate_type: GateType) -> None:
+  garbler = BinaryGarbler(scheme=scheme)
+  # A few gates, so that the later ones hash with non-zero tweaks
+  for _ in range(3):
+    gate = garble(garbler, gate_type)
+    for (a, b), expected in TRUTH[gate_type].items():
+      label = gate.evaluate(gate.in_a.get_label(a), gate.in_b.get_label(b))
+      assert label == gate.out.get_label(expected)
+      assert label != gate.out.get_label(1 - expected)
+
+
+@mark.parametrize("scheme", [GarblingScheme.FREE_XOR, GarblingScheme.HALF_GATES])
+def test_free_xor_needs_no_table(scheme: GarblingScheme) -> None:
+  garbler = BinaryGarbler(scheme=scheme)
+  gate = garble(garbler, GateType.XOR)
+  assert gate.garbled_table == []
+  assert gate.out.label_1 == gate.out.label_0 ^ garbler.delta
+
+
+@mark.parametrize(
+  "scheme, rows",
+  [(GarblingScheme.CLASSIC, 4), (GarblingScheme.FREE_XOR, 4), (GarblingScheme.HALF_GATES, 2)],
+)
+def test_table_sizes(scheme: GarblingScheme, rows: int) -> None:
+  assert len(garble(BinaryGarbler(scheme=scheme), GateType.AND).garbled_table) == rows
+
+
+def test_batched_garbling_matches_truth_table() -> None:
+  garbler = BinaryGarbler(scheme=GarblingScheme.CLASSIC)
+  specs = [(gate_type, garbler.wire(), garbler.wire(), garbler.wire()) for gate_type in TRUTH]
+  for gate in garbler.gates(specs):
+    for (a, b), expected in TRUTH[gate.gate_type].items():
+      label = gate.evaluate(gate.in_a.get_label(a), gate.in_b.get_label(b))
+      assert label == gate.out.get_label(expected)
+
+
+@mark.parametrize("scheme", [GarblingScheme.FREE_XOR, GarblingScheme.HALF_GATES])
+def test_offset_keeps_labels_apart(scheme: GarblingScheme) -> None:
+  garbler = BinaryGarbler(scheme=scheme)
+  assert garbler.delta.permute_bit == 1
+  for gate_type in TRUTH:
+    out = garble(garbler, gate_type).out
+    assert out.label_1 == out.label_0 ^ garbler.delta
+    assert out.label_0.permute_bit != out.label_1.permute_bit
+
+
+@mark.parametrize("scheme", list(GarblingScheme))
+def test_chained_gates(scheme: GarblingScheme) -> None:
+  # (a AND b) OR (a XOR c), each gate fed by the wires of the previous ones
+  garbler = BinaryGarbler(scheme=scheme)
+  a, b, c = garbler.wire(), garbler.wire(), garbler.wire()
+  classic = scheme == GarblingScheme.CLASSIC
+  gate_and = garbler.gate(GateType.AND, a, b, garbler.wire() if classic else None)
+  gate_xor = garbler.gate(GateType.XOR, a, c, garbler.wire() if classic else None)
+  gate_or = garbler.gate(
+    GateType.OR, gate_and.out, gate_xor.out, garbler.wire() if classic else None
+  )
+  for bit_a, bit_b, bit_c in product((0, 1), repeat=3):
+    label_and = gate_and.evaluate(a.get_label(bit_a), b.get_label(bit_b))
+    label_xor = gate_xor.evaluate(a.get_label(bit_a), c.get_label(bit_c))
+    label = gate_or.evaluate(label_and, label_xor)
+    assert label == gate_or.out.get_label(bit_a & bit_b | bit_a ^ bit_c)
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+
+### Third-party packages ###
+from pytest import mark
+
+### Local modules ###
+from garbled_concept.glv import LAMBDA, endomorphism, glv_available, glv_decompose
+from garbled_concept.jacobian import AffinePoint, jacobian_mul, to_affine
+from garbled_concept.parameters import Secp256k1
+
+G: AffinePoint = (Secp256k1.G_X, Secp256k1.G_Y)
+N: int = Secp256k1.N
+
+SCALARS: tuple[int, ...] = (0, 1, 2, 0xFF, 1 << 128, LAMBDA, N - 1, N + 5)
+
+
+def test_glv_available_on_secp256k1() -> None:
+  assert glv_available()
+
+
+@mark.parametrize("k", [1, 2, 0xDEADBEEF])
+def test_endomorphism_is_multiplication_by_lambda(k: int) -> None:
+  p = to_affine(jacobian_mul(k, G))
+  assert endomorphism(p) == to_affine(jacobian_mul(LAMBDA * k, G))
+
+
+@mark.parametrize("k", SCALARS)
+def test_glv_decompose(k: int) -> None:
+  k1, k2 = glv_decompose(k)
+  assert (k1 + k2 * LAMBDA - k) % N == 0
+  assert abs(k1) < 1 << 129 and abs(k2) < 1 << 129
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+### Third-party packages ###
+from pytest import mark, raises
+
+### Local modules ###
+from garbled_concept.generators import DEFAULT_DOMAIN, clear_generators, generator, generators
+from garbled_concept.hash_to_curve import expand_message_xmd, hash_to_curve
+from garbled_concept.parameters import Secp256k1
+
+# RFC 9380, appendix J.8.1: secp256k1_XMD:SHA-256_SSWU_RO_
+SUITE_DST: bytes = b"QUUX-V01-CS02-with-secp256k1_XMD:SHA-256_SSWU_RO_"
+# RFC 9380, appendix K.1: expand_message_xmd(SHA-256)
+EXPANDER_DST: bytes = b"QUUX-V01-CS02-with-expander-SHA256-128"
+
+
+@mark.parametrize(
+  "msg, x, y",
+  [
+    (
+      b"",
+      0xC1CAE290E291AEE617EBAEF1BE6D73861479C48B841EABA9B7B5852DDFEB1346,
+      0x64FA678E07AE116126F08B022A94AF6DE15985C996C3A91B64C406A960E51067,
+    ),
+    (
+      b"abc",
+      0x3377E01EAB42DB296B512293120C6CEE72B6ECF9F9205760BD9FF11FB3CB2C4B,
+      0x7F95890F33EFEBD1044D382A01B1BEE0900FB6116F94688D487C6C7B9C8371F6,
+    ),
+  ],
+)
+def test_hash_to_curve_vectors(msg: bytes, x: int, y: int) -> None:
+  assert hash_to_curve(msg, SUITE_DST) == (x, y)
+
+
+@mark.parametrize(
+  "msg, expected",
+  [
+    (b"", "68a985b87eb6b46952128911f2a4412bbc302a9d759667f87f7a21d803f07235"),
+    (b"abc", "d8ccab23b5985ccea865c6c97b6e5b8350e794e603b4b97902f53a8a0d605615"),
+  ],
+)
+def test_expand_message_xmd_vectors(msg: bytes, expected: str) -> None:
+  assert expand_message_xmd(msg, EXPANDER_DST, 0x20).hex() == expected
+
+
+def test_hash_to_curve_lands_on_curve() -> None:
+  x, y = hash_to_curve(b"garbled-concept", SUITE_DST)
+  assert (y * y - x**3 - 7) % Secp256k1.P == 0
+
+
+def test_generators_are_distinct_and_on_curve() -> None:
+  points = generators(4)
+  assert len(set(points)) == 4
+  assert (Secp256k1.G_X, Secp256k1.G_Y) not in points
+  assert all((y * y - x**3 - 7) % Secp256k1.P == 0 for x, y in points)
+
+
+def test_generators_are_domain_separated() -> None:
+  assert generator(0, b"one domain") != generator(0, b"another domain")
+  assert generators(2, b"one domain") == [generator(0, b"one domain"), generator(1, b"one domain")]
+
+
+def test_generators_are_deterministic() -> None:
+  cached = generators(3)
+  clear_generators()
+  assert generators(3, DEFAULT_DOMAIN) == cached
+
+
+def test_generator_index_must_be_non_negative() -> None:
+  with raises(ValueError):
+    generator(-1)
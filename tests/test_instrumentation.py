@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+### Third-party packages ###
+from pytest import raises
+
+### Local modules ###
+from garbled_concept.instrumentation import (
+  counters,
+  instrument,
+  instrumented,
+  is_enabled,
+  record,
+  report,
+  reset,
+)
+from garbled_concept.jacobian import jacobian_eq, jacobian_mul
+from garbled_concept.models import ArgoWire, Point
+from garbled_concept.multi_scalar import msm
+from garbled_concept.parameters import Secp256k1
+
+G = (Secp256k1.G_X, Secp256k1.G_Y)
+
+
+@instrumented("scaled", key=lambda kind, *_: kind, items=lambda _, values, *__: len(values))
+def scaled(kind: str, values: list[int], factor: int = 2, *, offset: int = 0) -> list[int]:
+  return [value * factor + offset for value in values]
+
+
+def test_disabled_by_default() -> None:
+  reset()
+  assert not is_enabled()
+  scaled("double", [1, 2])
+  assert counters() == {}
+  assert report() == "No instrumented calls recorded"
+
+
+def test_counts_calls_and_items() -> None:
+  with instrument() as counted:
+    assert is_enabled()
+    scaled("double", [1, 2, 3])
+    scaled("double", [4])
+    scaled("triple", [5], 3)
+    record("by hand", 0.5, items=7)
+  assert not is_enabled()
+  assert (counted["scaled double"].calls, counted["scaled double"].items) == (2, 4)
+  assert (counted["scaled triple"].calls, counted["scaled triple"].items) == (1, 1)
+  assert counted["by hand"].seconds == 0.5
+  assert report(counted).splitlines()[1].startswith("by hand")
+
+
+def test_keyword_arguments() -> None:
+  with instrument() as counted:
+    assert scaled(kind="double", values=[1, 2], offset=1) == [3, 5]
+    assert scaled("triple", factor=3, values=[1]) == [3]
+    assert jacobian_eq(msm(points=[G, G], scalars=[2, 3]), jacobian_mul(5, G))
+    h_point = Point.from_affine(G)
+    wire = ArgoWire.create(1, 2, h_point)
+    wire.add(other=wire).mul_const(c=3)
+  assert counted["scaled double"].items == 2
+  assert counted["scaled triple"].items == 1
+  assert counted["msm"].items == 2
+  assert counted["gate ADD"].calls == counted["gate MUL"].calls == 1
+
+
+def test_instrumentation_does_not_swallow_errors() -> None:
+  with instrument() as counted, raises(TypeError):
+    scaled("double", [1], offset=None)
+  assert counted["scaled double"].calls == 1
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+### Standard packages ###
+from random import Random
+
+### Third-party packages ###
+from pytest import mark, raises
+
+### Local modules ###
+from garbled_concept.models import ArgoCircuit, KeyMap
+from garbled_concept.parameters import Secp256k1
+
+N: int = Secp256k1.N
+
+
+def dict_apply(forms: list[dict[int, int]], keys: list[int]) -> list[int]:
+  """Key propagation straight from the per-wire linear forms the compiled map replaces"""
+  return [sum(c * keys[i] for i, c in form.items()) % N for form in forms]
+
+
+def empty_circuit() -> ArgoCircuit:
+  return ArgoCircuit()
+
+
+def single_wire_circuit() -> ArgoCircuit:
+  circuit = ArgoCircuit()
+  circuit.output(circuit.input())
+  return circuit
+
+
+def random_circuit(seed: int = 7, n_inputs: int = 5, n_gates: int = 40) -> ArgoCircuit:
+  rng = Random(seed)
+  circuit = ArgoCircuit()
+  wires = [circuit.input() for _ in range(n_inputs)]
+  for _ in range(n_gates):
+    if rng.random() < 0.5:
+      wires.append(circuit.add(rng.choice(wires), rng.choice(wires)))
+    else:
+      wires.append(circuit.mul_const(rng.choice(wires), rng.randrange(-5, N)))
+  for wire in rng.sample(wires, 6):
+    circuit.output(wire)
+  # Cancelling terms leave an output that depends on no input at all
+  circuit.output(circuit.add(wires[0], circuit.mul_const(wires[0], -1)))
+  return circuit
+
+
+@mark.parametrize(
+  "circuit",
+  [empty_circuit(), single_wire_circuit(), random_circuit()],
+  ids=["empty", "one", "many"],
+)
+def test_apply_matches_linear_forms(circuit: ArgoCircuit) -> None:
+  key_map = KeyMap.compile(circuit)
+  forms = circuit.linear_forms()
+  assert key_map.n_outputs == len(circuit.outputs)
+  rng = Random(1)
+  for _ in range(3):
+    keys = [rng.randrange(N) for _ in circuit.inputs]
+    assert key_map.apply(keys) == dict_apply(forms, keys)
+  assert key_map.matrix() == [
+    [form.get(i, 0) for i in range(len(circuit.inputs))] for form in forms
+  ]
+
+
+@mark.parametrize(
+  "circuit",
+  [empty_circuit(), single_wire_circuit(), random_circuit()],
+  ids=["empty", "one", "many"],
+)
+def test_round_trip(circuit: ArgoCircuit) -> None:
+  key_map = KeyMap.compile(circuit)
+  restored = KeyMap.model_validate_json(key_map.model_dump_json())
+  assert restored == key_map
+  keys = list(range(1, len(circuit.inputs) + 1))
+  assert restored.apply(keys) == key_map.apply(keys)
+
+
+def test_single_wire_and_empty_maps() -> None:
+  assert KeyMap.compile(single_wire_circuit()).apply([12345]) == [12345]
+  key_map = KeyMap.compile(empty_circuit())
+  assert (key_map.n_inputs, key_map.n_outputs) == (0, 0)
+  assert key_map.apply([]) == []
+  assert key_map.matrix() == []
+
+
+def test_selected_wires() -> None:
+  circuit = random_circuit()
+  wires = [0, 3, circuit.n_wires - 1]
+  key_map = KeyMap.compile(circuit, wires)
+  keys = [11, 22, 33, 44, 55]
+  assert key_map.apply(keys) == dict_apply(circuit.linear_forms(wires), keys)
+  assert key_map.apply(keys)[:2] == [11, 44]
+
+
+def test_wrong_key_count() -> None:
+  with raises(ValueError):
+    KeyMap.compile(single_wire_circuit()).apply([1, 2])
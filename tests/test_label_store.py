@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+### Standard packages ###
+from importlib.util import find_spec
+from secrets import token_bytes
+
+### Third-party packages ###
+from pytest import mark, param, raises
+
+### Local modules ###
+from garbled_concept.models import BinaryLabel, LabelStore
+from garbled_concept.models.binary_label import xor_bytes
+from garbled_concept.models.label_store import LABEL_BYTES
+
+BACKENDS = [
+  "python",
+  param("numpy", marks=mark.skipif(find_spec("numpy") is None, reason="NumPy not installed")),
+]
+
+LABELS: list[bytes] = [bytes([i]) * LABEL_BYTES for i in range(1, 7)]
+
+
+@mark.parametrize("backend", BACKENDS)
+def test_get_set_and_round_trip(backend: str) -> None:
+  store = LabelStore.from_labels(LABELS, backend)
+  assert store.is_numpy == (backend == "numpy")
+  assert (len(store), store.nbytes) == (6, 6 * LABEL_BYTES)
+  assert [store[i] for i in range(6)] == LABELS
+  assert store[-1] == LABELS[-1]
+  store[2] = b"\xff" * LABEL_BYTES
+  assert store.to_bytes() == b"".join([*LABELS[:2], b"\xff" * LABEL_BYTES, *LABELS[3:]])
+  assert store.label(0) == BinaryLabel(label=LABELS[0])
+  with raises(IndexError):
+    store[6]
+
+
+@mark.parametrize("backend", BACKENDS)
+def test_slices_are_views(backend: str) -> None:
+  store = LabelStore.from_labels(LABELS, backend)
+  view = store[2:5]
+  assert len(view) == 3
+  assert [view[i] for i in range(3)] == LABELS[2:5]
+  view[0] = b"\xaa" * LABEL_BYTES
+  assert store[2] == b"\xaa" * LABEL_BYTES
+  with raises(ValueError):
+    store[::2]
+
+
+@mark.parametrize("backend", BACKENDS)
+def test_gather_copies(backend: str) -> None:
+  store = LabelStore.from_labels(LABELS, backend)
+  gathered = store.gather([4, 0, 4])
+  assert [gathered[i] for i in range(3)] == [LABELS[4], LABELS[0], LABELS[4]]
+  gathered[0] = bytes(LABEL_BYTES)
+  assert store[4] == LABELS[4]
+
+
+@mark.parametrize("backend", BACKENDS)
+def test_xor(backend: str) -> None:
+  store, other = LabelStore.random(6, backend=backend), LabelStore.random(6, backend=backend)
+  delta = token_bytes(LABEL_BYTES)
+  assert [store.xor(other)[i] for i in range(6)] == [
+    xor_bytes(store[i], other[i]) for i in range(6)
+  ]
+  assert [store.xor(delta)[i] for i in range(6)] == [xor_bytes(store[i], delta) for i in range(6)]
+  assert store[1:4].xor(delta)[0] == xor_bytes(store[1], delta)
+
+
+@mark.parametrize("backend", BACKENDS)
+def test_select_with_delta(backend: str) -> None:
+  store = LabelStore.random(5, backend=backend)
+  delta = BinaryLabel.random_offset().label
+  bits = [0, 1, 1, 0, 1]
+  active = store.select(bits, delta)
+  assert [active[i] for i in range(5)] == [
+    xor_bytes(store[i], delta) if bit else store[i] for i, bit in enumerate(bits)
+  ]
+  wire = store.wire(1, delta)
+  assert wire.get_label(1).label == active[1]
+
+
+@mark.parametrize("backend", BACKENDS)
+def test_permute_bits_and_classic_ones(backend: str) -> None:
+  zeros = LabelStore.random(8, backend=backend)
+  ones = LabelStore.random(8, permute_bits=zeros, backend=backend)
+  assert [int(bit) ^ 1 for bit in zeros.permute_bits()] == [int(bit) for bit in ones.permute_bits()]
+  assert [int(bit) for bit in zeros.permute_bits([3, 1])] == [zeros[3][0] & 1, zeros[1][0] & 1]
+  wire = zeros.wire(3, ones=ones)
+  assert (wire.label_0.label, wire.label_1.label) == (zeros[3], ones[3])
+
+
+@mark.parametrize("backend", BACKENDS)
+def test_xor_gates_and_grow(backend: str) -> None:
+  store = LabelStore.from_labels(LABELS, backend)
+  store.grow(2)
+  assert len(store) == 8 and store[7] == bytes(LABEL_BYTES)
+  # One layer: no gate reads another gate's output
+  store.xor_gates([0, 1], [2, 3], [6, 7])
+  assert store[6] == xor_bytes(LABELS[0], LABELS[2])
+  assert store[7] == xor_bytes(LABELS[1], LABELS[3])
+
+
+@mark.skipif(find_spec("numpy") is None, reason="NumPy not installed")
+def test_backends_agree() -> None:
+  labels = [token_bytes(LABEL_BYTES) for _ in range(9)]
+  delta, bits = token_bytes(LABEL_BYTES), [1, 0, 0, 1, 1, 0, 1, 0, 1]
+  stores = [LabelStore.from_labels(labels, backend) for backend in ("python", "numpy")]
+  results = []
+  for store in stores:
+    store.xor_gates([0, 2], [1, 3], [4, 5])
+    results.append(
+      (
+        store.to_bytes(),
+        store.gather([8, 0, 3]).to_bytes(),
+        store.xor(delta).to_bytes(),
+        store.xor(store.gather(range(8, -1, -1))).to_bytes(),
+        store.select(bits, delta).to_bytes(),
+        store[3:7].to_bytes(),
+        [int(bit) for bit in store.permute_bits()],
+      )
+    )
+  assert results[0] == results[1]
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+### Third-party packages ###
+from pytest import MonkeyPatch, importorskip, mark
+
+importorskip("numpy")
+
+### Local modules ###
+from garbled_concept.fixed_base import FixedBaseTable, register_fixed_base
+from garbled_concept.jacobian import (
+  INFINITY,
+  jacobian_add_affine,
+  jacobian_double,
+  jacobian_eq,
+  jacobian_mul,
+  to_affine,
+  to_jacobian,
+)
+from garbled_concept.limbs import (
+  FieldN,
+  FieldP,
+  LimbField,
+  batch_fixed_base_mul,
+  batch_from_limbs,
+  batch_jacobian_add_affine,
+  from_limbs,
+  to_limbs,
+)
+from garbled_concept.models.m_a_c import mac_tags
+from garbled_concept.parameters import Secp256k1, Tuning
+
+G = (Secp256k1.G_X, Secp256k1.G_Y)
+
+
+def edge_values(modulus: int) -> list[int]:
+  """Values around the carries and the modulus, plus a few spread out in between"""
+  spread = [(i * 0x9E3779B97F4A7C15F39CC0605CEDC834 + 7) % modulus for i in range(12)]
+  return [0, 1, 2, (1 << 32) - 1, 1 << 32, (1 << 255) - 1, modulus - 2, modulus - 1, *spread]
+
+
+def test_limb_round_trip() -> None:
+  values = [0, 1, (1 << 256) - 1, 1 << 224, 0xDEADBEEF << 100]
+  assert from_limbs(to_limbs(values)) == values
+
+
+@mark.parametrize("field", [FieldP, FieldN], ids=["P", "N"])
+def test_field_operations_match_ints(field: LimbField) -> None:
+  m = field.modulus
+  values = edge_values(m)
+  a = [x for x in values for _ in values]
+  b = [y for _ in values for y in values]
+  la, lb = to_limbs(a), to_limbs(b)
+  assert from_limbs(field.add(la, lb)) == [(x + y) % m for x, y in zip(a, b)]
+  assert from_limbs(field.sub(la, lb)) == [(x - y) % m for x, y in zip(a, b)]
+  assert from_limbs(field.mul(la, lb)) == [x * y % m for x, y in zip(a, b)]
+  assert from_limbs(field.square(la)) == [x * x % m for x in a]
+  assert from_limbs(field.neg(la)) == [-x % m for x in a]
+  assert from_limbs(field.mul_small(la, 977)) == [x * 977 % m for x in a]
+  assert list(field.is_zero(la)) == [x == 0 for x in a]
+
+
+def test_batch_add_affine_exceptional_lanes() -> None:
+  p = jacobian_mul(5, G)
+  x5, y5 = to_affine(p)
+  lanes = [
+    (jacobian_mul(3, G), to_affine(jacobian_mul(4, G))),  # generic
+    (to_jacobian(x5, y5), (x5, y5)),  # doubling
+    (to_jacobian(x5, y5), (x5, -y5 % Secp256k1.P)),  # P + (-P)
+    (INFINITY, G),  # infinity + G
+  ]
+  x1, y1, z1 = (to_limbs([lane[0][i] for lane in lanes]) for i in range(3))
+  x2, y2 = (to_limbs([lane[1][i] for lane in lanes]) for i in range(2))
+  result = batch_from_limbs(*batch_jacobian_add_affine(x1, y1, z1, x2, y2))
+  expected = [jacobian_mul(7, G), jacobian_double(p), INFINITY, to_jacobian(*G)]
+  assert all(jacobian_eq(got, want) for got, want in zip(result, expected))
+
+
+def test_batch_fixed_base_mul_matches_double_and_add() -> None:
+  h = to_affine(jacobian_mul(11, G))
+  g_table, h_table = FixedBaseTable(G, 4), FixedBaseTable(h, 5)
+  keys = [0, 1, Secp256k1.N - 1, 1 << 200, 0x1234567890ABCDEF]
+  values = [3, 0, 1 << 100, Secp256k1.N + 1, 42]
+  result = batch_fixed_base_mul([(g_table, keys), (h_table, values)])
+  for got, key, value in zip(result, keys, values):
+    want = jacobian_mul((key + 11 * value) % Secp256k1.N, G)
+    assert jacobian_eq(got, want)
+
+
+def test_numpy_mac_tags_match_python_backend(monkeypatch: MonkeyPatch) -> None:
+  h = to_affine(jacobian_mul(13, G))
+  register_fixed_base(h)
+  keys = [0, 1, 2, Secp256k1.N - 1, 1 << 255, 0xC0FFEE]
+  values = [5, Secp256k1.N - 1, 0, 1 << 130, 7, 0xC0FFEE]
+  monkeypatch.setattr(Tuning, "BATCH_BACKEND", "python")
+  expected = mac_tags(keys, values, h)
+  monkeypatch.setattr(Tuning, "BATCH_BACKEND", "numpy")
+  result = mac_tags(keys, values, h)
+  assert all(jacobian_eq(got, want) for got, want in zip(result, expected, strict=True))
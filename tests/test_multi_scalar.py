@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+### Third-party packages ###
+from pytest import mark, raises
+
+### Local modules ###
+from garbled_concept.jacobian import (
+  INFINITY,
+  AffinePoint,
+  JacobianPoint,
+  jacobian_add,
+  jacobian_eq,
+  jacobian_mul,
+  to_affine,
+  to_jacobian,
+)
+from garbled_concept.models import ArgoWire, Point
+from garbled_concept.multi_scalar import (
+  STRAUS_THRESHOLD,
+  joint_sparse_form,
+  msm,
+  msm_many,
+  shamir_mul,
+)
+from garbled_concept.parameters import Secp256k1
+
+G: AffinePoint = (Secp256k1.G_X, Secp256k1.G_Y)
+N: int = Secp256k1.N
+
+
+def multiples(n: int) -> list[AffinePoint]:
+  """G, 2G, ..., nG as affine points"""
+  return [to_affine(jacobian_mul(i, G)) for i in range(1, n + 1)]
+
+
+def naive_msm(scalars: list[int], points: list[AffinePoint | None]) -> JacobianPoint:
+  result = INFINITY
+  for k, p in zip(scalars, points):
+    if p is not None:
+      result = jacobian_add(result, jacobian_mul(k % N, p))
+  return result
+
+
+@mark.parametrize("k0, k1", [(0, 1), (1, 0), (7, 5), (0xFFFF, 0x10001), (N - 1, N - 2)])
+def test_joint_sparse_form(k0: int, k1: int) -> None:
+  digits = joint_sparse_form(k0, k1)
+  assert sum(d0 << i for i, (d0, _) in enumerate(reversed(digits))) == k0
+  assert sum(d1 << i for i, (_, d1) in enumerate(reversed(digits))) == k1
+  # Of any three consecutive columns, at least one is zero in both rows
+  columns = [d0 != 0 or d1 != 0 for d0, d1 in digits]
+  assert not any(all(columns[i : i + 3]) for i in range(len(columns) - 2))
+
+
+@mark.parametrize("k0, k1", [(0, 3), (3, 0), (12345, 67890), (N - 1, 1 << 200)])
+def test_shamir_mul_matches_naive(k0: int, k1: int) -> None:
+  h = multiples(3)[2]
+  assert jacobian_eq(shamir_mul(k0, G, k1, h), naive_msm([k0, k1], [G, h]))
+
+
+def test_wire_mac_without_fixed_base_table() -> None:
+  # 3G has no fixed-base table, so tags are computed and verified through Shamir's trick
+  h_point = Point.from_affine(multiples(3)[2])
+  wire = ArgoWire.create(value=42, key=1234, h_point=h_point)
+  assert jacobian_eq(naive_msm([1234, 42], [G, h_point.affine]), to_jacobian(*wire.mac.tag.affine))
+  assert wire.verify(1234)
+  assert not wire.verify(1235)
+
+
+def test_msm_empty() -> None:
+  assert jacobian_eq(msm([], []), INFINITY)
+
+
+def test_msm_length_mismatch() -> None:
+  with raises(ValueError):
+    msm([1, 2], [G])
+
+
+def test_msm_zero_scalars_and_infinity() -> None:
+  points = multiples(3)
+  assert jacobian_eq(msm([0, N, 2 * N], points), INFINITY)
+  assert jacobian_eq(msm([5, 7], [None, None]), INFINITY)
+  assert jacobian_eq(msm([5, 0, 7], [None, points[0], points[1]]), jacobian_mul(14, G))
+
+
+def test_msm_negative_and_unreduced_scalars() -> None:
+  points = multiples(3)
+  scalars = [-1, N + 3, -(N + 2)]
+  assert jacobian_eq(msm(scalars, points), naive_msm(scalars, points))
+
+
+def test_msm_cancelling_terms() -> None:
+  assert jacobian_eq(msm([5, N - 5], [G, G]), INFINITY)
+
+
+def test_msm_duplicate_points() -> None:
+  points = [G, G, G]
+  assert jacobian_eq(msm([1, 2, 3], points), jacobian_mul(6, G))
+
+
+def test_msm_straus_and_pippenger() -> None:
+  for n in (STRAUS_THRESHOLD - 1, STRAUS_THRESHOLD + 1):
+    points = multiples(n)
+    scalars = [(i * 0x9E3779B97F4A7C15 + 1) % N for i in range(n)]
+    assert jacobian_eq(msm(scalars, points), naive_msm(scalars, points))
+
+
+def test_linear_combination_matches_chained_gates() -> None:
+  h_point = Point.from_affine(multiples(3)[2])
+  keys, values, coeffs = [11, 22, 33], [5, N - 1, 1 << 200], [3, -2, N + 7]
+  wires = [ArgoWire.create(value, key, h_point) for value, key in zip(values, keys)]
+  combined = ArgoWire.linear_combination(wires, coeffs)
+  chained = wires[0].mul_const(coeffs[0])
+  for wire, c in zip(wires[1:], coeffs[1:]):
+    chained = chained.add(wire.mul_const(c))
+  assert combined.value == chained.value
+  assert combined.mac.tag == chained.mac.tag
+  assert combined.verify(sum(c * key for c, key in zip(coeffs, keys)) % N)
+
+
+def test_linear_combination_rejects_bad_arguments() -> None:
+  wire = ArgoWire.create(1, 2, Point.from_affine(multiples(3)[2]))
+  with raises(ValueError):
+    ArgoWire.linear_combination([], [])
+  with raises(ValueError):
+    ArgoWire.linear_combination([wire], [1, 2])
+
+
+def test_msm_many_matches_msm() -> None:
+  points: list[AffinePoint | None] = [*multiples(STRAUS_THRESHOLD + 2), None]
+  rows = [
+    {0: 5, 3: N - 1, 7: 1 << 200},
+    {},
+    {len(points) - 1: 9},
+    {3: N},
+    {i: i * 0x9E3779B97F4A7C15 + 1 for i in range(len(points))},
+    {7: -3, 0: 2},
+  ]
+  expected = [msm(list(row.values()), [points[i] for i in row]) for row in rows]
+  result = msm_many(rows, points)
+  assert all(jacobian_eq(got, want) for got, want in zip(result, expected, strict=True))
+  assert msm_many([], points) == []
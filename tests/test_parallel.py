@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+### Standard packages ###
+from itertools import product
+
+### Local modules ###
+from garbled_concept.models import ArgoWire, BinaryGarbler, GarblingScheme, GateType, Point
+from garbled_concept.parallel import ParallelGarbler
+from garbled_concept.parameters import Secp256k1
+
+TRUTH: dict[GateType, dict[tuple[int, int], int]] = {
+  GateType.AND: {(a, b): a & b for a, b in product((0, 1), repeat=2)},
+  GateType.OR: {(a, b): a | b for a, b in product((0, 1), repeat=2)},
+  GateType.XOR: {(a, b): a ^ b for a, b in product((0, 1), repeat=2)},
+}
+
+
+def test_garble_gates_across_workers_and_calls() -> None:
+  serial = BinaryGarbler(scheme=GarblingScheme.CLASSIC)
+  gate_types = list(TRUTH) * 4
+  specs = [(gate_type, serial.wire(), serial.wire(), serial.wire()) for gate_type in gate_types]
+  with ParallelGarbler(workers=2, chunk_size=3) as pool:
+    gates = pool.garble_gates(specs[:7]) + pool.garble_gates(specs[7:])
+    assert pool.n_gates == len(specs)
+    restarted = pool.garble_gates(specs[:2], first_index=0)
+  # Gate numbering continues across calls, so every gate hashes with its own tweak
+  assert [gate.index for gate in gates] == list(range(len(specs)))
+  assert [gate.index for gate in restarted] == [0, 1]
+  expected = serial.gates(specs)
+  assert [gate.garbled_table for gate in gates] == [gate.garbled_table for gate in expected]
+  for gate in gates:
+    for (a, b), bit in TRUTH[gate.gate_type].items():
+      label = gate.evaluate(gate.in_a.get_label(a), gate.in_b.get_label(b))
+      assert label == gate.out.get_label(bit)
+
+
+def test_create_wires_matches_serial() -> None:
+  h_point = Point.from_affine((Secp256k1.G_X, Secp256k1.G_Y))
+  values, keys = list(range(10)), [3 * i + 1 for i in range(10)]
+  with ParallelGarbler(workers=2, chunk_size=4) as pool:
+    wires = pool.create_wires(values, keys, h_point)
+  assert wires == ArgoWire.create_many(values, keys, h_point)
+  assert ArgoWire.verify_batch(wires, keys) == []
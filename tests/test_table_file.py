@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+### Standard packages ###
+from pathlib import Path
+from secrets import token_bytes
+
+### Third-party packages ###
+from pytest import mark, raises
+
+### Local modules ###
+from garbled_concept.models import GarblingScheme
+from garbled_concept.table_file import ROWS_PER_RECORD, GarbledTableReader, GarbledTableWriter
+
+
+@mark.parametrize("scheme", list(GarblingScheme))
+def test_write_read_round_trip(tmp_path: Path, scheme: GarblingScheme) -> None:
+  rows = ROWS_PER_RECORD[scheme]
+  tables = [[token_bytes(16) for _ in range(rows)] for _ in range(5)]
+  path = tmp_path / "tables.gct"
+  with GarbledTableWriter(path, scheme) as writer:
+    writer.write_all([tables[0], [], *tables[1:], [token_bytes(16)]])
+  with GarbledTableReader(path) as reader:
+    assert reader.scheme == scheme
+    assert len(reader) == 6
+    records = [[bytes(row) for row in table] for table in reader.tables()]
+  assert records[:5] == tables
+  assert records[5][1:] == [bytes(16)] * (rows - 1)
+
+
+def test_close_with_live_views(tmp_path: Path) -> None:
+  path = tmp_path / "tables.gct"
+  with GarbledTableWriter(path, GarblingScheme.HALF_GATES) as writer:
+    writer.write([b"\x01" * 16, b"\x02" * 16])
+  with GarbledTableReader(path) as reader:
+    record = reader.record(0)
+    row = bytes(record[1])
+    tables = reader.tables()
+    first = next(tables)
+  assert row == b"\x02" * 16
+  # Closing releases the views handed out instead of leaving the mapping alive behind them
+  for view in (record[0], first[1]):
+    with raises(ValueError):
+      bytes(view)
+  assert reader.mmap.closed
+
+
+def test_tables_release_previous_record(tmp_path: Path) -> None:
+  path = tmp_path / "tables.gct"
+  with GarbledTableWriter(path, GarblingScheme.HALF_GATES) as writer:
+    writer.write_all([[bytes([i]) * 16] * 2 for i in range(3)])
+  with GarbledTableReader(path) as reader:
+    tables = reader.tables()
+    first = next(tables)
+    second = next(tables)
+    assert bytes(second[0]) == b"\x01" * 16
+    with raises(ValueError):
+      bytes(first[0])
+
+
+def test_writer_without_context_manager(tmp_path: Path) -> None:
+  path = tmp_path / "tables.gct"
+  writer = GarbledTableWriter(path, GarblingScheme.HALF_GATES)
+  writer.write([b"\x03" * 16])
+  writer.close()
+  writer.close()
+  with raises(ValueError):
+    writer.write([b"\x04" * 16])
+  with GarbledTableReader(path) as reader:
+    assert len(reader) == 1
+    assert bytes(reader.record(0)[0]) == b"\x03" * 16
+
+
+def test_truncated_file(tmp_path: Path) -> None:
+  path = tmp_path / "tables.gct"
+  with GarbledTableWriter(path, GarblingScheme.CLASSIC) as writer:
+    writer.write([bytes(16)] * 4)
+  path.write_bytes(path.read_bytes()[:-1])
+  with raises(ValueError):
+    GarbledTableReader(path)
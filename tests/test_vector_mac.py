@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+### Third-party packages ###
+from pytest import raises
+
+### Local modules ###
+from garbled_concept.generators import generators
+from garbled_concept.jacobian import (
+  AffinePoint,
+  jacobian_add,
+  jacobian_eq,
+  jacobian_mul,
+  to_jacobian,
+)
+from garbled_concept.models import VectorMAC
+from garbled_concept.parameters import Secp256k1
+
+G: AffinePoint = (Secp256k1.G_X, Secp256k1.G_Y)
+N: int = Secp256k1.N
+
+KEY: int = 0x1234567890ABCDEF
+VALUES: list[int] = [3, 0, N - 1, 1 << 200]
+
+
+def test_tag_is_key_times_g_plus_weighted_generators() -> None:
+  mac = VectorMAC.create(KEY, VALUES)
+  expected = jacobian_mul(KEY, G)
+  for value, h in zip(VALUES, generators(len(VALUES))):
+    expected = jacobian_add(expected, jacobian_mul(value, h))
+  assert mac.width == len(VALUES)
+  assert jacobian_eq(to_jacobian(*mac.tag.affine), expected)
+
+
+def test_verify() -> None:
+  mac = VectorMAC.create(KEY, VALUES)
+  assert mac.verify(KEY, VALUES)
+  assert not mac.verify(KEY + 1, VALUES)
+  assert not mac.verify(KEY, [*VALUES[:-1], VALUES[-1] + 1])
+  assert not mac.verify(KEY, VALUES[:-1])
+  # Swapping two values changes the generators they are weighted by
+  assert not mac.verify(KEY, [VALUES[1], VALUES[0], *VALUES[2:]])
+
+
+def test_empty_vector() -> None:
+  mac = VectorMAC.create(KEY, [])
+  assert mac.verify(KEY, [])
+  assert jacobian_eq(to_jacobian(*mac.tag.affine), jacobian_mul(KEY, G))
+
+
+def test_homomorphism() -> None:
+  other_key, other_values = 99, [5, 6, 7, 8]
+  mac, other = VectorMAC.create(KEY, VALUES), VectorMAC.create(other_key, other_values)
+  total = mac.add(other)
+  assert total.verify(KEY + other_key, [v + w for v, w in zip(VALUES, other_values)])
+  assert mac.scalar_mul(3).verify(3 * KEY, [3 * v for v in VALUES])
+  combined = VectorMAC.linear_combination([mac, other], [2, -1])
+  assert combined.verify(2 * KEY - other_key, [2 * v - w for v, w in zip(VALUES, other_values)])
+
+
+def test_create_many_matches_create() -> None:
+  keys, vectors = [1, 2, 3], [[1], [2, 3], []]
+  macs = VectorMAC.create_many(keys, vectors)
+  assert macs == [VectorMAC.create(key, values) for key, values in zip(keys, vectors)]
+  with raises(ValueError):
+    VectorMAC.create_many([1], [])
+
+
+def test_domains_are_independent() -> None:
+  mac = VectorMAC.create(KEY, VALUES, domain=b"other")
+  assert mac.verify(KEY, VALUES)
+  assert mac.tag != VectorMAC.create(KEY, VALUES).tag
+
+
+def test_incompatible_vectors() -> None:
+  mac = VectorMAC.create(KEY, VALUES)
+  with raises(ValueError):
+    mac.add(VectorMAC.create(KEY, VALUES[:-1]))
+  with raises(ValueError):
+    mac.add(VectorMAC.create(KEY, VALUES, domain=b"other"))
+  with raises(ValueError):
+    VectorMAC.linear_combination([mac, VectorMAC.create(KEY, VALUES[:-1])], [1, 1])
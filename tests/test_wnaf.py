@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+### Standard packages ###
+from collections.abc import Iterator
+from itertools import pairwise
+
+### Third-party packages ###
+from pytest import fixture, mark
+
+### Local modules ###
+from garbled_concept.jacobian import INFINITY, AffinePoint, JacobianPoint, jacobian_eq
+from garbled_concept.models import Point
+from garbled_concept.models.m_a_c import point_add
+from garbled_concept.parameters import Secp256k1, Tuning
+from garbled_concept.wnaf import configure_table_cache, table_cache_stats, wnaf, wnaf_mul
+
+G: AffinePoint = (Secp256k1.G_X, Secp256k1.G_Y)
+N: int = Secp256k1.N
+
+SCALARS: tuple[int, ...] = (
+  1,
+  2,
+  3,
+  0xFF,
+  1 << 128,
+  0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72,
+  N - 1,
+  N + 5,
+)
+
+
+@fixture
+def table_cache() -> Iterator[None]:
+  """A two-entry table cache, restored to the configured size afterwards"""
+  configure_table_cache(2)
+  yield
+  configure_table_cache(Tuning.WNAF_CACHE_SIZE)
+
+
+def naive_mul(k: int, p: AffinePoint) -> Point:
+  """Affine double-and-add with the textbook formulas, as the reference"""
+  result, addend = Point.infinity(), Point.from_affine(p)
+  k %= N
+  while k:
+    if k & 1:
+      result = point_add(result, addend)
+    addend = point_add(addend, addend)
+    k >>= 1
+  return result
+
+
+def to_jacobian_point(p: Point) -> JacobianPoint:
+  return INFINITY if p.is_infinity else (p.x, p.y, 1)
+
+
+def assert_same(p: JacobianPoint, expected: Point) -> None:
+  assert jacobian_eq(p, to_jacobian_point(expected))
+
+
+@mark.parametrize("k", SCALARS)
+@mark.parametrize("width", [2, 4, 5, 8])
+def test_wnaf_mul_matches_naive(k: int, width: int) -> None:
+  assert_same(wnaf_mul(k, G, width), naive_mul(k, G))
+
+
+@mark.parametrize("k", SCALARS)
+def test_wnaf_digits(k: int) -> None:
+  width = 5
+  digits = wnaf(k, width)
+  assert sum(digit << i for i, digit in enumerate(digits)) == k
+  nonzero = [i for i, digit in enumerate(digits) if digit]
+  assert all(digits[i] % 2 and abs(digits[i]) < 1 << (width - 1) for i in nonzero)
+  assert all(j - i >= width for i, j in pairwise(nonzero))
+
+
+def test_table_cache_hits_repeated_base(table_cache: None) -> None:
+  assert_same(wnaf_mul(7, G), naive_mul(7, G))
+  assert_same(wnaf_mul(9, G), naive_mul(9, G))
+  stats = table_cache_stats()
+  assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+  assert stats.hit_rate == 0.5
+
+
+def test_table_cache_evicts_least_recently_used(table_cache: None) -> None:
+  bases = [(p.x, p.y) for p in (naive_mul(k, G) for k in (2, 3, 4))]
+  wnaf_mul(5, bases[0])
+  wnaf_mul(5, bases[1])
+  wnaf_mul(5, bases[0])  # bases[1] is now the least recently used
+  wnaf_mul(5, bases[2])
+  stats = table_cache_stats()
+  assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 3, 1, 2)
+  wnaf_mul(5, bases[0])
+  wnaf_mul(5, bases[1])
+  stats = table_cache_stats()
+  assert (stats.hits, stats.misses, stats.size, stats.max_entries) == (2, 4, 2, 2)
+
+
+def test_table_cache_disabled(table_cache: None) -> None:
+  configure_table_cache(0)
+  wnaf_mul(5, G)
+  wnaf_mul(5, G)
+  stats = table_cache_stats()
+  assert (stats.hits, stats.misses, stats.size) == (0, 0, 0)